@@ -4,6 +4,9 @@ import argparse
 import glob
 import os.path
 import sys
+import time
+
+import numpy as np
 
 import dito
 
@@ -13,11 +16,34 @@ def get_args():
     parser.add_argument("-d", "--debug", action="store_true", help="If set, show full stack trace for errors.")
     parser.add_argument("-s", "--keep-singleton-dimensions", action="store_true", help="If set, keep dimensions in the final NumPy array even if their size is 1.")
     parser.add_argument("-a", "--keep-all-dimensions", action="store_true", help="If set, the final NumPy array will have all dimensions that are possible for CZI files.")
+    parser.add_argument("-p", "--process-count", type=int, default=None, help="Number of files to convert concurrently (one process per file). If not set, the number of CPU cores is used.")
+    parser.add_argument("-w", "--worker-count", type=int, default=1, help="Number of threads per file used to read image planes concurrently.")
     parser.add_argument("image_filenames", type=str, nargs="+", help="Input image filenames. Patterns are allowed.")
     args = parser.parse_args()
     return args
 
 
+def convert_file(filename_czi, keep_singleton_dimensions, keep_all_dimensions, worker_count):
+    """
+    Convert a single CZI file into a "*.npy" file and return the number of planes and bytes written.
+
+    The output array is written plane by plane into a memory-mapped "*.npy" file, such that only a few planes (and
+    never the full image) are held in memory at the same time.
+    """
+    filename_npy = os.path.splitext(filename_czi)[0] + ".npy"
+    with dito.LazyCziArray(filename=filename_czi, keep_singleton_dimensions=keep_singleton_dimensions, keep_all_dimensions=keep_all_dimensions, worker_count=worker_count) as czi_array:
+        image_npy = np.lib.format.open_memmap(filename_npy, mode="w+", dtype=czi_array.dtype, shape=czi_array.shape)
+        try:
+            plane_count = 0
+            for (indices, plane) in czi_array.iter_planes():
+                image_npy[indices] = plane
+                plane_count += 1
+            image_npy.flush()
+        finally:
+            del image_npy
+        return (plane_count, czi_array.nbytes)
+
+
 def main(args):
     if args.image_filenames is None:
         raise ValueError("No image filenames specified")
@@ -31,24 +57,32 @@ def main(args):
     if file_count == 0:
         raise FileNotFoundError("Found no images with the filenames(s) {}".format(args.image_filenames))
 
+    # check if all extensions are '.czi' before converting anything
     for filename_czi in filenames:
-        # check if extension is '.czi'
-        filename_split = os.path.splitext(filename_czi)
-        if filename_split[1].lower() != ".czi":
+        if os.path.splitext(filename_czi)[1].lower() != ".czi":
             raise RuntimeError("File '{}' does not end on '.czi'".format(filename_czi))
 
-        # load image from CZI
-        image = dito.load(
-            filename_czi,
-            czi_kwargs={
-                "keep_singleton_dimensions": args.keep_singleton_dimensions,
-                "keep_all_dimensions": args.keep_all_dimensions,
-            },
-        )
-
-        # save image as NumPy array
-        filename_npy = filename_split[0] + ".npy"
-        dito.save(filename_npy, image)
+    argss = [(filename_czi, args.keep_singleton_dimensions, args.keep_all_dimensions, args.worker_count) for filename_czi in filenames]
+
+    time_start = time.time()
+    if (file_count == 1) or (args.process_count == 1):
+        # no need to start additional processes
+        results = [convert_file(*args_) for args_ in argss]
+    else:
+        results = dito.parallel.mp_starmap(func=convert_file, argss=argss, process_count=args.process_count)
+    duration = max(time.time() - time_start, 1e-9)
+
+    # report throughput
+    plane_count = sum(result[0] for result in results)
+    byte_count = sum(result[1] for result in results)
+    print("Converted {} file(s) with {} plane(s) ({}) in {:.2f} s ({:.2f} MB/s, {:.2f} planes/s)".format(
+        file_count,
+        plane_count,
+        dito.human_bytes(byte_count),
+        duration,
+        byte_count / duration / 1e6,
+        plane_count / duration,
+    ))
 
 
 if __name__ == "__main__":
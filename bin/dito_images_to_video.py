@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import glob
+import os
 import os.path
 import sys
+import time
 
 import dito
 
@@ -16,10 +19,39 @@ def get_args():
     parser.add_argument("-f", "--fps", type=float, default=30.0, help="Frames per second the output video should have.")
     parser.add_argument("-g", "--gray", action="store_true", help="If set, create a gray scale video. Otherwise, a color video will be created.")
     parser.add_argument("-i", "--input-filenames", type=str, nargs="+", default=["*.png"], help="Input image filenames. Patterns are allowed.")
+    resize_group = parser.add_mutually_exclusive_group()
+    resize_group.add_argument("-r", "--resize", type=int, nargs=2, metavar=("WIDTH", "HEIGHT"), default=None, help="If set, resize all frames to the given size.")
+    resize_group.add_argument("-s", "--scale", type=float, default=None, help="If set, scale all frames by the given factor.")
+    parser.add_argument("-w", "--worker-count", type=int, default=None, help="Number of threads used to load the images. If not set, the number of CPU cores is used.")
+    parser.add_argument("-p", "--prefetch-count", type=int, default=None, help="Maximum number of images which are loaded ahead of the encoder. If not set, four times the number of workers is used.")
     args = parser.parse_args()
     return args
 
 
+def prepare_frame(image, gray, scale_or_size):
+    """
+    Prepare a single loaded frame.
+
+    This is run by the worker threads of `dito.load_multiple_prefetch_iter`, such that color conversion and resizing
+    do not block the encoder.
+    """
+    if gray:
+        image = dito.as_gray(image=image)
+    else:
+        image = dito.as_color(image=image)
+    if scale_or_size is not None:
+        image = dito.resize(image=image, scale_or_size=scale_or_size)
+    return image
+
+
+def print_progress(n_frame, frame_count, time_start, end="\r"):
+    """
+    Print a single, self-overwriting progress line.
+    """
+    duration = max(time.time() - time_start, 1e-9)
+    print("[{}/{}]  {:.1f}%  {:.1f} frames/s".format(n_frame, frame_count, 100.0 * n_frame / frame_count, n_frame / duration), end=end, flush=True)
+
+
 def main():
     args = get_args()
 
@@ -32,13 +64,55 @@ def main():
         raise FileNotFoundError("Found no images with the filenames(s) {}".format(args.input_filenames))
     print("Found {} image(s)".format(file_count))
 
+    if args.resize is not None:
+        scale_or_size = tuple(args.resize)
+    else:
+        scale_or_size = args.scale
+
+    worker_count = args.worker_count if (args.worker_count is not None) else (os.cpu_count() or 1)
+    prefetch_count = args.prefetch_count if (args.prefetch_count is not None) else (4 * worker_count)
+    if (worker_count < 1) or (prefetch_count < 1):
+        raise ValueError("Worker count and prefetch count must be at least 1")
+
     print("Saving video '{}'...".format(args.output_filename))
+    decode_wait_duration = 0.0
+    encode_duration = 0.0
+    time_start = time.time()
+    time_last_progress = 0.0
+    n_frame = 0
+    frames = dito.load_multiple_prefetch_iter(filenames=filenames, worker_count=worker_count, prefetch_count=prefetch_count, transform=functools.partial(prepare_frame, gray=args.gray, scale_or_size=scale_or_size))
     with dito.VideoSaver(filename=args.output_filename, codec=args.codec, fps=args.fps, color=not args.gray) as saver:
-        for (n_file, filename) in enumerate(filenames):
-            print("[{}/{}]  {}".format(n_file + 1, file_count, filename))
-            image = dito.load(filename=filename)
-            saver.append(image)
+        try:
+            while True:
+                # wait for the next frame (in order) - the workers keep loading the following frames in the meantime
+                time_wait_start = time.time()
+                image = next(frames, None)
+                decode_wait_duration += time.time() - time_wait_start
+                if image is None:
+                    break
+
+                time_encode_start = time.time()
+                saver.append(image)
+                encode_duration += time.time() - time_encode_start
+
+                n_frame += 1
+                if time.time() - time_last_progress >= 0.5:
+                    print_progress(n_frame=n_frame, frame_count=file_count, time_start=time_start)
+                    time_last_progress = time.time()
+        finally:
+            # stop the workers (also if an error occurred)
+            frames.close()
+    print_progress(n_frame=n_frame, frame_count=file_count, time_start=time_start, end="\n")
+    duration = max(time.time() - time_start, 1e-9)
+
     saver.print_summary()
+    dito.ptable(rows=[
+        ["Timing", ""],
+        ["..Total", "{:.2f} s".format(duration)],
+        ["..Frames/s", "{:.2f}".format(n_frame / duration)],
+        ["..Decode (waiting)", "{:.2f} s (using {} worker(s))".format(decode_wait_duration, worker_count)],
+        ["..Encode", "{:.2f} s".format(encode_duration)],
+    ])
 
 
 if __name__ == "__main__":
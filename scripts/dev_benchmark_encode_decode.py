@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+import time
+
+import dito
+
+
+def get_args():
+    parser = argparse.ArgumentParser(description="Compare the runtime of 'dito.encode_many'/'dito.decode_many' with serial loops over 'dito.encode'/'dito.decode'.", formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument("-d", "--debug", action="store_true", help="If set, show full stack trace for errors.")
+    parser.add_argument("-n", "--image-count", type=int, default=64, help="Number of images to encode/decode.")
+    parser.add_argument("-s", "--size", type=int, nargs=2, metavar=("WIDTH", "HEIGHT"), default=(320, 240), help="Size of the images.")
+    parser.add_argument("-e", "--extension", type=str, default="jpg", help="Image format to use.")
+    parser.add_argument("-w", "--worker-count", type=int, default=None, help="Number of threads used by 'encode_many'/'decode_many'. If not set, the number of CPU cores is used.")
+    parser.add_argument("-r", "--repeat-count", type=int, default=5, help="Number of repetitions (the best run is reported).")
+    args = parser.parse_args()
+    return args
+
+
+def best_duration(func, repeat_count):
+    durations = []
+    for _ in range(repeat_count):
+        time_start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - time_start)
+    return min(durations)
+
+
+def main():
+    args = get_args()
+
+    images = [dito.random_image(size=tuple(args.size)) for _ in range(args.image_count)]
+    bs = dito.encode_many(images=images, extension=args.extension)
+
+    benchmarks = [
+        ["encode (serial)", lambda: [dito.encode(image=image, extension=args.extension) for image in images]],
+        ["encode_many", lambda: dito.encode_many(images=images, extension=args.extension, worker_count=args.worker_count)],
+        ["decode (serial)", lambda: [dito.decode(b=b) for b in bs]],
+        ["decode_many", lambda: dito.decode_many(bs=bs, worker_count=args.worker_count)],
+    ]
+
+    rows = [["Benchmark", "Time per batch", "Images/s"]]
+    for (name, func) in benchmarks:
+        duration = best_duration(func=func, repeat_count=args.repeat_count)
+        rows.append([name, "{:.2f} ms".format(1000.0 * duration), "{:.1f}".format(args.image_count / duration)])
+    print("{} image(s) of size {}, format '{}'".format(args.image_count, tuple(args.size), args.extension))
+    dito.ptable(rows=rows, ftable_kwargs={"first_row_is_header": True})
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        args = get_args()
+        if args.debug:
+            raise
+        else:
+            print("ERROR: {} ({})".format(e, type(e).__name__))
+            sys.exit(1)
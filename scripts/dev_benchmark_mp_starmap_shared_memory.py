@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import dito
+
+
+def get_args():
+    parser = argparse.ArgumentParser(description="Compare the runtime of 'dito.mp_starmap' with pickled vs. shared-memory transfer of images.", formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument("-d", "--debug", action="store_true", help="If set, show full stack trace for errors.")
+    parser.add_argument("-n", "--image-count", type=int, default=16, help="Number of images per size.")
+    parser.add_argument("-s", "--sizes", type=str, nargs="+", default=["640x480", "1920x1080", "3840x2160"], help="Image sizes to benchmark (format 'WIDTHxHEIGHT').")
+    parser.add_argument("-p", "--process-count", type=int, default=None, help="Number of processes used by 'mp_starmap'. If not set, the number of CPU cores is used.")
+    parser.add_argument("-r", "--repeat-count", type=int, default=3, help="Number of repetitions (the best run is reported).")
+    args = parser.parse_args()
+    return args
+
+
+def best_duration(func, repeat_count):
+    durations = []
+    for _ in range(repeat_count):
+        time_start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - time_start)
+    return min(durations)
+
+
+def invert(image):
+    # cheap per-image work, such that the transfer of the images dominates the runtime
+    return 255 - image
+
+
+def main():
+    args = get_args()
+
+    rows = [["Size", "Image size", "Pickled", "Shared memory", "Speedup"]]
+    for size_str in args.sizes:
+        size = tuple(int(value) for value in size_str.split("x"))
+        argss = [(dito.random_image(size=size),) for _ in range(args.image_count)]
+
+        duration_pickled = best_duration(func=lambda: dito.mp_starmap(func=invert, argss=argss, process_count=args.process_count), repeat_count=args.repeat_count)
+        duration_shared_memory = best_duration(func=lambda: dito.mp_starmap(func=invert, argss=argss, process_count=args.process_count, shared_memory=True), repeat_count=args.repeat_count)
+
+        rows.append([
+            size_str,
+            dito.human_bytes(byte_count=argss[0][0].nbytes),
+            "{:.2f} ms".format(1000.0 * duration_pickled),
+            "{:.2f} ms".format(1000.0 * duration_shared_memory),
+            "{:.2f}x".format(duration_pickled / duration_shared_memory),
+        ])
+    print("{} image(s) per size (time per batch, including pool startup)".format(args.image_count))
+    dito.ptable(rows=rows, ftable_kwargs={"first_row_is_header": True})
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        args = get_args()
+        if args.debug:
+            raise
+        else:
+            print("ERROR: {} ({})".format(e, type(e).__name__))
+            sys.exit(1)
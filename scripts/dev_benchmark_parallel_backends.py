@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+
+import dito
+
+
+def get_args():
+    parser = argparse.ArgumentParser(description="Compare the runtime of 'dito.mp_starmap' with the thread and the process backend (with and without shared memory) for different workloads.", formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument("-d", "--debug", action="store_true", help="If set, show full stack trace for errors.")
+    parser.add_argument("-n", "--image-count", type=int, default=32, help="Number of images per workload.")
+    parser.add_argument("-s", "--size", type=int, nargs=2, metavar=("WIDTH", "HEIGHT"), default=(1920, 1080), help="Size of the images.")
+    parser.add_argument("-w", "--worker-count", type=int, default=None, help="Number of worker processes/threads. If not set, the number of CPU cores is used.")
+    parser.add_argument("-r", "--repeat-count", type=int, default=3, help="Number of repetitions (the best run is reported).")
+    args = parser.parse_args()
+    return args
+
+
+def best_duration(func, repeat_count):
+    durations = []
+    for _ in range(repeat_count):
+        time_start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - time_start)
+    return min(durations)
+
+
+#
+# workloads (module-level, such that they can be pickled for the process backend)
+#
+
+
+def workload_resize(image):
+    # cheap, releases the GIL, large result
+    return cv2.resize(src=image, dsize=None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+
+
+def workload_blur(image):
+    # expensive, releases the GIL, large result
+    return cv2.GaussianBlur(src=image, ksize=(31, 31), sigmaX=0.0)
+
+
+def workload_encode(image):
+    # expensive, releases the GIL, small result
+    return dito.encode(image=image, extension="png")
+
+
+def workload_python(image):
+    # dominated by Python code, i.e. holds the GIL, small result
+    return sum(int(value) for value in image[:64, :, 0].ravel())
+
+
+def main():
+    args = get_args()
+
+    images = [dito.random_image(size=tuple(args.size)) for _ in range(args.image_count)]
+    argss = [(image,) for image in images]
+    workloads = [
+        ["resize", workload_resize],
+        ["GaussianBlur", workload_blur],
+        ["encode (png)", workload_encode],
+        ["Python loop", workload_python],
+    ]
+    variants = [
+        ["serial", lambda func: [func(*args) for args in argss]],
+        ["thread", lambda func: dito.mp_starmap(func=func, argss=argss, process_count=args.worker_count, backend="thread")],
+        ["process", lambda func: dito.mp_starmap(func=func, argss=argss, process_count=args.worker_count, backend="process")],
+        ["process (shared memory)", lambda func: dito.mp_starmap(func=func, argss=argss, process_count=args.worker_count, backend="process", shared_memory=True)],
+    ]
+
+    rows = [["Workload"] + [variant_name for (variant_name, _) in variants] + ["Fastest"]]
+    for (workload_name, workload_func) in workloads:
+        durations = [best_duration(func=lambda: variant_func(workload_func), repeat_count=args.repeat_count) for (_, variant_func) in variants]
+        fastest_name = variants[min(range(len(durations)), key=durations.__getitem__)][0]
+        rows.append([workload_name] + ["{:.1f} ms".format(1000.0 * duration) for duration in durations] + [fastest_name])
+    print("{} image(s) of size {}, {} worker(s), {} CPU core(s) (time per batch, including pool startup for the process backend)".format(args.image_count, tuple(args.size), args.worker_count if (args.worker_count is not None) else "default", os.cpu_count()))
+    dito.ptable(rows=rows, ftable_kwargs={"first_row_is_header": True})
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        args = get_args()
+        if args.debug:
+            raise
+        else:
+            print("ERROR: {} ({})".format(e, type(e).__name__))
+            sys.exit(1)
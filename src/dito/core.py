@@ -1,12 +1,14 @@
 """
 This submodule provides essential tools and helpers for OpenCV images represented as NumPy arrays.
 """
+import functools
 import re
 
 import cv2
 import numpy as np
 
 import dito.exceptions
+import dito.parallel
 import dito.utils
 
 
@@ -33,6 +35,15 @@ def is_image(image):
     return is_gray(image=image) or is_color(image=image)
 
 
+def _check_batch(image):
+    """
+    Internal helper function which raises a `ValueError` if `image` is not a stack of images, i.e., an array of shape
+    `(N, H, W)` or `(N, H, W, C)` (as expected by functions called with `batch=True`).
+    """
+    if (not isinstance(image, np.ndarray)) or (image.ndim not in (3, 4)):
+        raise ValueError("Argument 'image' must be a stack of images of shape (N, H, W) or (N, H, W, C) if 'batch' is True (but has shape {})".format(image.shape if isinstance(image, np.ndarray) else type(image).__name__))
+
+
 #
 # type-related
 #
@@ -261,7 +272,153 @@ def dtype_common(dtypes):
     return hierarchy[max_index]
 
 
-def convert(image, dtype):
+def _get_out_image(image, out=None, inplace=False, dtype=None):
+    """
+    Internal helper function which returns the array into which the result of an element-wise operation on `image`
+    is to be written.
+
+    It is used by functions supporting the arguments `out` and `inplace` (e.g., `convert`, `clip`, `normalize`,
+    `invert`), which allow to reuse existing buffers instead of allocating new images.
+
+    Parameters
+    ----------
+    image : numpy.ndarray
+        Input image of the operation.
+    out : numpy.ndarray or None, optional
+        Array to write the result into. It must have the shape of `image` and the data type `dtype`.
+    inplace : bool, optional
+        If `True`, the result is written into `image` itself (which is equivalent to `out=image`).
+    dtype : numpy.dtype or None, optional
+        Data type of the result. If `None`, the data type of `image` is used.
+
+    Returns
+    -------
+    numpy.ndarray or None
+        The array to write the result into, or `None` if neither `out` nor `inplace` is given (in which case the
+        caller allocates a new image).
+
+    Raises
+    ------
+    ValueError
+        If `out` does not match the shape of `image` or the data type `dtype`, if `inplace` is used with a `dtype`
+        different from the data type of `image`, or if both `out` and `inplace` are given.
+    """
+    if dtype is None:
+        dtype = image.dtype
+    dtype = np.dtype(dtype)
+
+    if inplace:
+        if (out is not None) and (out is not image):
+            raise ValueError("Argument 'out' must be None (or the input image) if 'inplace' is True")
+        if image.dtype != dtype:
+            raise ValueError("In-place operation is not possible, because the result dtype '{}' differs from the image dtype '{}'".format(dtype, image.dtype))
+        out = image
+
+    if out is not None:
+        if (not isinstance(out, np.ndarray)) or (out.shape != image.shape) or (out.dtype != dtype):
+            raise ValueError("Argument 'out' must be an array of shape {} and dtype '{}' (but is {})".format(image.shape, dtype, "of shape {} and dtype '{}'".format(out.shape, out.dtype) if isinstance(out, np.ndarray) else type(out).__name__))
+
+    return out
+
+
+def _get_lut(func, dtype, *args):
+    """
+    Internal helper function which returns the lookup table of the pointwise function `func(image, *args)` for images
+    of the given `dtype` (see `apply_pointwise`).
+
+    The table is computed by applying `func` to all values of `dtype` (so its results are identical to those of `func`)
+    and is indexed by the raw pixel values, i.e., by `image.view(np.uint8)` or `image.view(np.uint16)`.
+    """
+    values = _get_lut_values(dtype=dtype)
+    lut = np.asarray(func(values.reshape(1, -1), *args)).reshape(-1)
+    lut.flags.writeable = False
+    return lut
+
+
+def _get_lut_values(dtype):
+    """
+    Internal helper function which returns the values of `dtype` in the order of their raw representation (i.e., the
+    input values of a lookup table, see `_get_lut`).
+    """
+    dtype = np.dtype(dtype)
+    if dtype == np.bool_:
+        # valid bool images only contain the bytes 0 (False) and 1 (True)
+        return np.arange(256) > 0
+    return np.arange(2**(8 * dtype.itemsize), dtype="u{}".format(dtype.itemsize)).view(dtype)
+
+
+# lookup tables are cached (a 16-bit table has up to 512 KiB, so the cache uses at most 16 MiB)
+_get_lut_cached = functools.lru_cache(maxsize=32)(_get_lut)
+
+
+def _apply_lut(image, lut, out=None):
+    """
+    Internal helper function which applies the lookup table `lut` (see `_get_lut`) to `image`.
+
+    For 8-bit images, `cv2.LUT` is used if possible, otherwise `np.take`.
+    """
+    index_image = image.view(np.uint8 if (image.dtype.itemsize == 1) else np.uint16)
+
+    cv2_lut_dtypes = (np.uint8, np.int8, np.uint16, np.int16, np.int32, np.float32, np.float64)
+    if (image.dtype.itemsize == 1) and ((image.ndim == 2) or ((image.ndim == 3) and (image.shape[2] <= 4))) and (lut.dtype in cv2_lut_dtypes + (np.bool_,)):
+        result = cv2.LUT(src=index_image, lut=lut.view(np.uint8) if (lut.dtype == np.bool_) else lut).view(lut.dtype)
+
+        # cv2.LUT removes the channel axis if it has size one
+        result.shape = image.shape
+
+        if out is None:
+            return result
+        np.copyto(out, result)
+        return out
+
+    return np.take(lut, index_image, out=out, mode="clip")
+
+
+def apply_pointwise(image, func, *args, out=None):
+    """
+    Apply the pointwise function `func(image, *args)` to `image`, using a cached lookup table if possible.
+
+    For bool, 8-bit and 16-bit integer images with at least as many pixel values as there are possible values of their
+    dtype (i.e., 256 or 65536), `func` is applied once to all possible values, and the result is used as lookup table
+    (via `cv2.LUT` for 8-bit images and `np.take` otherwise). The tables are cached, keyed by (`func`, dtype, `args`).
+    For all other images, `func(image, *args)` is called directly.
+
+    Parameters
+    ----------
+    image : numpy.ndarray
+        Input image.
+    func : callable
+        Pointwise function which maps each pixel value independently of all others (e.g., `convert`). It must accept
+        an image as first argument and `args` as further arguments. It must be hashable (e.g., a module-level
+        function).
+    *args
+        Further arguments passed to `func`. They must be hashable (e.g., `float`, `int`, `str`, `numpy.dtype`).
+    out : numpy.ndarray or None, optional
+        If given, the result is written into this array (which must have the shape of `image` and the data type of
+        the result) and it is returned.
+
+    Returns
+    -------
+    numpy.ndarray
+        The result of `func(image, *args)`.
+
+    Examples
+    --------
+    >>> image = np.arange(256, dtype=np.uint8).reshape(16, 16)
+    >>> np.array_equal(apply_pointwise(image, convert, np.float32), convert(image, np.float32))
+    True
+    """
+    if (image.dtype in (np.bool_, np.uint8, np.int8, np.uint16, np.int16)) and (image.size >= 2**(8 * image.dtype.itemsize)):
+        return _apply_lut(image=image, lut=_get_lut_cached(func, image.dtype, *args), out=out)
+
+    result = func(image, *args)
+    if out is None:
+        return result
+    np.copyto(out, result)
+    return out
+
+
+def convert(image, dtype, out=None, inplace=False):
     """
     Convert input `image` to the NumPy `dtype` and scale the intensity values accordingly.
 
@@ -271,16 +428,26 @@ def convert(image, dtype):
         Input image to be converted.
     dtype : numpy.dtype
         Desired output data type of the image.
+    out : numpy.ndarray or None, optional
+        If given, the result is written into this array (which must have the shape of `image` and the data type
+        `dtype`) and it is returned.
+    inplace : bool, optional
+        If `True`, the result is written into `image` itself. Only possible if `dtype` is the data type of `image`.
 
     Returns
     -------
     numpy.ndarray
-        A copy of the input image with converted data type and scaled intensity values.
+        A copy of the input image (or `out`) with converted data type and scaled intensity values.
 
     Notes
     -----
     Intensity values are always clipped to the allowed range (even for identical source and target types).
-    The returned image is always a copy of the data, even for equal source and target types.
+    Unless `out` or `inplace` are given, the returned image is always a copy of the data, even for equal source and
+    target types.
+
+    Scaling and casting is done in a single pass (without full-size temporary images). Only float images converted to
+    a non-float `dtype` need one temporary image (because they must be clipped before being scaled and cast). For
+    8-bit and bool images, a cached lookup table is used (see `apply_pointwise`).
 
     Example
     -------
@@ -289,21 +456,46 @@ def convert(image, dtype):
     array([[  0, 255]], dtype=uint8)
     """
 
+    out = _get_out_image(image=image, out=out, inplace=inplace, dtype=dtype)
+
+    if (image.dtype != dtype) and (image.dtype.itemsize == 1):
+        # for 16-bit images, a lookup table is not faster than the single pass of `_convert`
+        return apply_pointwise(image, _convert, np.dtype(dtype), out=out)
+    return _convert(image=image, dtype=dtype, out=out)
+
+
+def _convert(image, dtype, out=None):
+    """
+    Internal helper function which implements `convert` (without validation of `out` and without lookup tables).
+    """
+
     # clip image against its source dtype (important for floats)
-    # clip also guarantees that the original image will remain unchanged
     (lower, upper) = dtype_range(dtype=image.dtype)
-    image_clipped = clip(image=image, lower=lower, upper=upper)
-
     if image.dtype == dtype:
-        return image_clipped
-    else:
-        # only a scale factor is needed, since all dtypes share a common "zero"
-        scale = dtype_range(dtype=dtype)[1] / dtype_range(dtype=image.dtype)[1]
+        return clip(image=image, lower=lower, upper=upper, out=out)
 
-        # use at least the 'float32' dtype for the intermediate image (but if the image is 'float64', use that)
-        intermediate_dtype = dtype_common(dtypes=[image.dtype, np.float32])
+    # only a scale factor is needed, since all dtypes share a common "zero"
+    scale = dtype_range(dtype=dtype)[1] / dtype_range(dtype=image.dtype)[1]
 
-        return (image_clipped.astype(dtype=intermediate_dtype) * scale).astype(dtype)
+    # use at least the 'float32' dtype for the intermediate values (but if the image is 'float64', use that)
+    intermediate_dtype = dtype_common(dtypes=[image.dtype, np.float32])
+
+    if out is None:
+        out = np.empty(shape=image.shape, dtype=dtype)
+
+    if is_float_image(image=image):
+        if is_float_dtype(dtype=dtype):
+            # float to float: the scale is one, so clipping (and casting) is sufficient
+            return np.clip(image, lower, upper, out=out, casting="unsafe")
+        else:
+            # float to non-float: clip before scaling, such that the cast does not overflow
+            image_work = clip(image=image, lower=lower, upper=upper)
+            np.multiply(image_work, scale, out=image_work)
+            np.copyto(out, image_work, casting="unsafe")
+            return out
+    else:
+        # non-float images are always within their dtype range, so no clipping is needed
+        return np.multiply(image, scale, out=out, dtype=intermediate_dtype, casting="unsafe")
 
 
 #
@@ -602,10 +794,14 @@ def size(image):
     return (image.shape[1], image.shape[0])
 
 
-def resize(image, scale_or_size, interpolation_down=cv2.INTER_CUBIC, interpolation_up=cv2.INTER_NEAREST):
+def resize(image, scale_or_size, interpolation_down=cv2.INTER_CUBIC, interpolation_up=cv2.INTER_NEAREST, batch=False, thread_count=None):
     """
     Resize the input image to a new size or by a scaling factor.
 
+    If `batch` is `True`, `image` is a stack of images of shape `(N, H, W)` or `(N, H, W, C)`, and each image is
+    resized in the same way. Since `cv2.resize` only processes single images, this is done in a loop (which can be run
+    in parallel threads via `thread_count`), but the results are written into one preallocated stack.
+
     Parameters
     ----------
     image : numpy.ndarray
@@ -613,15 +809,25 @@ def resize(image, scale_or_size, interpolation_down=cv2.INTER_CUBIC, interpolati
     scale_or_size : float or tuple
         If `scale_or_size` is a float, it represents the scaling factor by which to resize the image.
         If `scale_or_size` is a tuple, it represents the target size `(width, height)` of the output image.
-    interpolation_down : int, optional
-        Interpolation method used when scaling the image down. Default is `cv2.INTER_CUBIC`.
+    interpolation_down : int or str, optional
+        Interpolation method used when scaling the image down. Default is `cv2.INTER_CUBIC`. Besides the OpenCV
+        constants, the following modes are supported:
+          - 'pyramid': repeatedly halve the image via `cv2.pyrDown` (i.e., down to the nearest power of two), followed
+            by one `cv2.INTER_AREA` step to the target size. This avoids aliasing for large scale factors.
+          - 'auto': use `cv2.INTER_CUBIC` for scale factors larger than 0.5 (where aliasing is negligible),
+            `cv2.INTER_AREA` if the image size is an integer multiple of the target size, and 'pyramid' otherwise.
     interpolation_up : int, optional
         Interpolation method used when scaling the image up. Default is `cv2.INTER_NEAREST`.
+    batch : bool, optional
+        If `True`, `image` is treated as a stack of images along its first axis.
+    thread_count : int or None, optional
+        If given and `batch` is `True`, the images of the stack are resized by this many threads (see
+        `dito.parallel.mp_starmap`). Otherwise, they are resized one after another.
 
     Returns
     -------
     numpy.ndarray
-        The resized image.
+        The resized image (or stack of resized images if `batch` is `True`).
 
     Raises
     ------
@@ -639,29 +845,112 @@ def resize(image, scale_or_size, interpolation_down=cv2.INTER_CUBIC, interpolati
     >>> resized_image = resize(image, (800, 600))
     >>> size(resized_image)
     (800, 600)
+
+    >>> images = np.zeros((16, 480, 640, 3), dtype=np.uint8)
+    >>> resize(images, 0.5, batch=True).shape
+    (16, 240, 320, 3)
     """
 
-    # OpenCV does not support resizing of bool images - this is a workaround
+    if batch:
+        _check_batch(image=image)
+        resize_kwargs = {"scale_or_size": scale_or_size, "interpolation_down": interpolation_down, "interpolation_up": interpolation_up}
+        return _resize_batch(images=image, resize_kwargs=resize_kwargs, thread_count=thread_count)
+
+    # OpenCV does not support resizing of bool images - resize their 'uint8' view and convert the result in place
     if image.dtype == bool:
-        image_uint8 = image.astype(np.uint8)
-        image_uint8 = resize(image=image_uint8, scale_or_size=scale_or_size, interpolation_down=interpolation_down, interpolation_up=interpolation_up)
-        return image_uint8 > 0
+        image_uint8 = resize(image=image.view(np.uint8), scale_or_size=scale_or_size, interpolation_down=interpolation_down, interpolation_up=interpolation_up)
+        return np.greater(image_uint8, 0, out=image_uint8.view(bool))
 
     # resize by scale factor
     if isinstance(scale_or_size, float):
         scale = scale_or_size
-        return cv2.resize(src=image, dsize=None, dst=None, fx=scale, fy=scale, interpolation=interpolation_up if scale > 1.0 else interpolation_down)
+        interpolation = interpolation_up if scale > 1.0 else interpolation_down
+        if isinstance(interpolation, str):
+            # the target size is rounded in the same way as done by OpenCV
+            target_size = (round(image.shape[1] * scale), round(image.shape[0] * scale))
+            return _resize_mode(image=image, target_size=target_size, mode=interpolation)
+        return cv2.resize(src=image, dsize=None, dst=None, fx=scale, fy=scale, interpolation=interpolation)
 
     # resize to target size
     elif isinstance(scale_or_size, tuple) and (len(scale_or_size) == 2):
         target_size = scale_or_size
         current_size = size(image)
-        return cv2.resize(src=image, dsize=target_size, dst=None, fx=0.0, fy=0.0, interpolation=interpolation_up if all(target_size[n_dim] > current_size[n_dim] for n_dim in range(2)) else interpolation_down)
+        interpolation = interpolation_up if all(target_size[n_dim] > current_size[n_dim] for n_dim in range(2)) else interpolation_down
+        if isinstance(interpolation, str):
+            return _resize_mode(image=image, target_size=target_size, mode=interpolation)
+        return cv2.resize(src=image, dsize=target_size, dst=None, fx=0.0, fy=0.0, interpolation=interpolation)
     
     else:
         raise ValueError("Expected a float (= scale factor) or a 2-tuple (= target size) for argument 'scale_or_size', but got type '{}'".format(type(scale_or_size)))
 
 
+def _resize_mode(image, target_size, mode):
+    """
+    Internal helper function which implements `resize` for the interpolation modes 'pyramid' and 'auto'.
+    """
+    (width, height) = size(image)
+    (target_width, target_height) = target_size
+    if (target_width < 1) or (target_height < 1):
+        raise ValueError("Target size must be positive (but is {})".format(target_size))
+
+    if mode == "auto":
+        if (target_width > width / 2) and (target_height > height / 2):
+            return cv2.resize(src=image, dsize=target_size, interpolation=cv2.INTER_CUBIC)
+        elif (width % target_width == 0) and (height % target_height == 0):
+            return cv2.resize(src=image, dsize=target_size, interpolation=cv2.INTER_AREA)
+        mode = "pyramid"
+
+    if mode != "pyramid":
+        raise ValueError("Invalid interpolation mode '{}' (must be an OpenCV interpolation constant, 'pyramid', or 'auto')".format(mode))
+
+    # halve the image as long as it does not become smaller than the target size (`cv2.pyrDown` does not support all dtypes and does not shrink a side of length one)
+    image_resized = image
+    if image.dtype in (np.uint8, np.uint16, np.int16, np.float32, np.float64):
+        while (width > 1) and (height > 1) and (((width + 1) // 2) >= target_width) and (((height + 1) // 2) >= target_height):
+            image_resized = cv2.pyrDown(src=image_resized)
+            (width, height) = size(image_resized)
+
+    if (width, height) != tuple(target_size):
+        return cv2.resize(src=image_resized, dsize=target_size, interpolation=cv2.INTER_AREA)
+    elif image_resized is image:
+        # like `cv2.resize`, always return a new image
+        return image.copy()
+    return image_resized
+
+
+def _resize_batch_item(images_resized, n_image, image, resize_kwargs):
+    """
+    Internal helper function which resizes `image` and writes the result into `images_resized[n_image]`.
+    """
+    image_resized = resize(image=image, **resize_kwargs)
+    images_resized[n_image] = image_resized.reshape(images_resized.shape[1:])
+
+
+def _resize_batch(images, resize_kwargs, thread_count=None):
+    """
+    Internal helper function which implements `resize` for stacks of images (see argument `batch`).
+    """
+
+    # the target size is computed as done by OpenCV (which also drops singleton channel axes, so use the input's)
+    scale_or_size = resize_kwargs["scale_or_size"]
+    (height, width) = images.shape[1:3]
+    if isinstance(scale_or_size, float):
+        target_size = (round(width * scale_or_size), round(height * scale_or_size))
+    elif isinstance(scale_or_size, tuple) and (len(scale_or_size) == 2):
+        target_size = scale_or_size
+    else:
+        raise ValueError("Expected a float (= scale factor) or a 2-tuple (= target size) for argument 'scale_or_size', but got type '{}'".format(type(scale_or_size)))
+    images_resized = np.empty(shape=(images.shape[0], target_size[1], target_size[0]) + images.shape[3:], dtype=images.dtype)
+
+    argss = [(images_resized, n_image, images[n_image], resize_kwargs) for n_image in range(images.shape[0])]
+    if (thread_count is not None) and (thread_count > 1) and (len(argss) > 1):
+        dito.parallel.mp_starmap(func=_resize_batch_item, argss=argss, process_count=thread_count, backend="thread")
+    else:
+        for args in argss:
+            _resize_batch_item(*args)
+    return images_resized
+
+
 class PaddedImageIndexer():
     """
     Wrapper for an `np.ndarray` which allows indexing out-of-bounds and returns
@@ -1177,12 +1466,16 @@ def is_color(image):
     return (len(image.shape) == 3) and (image.shape[2] == 3)
 
 
-def as_gray(image, keep_color_dimension=False):
+def as_gray(image, keep_color_dimension=False, batch=False):
     """
     Convert the given `image` from BGR to grayscale.
 
     If `image` is already a grayscale image, return it unchanged.
 
+    If `batch` is `True`, `image` is a stack of images of shape `(N, H, W)` (grayscale) or `(N, H, W, C)`, which is
+    converted by a single `cv2.cvtColor` call (since the conversion is pixel-wise, the stack is processed as one tall
+    image).
+
     Parameters
     ----------
     image : np.ndarray
@@ -1190,11 +1483,13 @@ def as_gray(image, keep_color_dimension=False):
     keep_color_dimension : bool, optional
         If True, the output grayscale image will have a shape of `(height, width, 1)`. If False (default), the output
         image will have a shape of `(height, width)`.
+    batch : bool, optional
+        If `True`, `image` is treated as a stack of images along its first axis.
 
     Returns
     -------
     np.ndarray
-        Grayscale image.
+        Grayscale image (or stack of grayscale images if `batch` is `True`).
 
     See Also
     --------
@@ -1202,6 +1497,17 @@ def as_gray(image, keep_color_dimension=False):
     cv2.cvtColor : OpenCV function that performs the color conversion.
     """
 
+    if batch:
+        _check_batch(image=image)
+        if (image.ndim == 3) or (image.shape[3] == 1):
+            images_gray = image
+        else:
+            (count, height, width) = image.shape[:3]
+            images_gray = cv2.cvtColor(src=image.reshape(count * height, width, image.shape[3]), code=cv2.COLOR_BGR2GRAY).reshape(count, height, width)
+        if keep_color_dimension and (images_gray.ndim == 3):
+            images_gray = images_gray[:, :, :, np.newaxis]
+        return images_gray
+
     if is_gray(image=image):
         image_gray = image
     else:
@@ -1438,7 +1744,7 @@ def as_channels(b=None, g=None, r=None):
 #
 
 
-def clip(image, lower=None, upper=None):
+def clip(image, lower=None, upper=None, out=None, inplace=False):
     """
     Clip values of the given `image` to the range specified by `lower` and `upper`.
 
@@ -1450,6 +1756,11 @@ def clip(image, lower=None, upper=None):
         Lower bound of the clipping range (inclusive). If `None`, no lower bound is applied.
     upper : float or int or None
         Upper bound of the clipping range (inclusive). If `None`, no upper bound is applied.
+    out : np.ndarray or None, optional
+        If given, the result is written into this array (which must have the shape and data type of `image`) and it
+        is returned.
+    inplace : bool, optional
+        If `True`, `image` itself is clipped (and returned).
 
     Returns
     -------
@@ -1458,7 +1769,10 @@ def clip(image, lower=None, upper=None):
 
     Notes
     -----
-    This function makes a copy of the input array to avoid modifying it in place.
+    Unless `out` or `inplace` are given, this function makes a copy of the input array to avoid modifying it in place.
+
+    For integer images, bounds outside the range of the data type are limited to that range (e.g., `upper=300` has no
+    effect for 'uint8' images).
 
     Examples
     --------
@@ -1466,6 +1780,23 @@ def clip(image, lower=None, upper=None):
     array([[2, 2, 2, 3, 4, 5, 6, 6, 6, 6]], dtype=uint8)
     """
 
+    if is_integer_image(image=image):
+        # bounds outside the dtype range can not be represented in the dtype
+        dtype_info = np.iinfo(image.dtype)
+        if lower is not None:
+            lower = min(max(lower, dtype_info.min), dtype_info.max)
+        if upper is not None:
+            upper = min(max(upper, dtype_info.min), dtype_info.max)
+
+    out = _get_out_image(image=image, out=out, inplace=inplace)
+    if out is not None:
+        # single pass into the given array
+        if (lower is None) and (upper is None):
+            if out is not image:
+                np.copyto(out, image)
+            return out
+        return np.clip(image, lower, upper, out=out, casting="unsafe")
+
     # assert that the input array remains unchanged
     image = image.copy()
 
@@ -1478,7 +1809,7 @@ def clip(image, lower=None, upper=None):
     return image
 
 
-def clip_01(image):
+def clip_01(image, out=None, inplace=False):
     """
     Clip values of the given `image` to the range `(0.0, 1.0)`.
 
@@ -1486,6 +1817,10 @@ def clip_01(image):
     ----------
     image : np.ndarray
         The input image.
+    out : np.ndarray or None, optional
+        If given, the result is written into this array (see `clip`).
+    inplace : bool, optional
+        If `True`, `image` itself is clipped (see `clip`).
 
     Returns
     -------
@@ -1497,10 +1832,10 @@ def clip_01(image):
     >>> clip_01(image=np.array([[-2.0, -1.0, 0.0, 1.0, 2.0]], dtype=np.float32))
     array([[0., 0., 0., 1., 1.]], dtype=float32)
     """
-    return clip(image=image, lower=0.0, upper=1.0)
+    return clip(image=image, lower=0.0, upper=1.0, out=out, inplace=inplace)
 
 
-def clip_11(image):
+def clip_11(image, out=None, inplace=False):
     """
     Clip values of the given `image` to the range `(-1.0, 1.0)`.
 
@@ -1508,6 +1843,10 @@ def clip_11(image):
     ----------
     image : np.ndarray
         The input image.
+    out : np.ndarray or None, optional
+        If given, the result is written into this array (see `clip`).
+    inplace : bool, optional
+        If `True`, `image` itself is clipped (see `clip`).
 
     Returns
     -------
@@ -1519,10 +1858,10 @@ def clip_11(image):
     >>> clip_11(image=np.array([[-2.0, -1.0, 0.0, 1.0, 2.0]], dtype=np.float32))
     array([[-1., -1.,  0.,  1.,  1.]], dtype=float32)
     """
-    return clip(image=image, lower=-1.0, upper=1.0)
+    return clip(image=image, lower=-1.0, upper=1.0, out=out, inplace=inplace)
 
 
-def clip_0255(image):
+def clip_0255(image, out=None, inplace=False):
     """
     Clip values of the given `image` to the range `(0.0, 255.0)`.
 
@@ -1530,6 +1869,10 @@ def clip_0255(image):
     ----------
     image : np.ndarray
         The input image.
+    out : np.ndarray or None, optional
+        If given, the result is written into this array (see `clip`).
+    inplace : bool, optional
+        If `True`, `image` itself is clipped (see `clip`).
 
     Returns
     -------
@@ -1541,10 +1884,151 @@ def clip_0255(image):
     >>> clip_0255(image=np.array([[-1.0, 0.0, 1.0, 255.0, 300.0]], dtype=np.float32))
     array([[  0.,   0.,   1., 255., 255.]], dtype=float32)
     """
-    return clip(image=image, lower=0.0, upper=255.0)
+    return clip(image=image, lower=0.0, upper=255.0, out=out, inplace=inplace)
+
+
+def _get_value_counts(image):
+    """
+    Internal helper function which returns the number of occurrences of each possible value of the bool, 8-bit or
+    16-bit integer `image` (in increasing order of the values) and the corresponding values.
+    """
+    if image.dtype == np.bool_:
+        true_count = np.count_nonzero(image)
+        return (np.array([image.size - true_count, true_count], dtype=np.int64), np.array([0.0, 1.0]))
+
+    bin_count = 2**(8 * image.dtype.itemsize)
+    index_image = image.reshape(-1).view(np.uint8 if (image.dtype.itemsize == 1) else np.uint16)
+
+    # cv2.calcHist counts in 'float32', which is exact only up to 2**24, so large images are processed in chunks
+    counts = np.zeros(shape=(bin_count,), dtype=np.int64)
+    chunk_size = 2**24
+    for start in range(0, index_image.size, chunk_size):
+        chunk = index_image[start:(start + chunk_size)].reshape(-1, 1)
+        counts += cv2.calcHist(images=[chunk], channels=[0], mask=None, histSize=[bin_count], ranges=[0, bin_count]).reshape(-1).astype(np.int64)
+
+    values = np.arange(bin_count, dtype=np.float64)
+    if np.issubdtype(image.dtype, np.signedinteger):
+        # the raw values of negative numbers come after those of non-negative numbers
+        counts = np.roll(counts, bin_count // 2)
+        values -= bin_count // 2
+    return (counts, values)
+
+
+def _get_histogram_percentiles(counts, values, quantiles):
+    """
+    Internal helper function which returns the exact `quantiles` (in the range `[0, 1]`) of the data described by the
+    histogram `counts` of `values`, using linear interpolation (identical to `np.percentile`).
+    """
+    cum_counts = np.cumsum(counts)
+    value_count = cum_counts[-1]
+
+    # indices of the sorted data, as computed by `np.percentile`
+    virtual_indices = (value_count - 1) * quantiles
+    previous_indices = np.minimum(np.floor(virtual_indices), value_count - 1)
+    next_indices = np.minimum(previous_indices + 1, value_count - 1)
+    gammas = virtual_indices - np.floor(virtual_indices)
+
+    # the sorted value at index i is the first value whose cumulative count exceeds i
+    previous_values = values[np.searchsorted(cum_counts, previous_indices, side="right")]
+    next_values = values[np.searchsorted(cum_counts, next_indices, side="right")]
+
+    # linear interpolation (with the same rounding behavior as `np.percentile`)
+    diffs = next_values - previous_values
+    return np.where(gammas >= 0.5, next_values - diffs * (1.0 - gammas), previous_values + diffs * gammas)
+
+
+def _get_binned_percentiles(image, quantiles, bin_count):
+    """
+    Internal helper function which returns approximations of the `quantiles` (in the range `[0, 1]`) of the values
+    of `image`, based on a histogram with `bin_count` bins between the minimum and maximum value.
+    """
+    (min_, max_) = (np.min(image), np.max(image))
+    if not (np.isfinite(min_) and np.isfinite(max_)):
+        # NaN or infinite values can not be binned
+        return np.percentile(image, 100.0 * quantiles)
+    if min_ == max_:
+        return np.full(shape=quantiles.shape, fill_value=min_, dtype=np.float64)
+
+    (counts, edges) = np.histogram(image, bins=bin_count, range=(float(min_), float(max_)))
+    cum_counts = np.cumsum(counts)
+    virtual_indices = (cum_counts[-1] - 1) * quantiles
+
+    # find the bin containing each virtual index and interpolate linearly within that bin
+    bin_indices = np.minimum(np.searchsorted(cum_counts, virtual_indices, side="right"), bin_count - 1)
+    fractions = (virtual_indices - (cum_counts[bin_indices] - counts[bin_indices]) + 0.5) / counts[bin_indices]
+    result = edges[bin_indices] + np.clip(fractions, 0.0, 1.0) * (edges[bin_indices + 1] - edges[bin_indices])
+    return np.clip(result, min_, max_)
+
+
+def percentile(image, q, approximate=False, bin_count=4096, max_sample_count=None):
+    """
+    Compute the `q`-th percentile(s) of all values of the given `image`.
+
+    For bool, 8-bit and 16-bit integer images, the exact percentiles are read from a single cumulative histogram (via
+    `cv2.calcHist`), which takes O(n) time instead of the partitioning done by `np.percentile`. The results are
+    identical to those of `np.percentile` (with its default linear interpolation).
+
+    For all other images, `np.percentile` is used (once for all `q`), unless `approximate` is `True`. In that case, the
+    percentiles are approximated based on a histogram with `bin_count` bins between the minimum and maximum value. The
+    absolute error is at most `(max - min) / bin_count`.
+
+    Parameters
+    ----------
+    image : numpy.ndarray
+        Input image.
+    q : float or sequence of floats
+        Percentile(s) to compute, each in the range `[0, 100]`.
+    approximate : bool, optional
+        If `True`, approximate the percentiles of images which are not bool, 8-bit or 16-bit integer images via a
+        binned histogram.
+    bin_count : int, optional
+        Number of histogram bins used if `approximate` is `True`.
+    max_sample_count : int or None, optional
+        If given and if the image has more values, only every n-th value is used (such that at most `max_sample_count`
+        values are used). This speeds up the computation for huge images, but the result is an approximation.
+
+    Returns
+    -------
+    numpy.float64 or numpy.ndarray
+        The percentile(s), as scalar if `q` is a scalar or as array of the shape of `q` otherwise. As for
+        `np.percentile`, float images yield results of their dtype.
+
+    Raises
+    ------
+    ValueError
+        If any `q` is outside the range `[0, 100]`.
+
+    Examples
+    --------
+    >>> image = np.array([[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]], dtype=np.uint8)
+    >>> percentile(image, [10.0, 50.0, 95.0])
+    array([1. , 5. , 9.5])
+    """
+    quantiles = np.true_divide(np.asarray(q, dtype=np.float64), 100.0)
+    if np.any(quantiles < 0.0) or np.any(quantiles > 1.0):
+        raise ValueError("Percentiles must be in the range [0, 100]")
+
+    values = image
+    if (max_sample_count is not None) and (image.size > max_sample_count):
+        step = -(-image.size // max_sample_count)
+        values = image.reshape(-1)[::step]
+
+    if values.size == 0:
+        return np.percentile(values, q)
+    elif values.dtype in (np.bool_, np.uint8, np.int8, np.uint16, np.int16):
+        (counts, counts_values) = _get_value_counts(image=values)
+        result = _get_histogram_percentiles(counts=counts, values=counts_values, quantiles=quantiles.reshape(-1))
+    elif approximate:
+        result = _get_binned_percentiles(image=values, quantiles=quantiles.reshape(-1), bin_count=bin_count)
+        result = result.astype(values.dtype if is_float_image(image=values) else np.float64)
+    else:
+        return np.percentile(values, q)
+
+    result = result.reshape(quantiles.shape)
+    return result[()] if (result.ndim == 0) else result
 
 
-def normalize(image, mode="minmax", **kwargs):
+def normalize(image, mode="minmax", out=None, inplace=False, batch=False, **kwargs):
     """
     Normalize the intensity values of the given `image` to a certain range.
 
@@ -1561,6 +2045,15 @@ def normalize(image, mode="minmax", **kwargs):
         Input image to be normalized.
     mode : str, optional
         Normalization mode. Valid modes are {'none', 'interval', 'minmax', 'zminmax', 'percentile'}.
+    out : np.ndarray or None, optional
+        If given, the result is written into this array (which must have the shape and data type of `image`) and it
+        is returned.
+    inplace : bool, optional
+        If `True`, the result is written into `image` itself.
+    batch : bool, optional
+        If `True`, `image` is a stack of images of shape `(N, H, W)` or `(N, H, W, C)`, and each image is normalized
+        independently (e.g., using its own minimum and maximum value). The statistics are computed along the batch axis
+        and the stack is normalized in a single vectorized pass.
     **kwargs
         Additional keyword arguments specific to each mode. See Notes section for more details.
 
@@ -1580,41 +2073,93 @@ def normalize(image, mode="minmax", **kwargs):
 
       - 'none': no additional keyword arguments are used
       - 'interval': the following arguments are required:
-        - 'lower' (float or int): lower bound of the source interval
-        - 'upper' (float or int): upper bound of the source interval
+        - 'lower' (float or int): lower bound of the source interval (if `batch` is `True`, also a sequence with one
+          bound per image)
+        - 'upper' (float or int): upper bound of the source interval (if `batch` is `True`, also a sequence with one
+          bound per image)
       - 'minmax': no additional keyword arguments are used
       - 'zminmax': no additional keyword arguments are used
       - 'percentile': the following arguments are optional:
         - 'q' or 'p' (float): percentile to be used for lower and upper bounds (default: 2.0)
+        - 'approximate' (bool): approximate the percentiles of float images (see `percentile`, default: False)
+        - 'max_sample_count' (int or None): use at most this many values to compute the percentiles (see
+          `percentile`, default: None)
+
+    For float images, the computation is done in the data type of the image (in `out` if given, i.e., without any
+    temporary image). For bool, 8-bit and 16-bit integer images, a cached lookup table is used (see
+    `apply_pointwise`). For all other images, one temporary 'float64' image is used.
+
+    For mode 'none', the input image itself is returned (unless `out` is given, in which case it is copied into `out`).
     """
 
+    out = _get_out_image(image=image, out=out, inplace=inplace)
+
+    if batch and (mode != "none"):
+        _check_batch(image=image)
+        return _normalize_batch(image, mode=mode, out=out, **kwargs)
+
     if mode == "none":
+        if (out is not None) and (out is not image):
+            np.copyto(out, image)
+            return out
         return image
 
     elif mode == "interval":
         # interval range to be spread out to the "full" interval range
         (lower_source, upper_source) = sorted((kwargs["lower"], kwargs["upper"]))
+        if is_float_image(image=image):
+            return _normalize_interval(image, lower_source, upper_source, out=out)
+        else:
+            return apply_pointwise(image, _normalize_interval, float(lower_source), float(upper_source), out=out)
 
-        # the target interval range depends on the image's data type
-        (lower_target, upper_target) = dtype_range(image.dtype)
+    elif mode == "minmax":
+        return normalize(image, mode="interval", out=out, lower=np.min(image), upper=np.max(image))
 
-        # we temporarily work with a float image (because values outside the target interval can occur)
-        image_work = image.astype("float").copy()
-        
-        # spread the given interval to the full range, clip outlier values
-        image_work = (image_work - lower_source) / (upper_source - lower_source) * (upper_target - lower_target) + lower_target
-        image_work = clip(image=image_work, lower=lower_target, upper=upper_target)
+    elif mode == "zminmax":
+        # "zero-symmetric" minmax (makes only sense for float images)
+        absmax = max(abs(float(np.min(image))), abs(float(np.max(image))))
+        return normalize(image, mode="interval", out=out, lower=-absmax, upper=absmax)
 
-        # return an image with the original data type
-        return image_work.astype(image.dtype)
+    elif mode == "percentile":
+        for key in ("q", "p"):
+            if key in kwargs.keys():
+                q = kwargs[key]
+                break
+        else:
+            q = 2.0
+        q = min(max(0.0, q), 50.0)
+        (lower, upper) = percentile(image, [q, 100.0 - q], approximate=kwargs.get("approximate", False), max_sample_count=kwargs.get("max_sample_count", None))
+        return normalize(image, mode="interval", out=out, lower=lower, upper=upper)
+
+    else:
+        raise ValueError("Invalid mode '{mode}'".format(mode=mode))
+
+
+def _normalize_batch(images, mode, out=None, **kwargs):
+    """
+    Internal helper function which implements `normalize` for stacks of images (see argument `batch`).
+
+    The per-image bounds are computed along the batch axis and have shape `(N, 1, 1[, 1])`, such that they broadcast
+    against the stack in `_normalize_interval`.
+    """
+    axes = tuple(range(1, images.ndim))
+    bounds_shape = (images.shape[0],) + (1,) * (images.ndim - 1)
+
+    if mode == "interval":
+        (lower, upper) = (np.asarray(kwargs["lower"]), np.asarray(kwargs["upper"]))
+        if lower.ndim > 0:
+            lower = lower.reshape(bounds_shape)
+        if upper.ndim > 0:
+            upper = upper.reshape(bounds_shape)
+        (lower_source, upper_source) = (np.minimum(lower, upper), np.maximum(lower, upper))
 
     elif mode == "minmax":
-        return normalize(image, mode="interval", lower=np.min(image), upper=np.max(image))
+        (lower_source, upper_source) = (np.min(images, axis=axes, keepdims=True), np.max(images, axis=axes, keepdims=True))
 
     elif mode == "zminmax":
-        # "zero-symmetric" minmax (makes only sense for float images)
-        absmax = max(np.abs(np.min(image)), np.abs(np.max(image)))
-        return normalize(image, mode="interval", lower=-absmax, upper=absmax)
+        (min_, max_) = (np.min(images, axis=axes, keepdims=True), np.max(images, axis=axes, keepdims=True))
+        absmax = np.maximum(np.abs(min_.astype(np.float64)), np.abs(max_.astype(np.float64)))
+        (lower_source, upper_source) = (-absmax, absmax)
 
     elif mode == "percentile":
         for key in ("q", "p"):
@@ -1624,13 +2169,62 @@ def normalize(image, mode="minmax", **kwargs):
         else:
             q = 2.0
         q = min(max(0.0, q), 50.0)
-        return normalize(image, mode="interval", lower=np.percentile(image, q), upper=np.percentile(image, 100.0 - q))
+        (approximate, max_sample_count) = (kwargs.get("approximate", False), kwargs.get("max_sample_count", None))
+        if (images.dtype in (np.bool_, np.uint8, np.int8, np.uint16, np.int16)) or approximate or (max_sample_count is not None):
+            # histogram-based percentiles are computed per image
+            bounds = np.array([percentile(image, [q, 100.0 - q], approximate=approximate, max_sample_count=max_sample_count) for image in images]).reshape(images.shape[0], 2)
+        else:
+            bounds = np.moveaxis(np.percentile(images.reshape(images.shape[0], -1), [q, 100.0 - q], axis=1), 0, 1)
+        (lower_source, upper_source) = (bounds[:, 0].reshape(bounds_shape), bounds[:, 1].reshape(bounds_shape))
 
     else:
         raise ValueError("Invalid mode '{mode}'".format(mode=mode))
 
+    if (images.dtype in (np.bool_, np.uint8, np.int8, np.uint16, np.int16)) and (images[0].size >= 2**(8 * images.dtype.itemsize)):
+        # compute the lookup tables of all images in a single pass, then apply them image by image (see `apply_pointwise`)
+        values = _get_lut_values(dtype=images.dtype)
+        luts = _normalize_interval(np.broadcast_to(values, (images.shape[0], values.size)), np.broadcast_to(lower_source, bounds_shape).reshape(-1, 1), np.broadcast_to(upper_source, bounds_shape).reshape(-1, 1))
+        if out is None:
+            out = np.empty_like(images)
+        for (n_image, lut) in enumerate(luts):
+            _apply_lut(image=images[n_image], lut=lut, out=out[n_image])
+        return out
+
+    return _normalize_interval(images, lower_source, upper_source, out=out)
 
-def invert(image):
+
+def _normalize_interval(image, lower_source, upper_source, out=None):
+    """
+    Internal helper function which implements `normalize` for mode 'interval' (without lookup tables).
+    """
+
+    # the target interval range depends on the image's data type
+    (lower_target, upper_target) = dtype_range(image.dtype)
+
+    # we work with a float image (because values outside the target interval can occur)
+    # for float images, the output image itself can be used
+    if is_float_image(image=image):
+        image_work = out if (out is not None) else np.empty_like(image)
+    else:
+        image_work = np.empty(shape=image.shape, dtype=np.float64)
+
+    # spread the given interval to the full range (in place), clip outlier values
+    np.subtract(image, lower_source, out=image_work, dtype=image_work.dtype)
+    np.divide(image_work, image_work.dtype.type(upper_source) - image_work.dtype.type(lower_source), out=image_work)
+    np.multiply(image_work, upper_target - lower_target, out=image_work)
+    np.add(image_work, lower_target, out=image_work)
+    clip(image=image_work, lower=lower_target, upper=upper_target, inplace=True)
+
+    # return an image with the original data type
+    if image_work.dtype == image.dtype:
+        return image_work
+    if out is None:
+        out = np.empty_like(image)
+    np.copyto(out, image_work, casting="unsafe")
+    return out
+
+
+def invert(image, out=None, inplace=False):
     """
     Invert the intensity values of the given image.
 
@@ -1638,6 +2232,11 @@ def invert(image):
     ----------
     image : np.ndarray
         The image to invert.
+    out : np.ndarray or None, optional
+        If given, the result is written into this array (which must have the shape and data type of `image`) and it
+        is returned.
+    inplace : bool, optional
+        If `True`, `image` itself is inverted (and returned).
 
     Returns
     -------
@@ -1661,14 +2260,16 @@ def invert(image):
     array([[ True, False]])
     """
 
+    out = _get_out_image(image=image, out=out, inplace=inplace)
+
     if is_integer_image(image=image) or is_float_image(image=image):
         image_dtype_range = dtype_range(dtype=image.dtype)
         if float(image_dtype_range[0]) != 0.0:
             raise ValueError("Argument 'image' must have dtype with min value of zero (but has dtype '{}')".format(image.dtype))
-        return image_dtype_range[1] - image
+        return np.subtract(image_dtype_range[1], image, out=out, dtype=image.dtype)
 
     elif is_bool_image(image=image):
-        return np.logical_not(image)
+        return np.logical_not(image, out=out)
 
     else:
         raise ValueError("Unsupported image dtype '{}'".format(image.dtype))
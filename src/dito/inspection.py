@@ -72,19 +72,74 @@ def info(image, extended=False, minimal=False):
     result["dtype"] = image.dtype
 
     if not minimal:
-        result["mean"] = np.mean(image) if image.size > 0 else np.nan
-        result["std"] = np.std(image) if image.size > 0 else np.nan
-        result["min"] = np.min(image) if image.size > 0 else np.nan
+        if image.size == 0:
+            (mean, std, min_, max_) = (np.nan, np.nan, np.nan, np.nan)
+        elif isinstance(image, np.memmap):
+            # for memory-mapped arrays, avoid temporary arrays of the full image size
+            (mean, std, min_, max_) = _chunked_stats(image=image)
+        else:
+            (mean, std, min_, max_) = (np.mean(image), np.std(image), np.min(image), np.max(image))
+        result["mean"] = mean
+        result["std"] = std
+        result["min"] = min_
     if extended:
-        result["1st quartile"] = np.percentile(image, 25.0) if image.size > 0 else np.nan
-        result["median"] = np.median(image) if image.size > 0 else np.nan
-        result["3rd quartile"] = np.percentile(image, 75.0) if image.size > 0 else np.nan
+        (quartile_1, median, quartile_3) = dito.core.percentile(image, [25.0, 50.0, 75.0]) if image.size > 0 else (np.nan, np.nan, np.nan)
+        result["1st quartile"] = quartile_1
+        result["median"] = median
+        result["3rd quartile"] = quartile_3
     if not minimal:
-        result["max"] = np.max(image) if image.size > 0 else np.nan
+        result["max"] = max_
         result["hash"] = hash_image(image=image, cutoff_position=8, return_hex=True)
     return result
 
 
+def _iter_chunks(image, chunk_bytes=64 * 1024**2):
+    """
+    Internal helper which yields consecutive chunks (along the first axis) of the given array.
+
+    Each chunk contains approximately `chunk_bytes` bytes (but at least one entry of the first axis). This allows
+    processing large (e.g., memory-mapped) arrays without creating temporary arrays of the full size.
+    """
+    if image.ndim == 0:
+        yield image
+        return
+    row_bytes = max(1, image.nbytes // max(1, image.shape[0]))
+    rows_per_chunk = max(1, chunk_bytes // row_bytes)
+    for start in range(0, image.shape[0], rows_per_chunk):
+        yield image[start:(start + rows_per_chunk), ...]
+
+
+def _chunked_stats(image):
+    """
+    Internal helper which returns `(mean, std, min, max)` of a non-empty array, computed chunk-wise.
+
+    The mean and standard deviation of the chunks are combined via the parallel algorithm of Chan et al., so the
+    memory consumption does not depend on the size of the array.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    min_ = None
+    max_ = None
+    for chunk in _iter_chunks(image=image):
+        chunk_count = chunk.size
+        if chunk_count == 0:
+            continue
+        chunk_mean = np.mean(chunk, dtype=np.float64)
+        chunk_m2 = np.sum(np.square(chunk - chunk_mean, dtype=np.float64))
+        delta = chunk_mean - mean
+        total_count = count + chunk_count
+        mean += delta * chunk_count / total_count
+        m2 += chunk_m2 + delta**2 * count * chunk_count / total_count
+        count = total_count
+
+        chunk_min = np.min(chunk)
+        chunk_max = np.max(chunk)
+        min_ = chunk_min if (min_ is None) else min(min_, chunk_min)
+        max_ = chunk_max if (max_ is None) else max(max_, chunk_max)
+    return (np.float64(mean), np.float64(np.sqrt(m2 / count)), min_, max_)
+
+
 def pinfo(*args, extended_=False, minimal_=False, file_=None, **kwargs):
     """
     Prints info about the given images.
@@ -96,7 +151,8 @@ def pinfo(*args, extended_=False, minimal_=False, file_=None, **kwargs):
     extended_ : bool, optional
         If True, additional statistics are computed. See `info`.
     minimal_ : bool, optional
-        If True, only shape and dtype are computed. See `info`.
+        If True, only shape and dtype are computed. See `info`. For filenames, the shape and dtype are determined via
+        `dito.io.probe` (i.e., without decoding the image, if possible).
     file_ : str or file-like object, optional
         If given, the output is written to this file instead of stdout.
     **kwargs : dict
@@ -122,10 +178,15 @@ def pinfo(*args, extended_=False, minimal_=False, file_=None, **kwargs):
     header = None
     rows = []
     for (image_name, image) in all_kwargs.items():
-        if isinstance(image, str):
-            # `image` is a filename -> load it first
-            image = dito.io.load(filename=image)
-        image_info = info(image=image, extended=extended_, minimal=minimal_)
+        if isinstance(image, (str, pathlib.Path)) and minimal_:
+            # `image` is a filename and only shape and dtype are needed -> parse the file header only
+            probe_info = dito.io.probe(filename=image)
+            image_info = collections.OrderedDict([("shape", probe_info.shape), ("dtype", probe_info.dtype)])
+        else:
+            if isinstance(image, (str, pathlib.Path)):
+                # `image` is a filename -> load it first
+                image = dito.io.load(filename=image)
+            image_info = info(image=image, extended=extended_, minimal=minimal_)
         if header is None:
             header = ("Image",) + tuple(image_info.keys())
             rows.append(header)
@@ -257,6 +318,14 @@ def hash_readable(readable, cutoff_position=None, return_hex=True):
         else:
             break
 
+    return _get_digest(hash_=hash_, cutoff_position=cutoff_position, return_hex=return_hex)
+
+
+def _get_digest(hash_, cutoff_position, return_hex):
+    """
+    Internal helper which returns the (possibly cut off) digest of the `hashlib` object `hash_`.
+    """
+
     # get hash value
     if return_hex:
         digest = hash_.hexdigest()
@@ -333,11 +402,24 @@ def hash_image(image, cutoff_position=None, return_hex=True):
     str or bytes
         The hash value of the image.
     """
-    bytes_ = io.BytesIO(initial_bytes=image.tobytes())
-    bytes_.write(str(image.shape).encode("utf-8"))
-    bytes_.write(str(image.dtype).encode("utf-8"))
-    bytes_.seek(0)
-    return hash_readable(bytes_, cutoff_position=cutoff_position, return_hex=return_hex)
+    # for compatibility with previously computed hash values: the hashed bytes are the raw image bytes, but with their
+    # beginning overwritten by the shape and dtype strings (this is how the original `io.BytesIO`-based implementation
+    # worked, because writing to a `BytesIO` object created with initial bytes starts at position zero)
+    prefix = str(image.shape).encode("utf-8") + str(image.dtype).encode("utf-8")
+    hash_ = hashlib.sha512(prefix)
+
+    # hash the raw data chunk-wise (without copying the full image, which matters for memory-mapped images)
+    skip_count = len(prefix)
+    for chunk in _iter_chunks(image=image):
+        if chunk.size == 0:
+            continue
+        chunk_bytes = memoryview(np.ascontiguousarray(chunk)).cast("B")
+        if skip_count > 0:
+            skip_count_chunk = min(skip_count, len(chunk_bytes))
+            chunk_bytes = chunk_bytes[skip_count_chunk:]
+            skip_count -= skip_count_chunk
+        hash_.update(chunk_bytes)
+    return _get_digest(hash_=hash_, cutoff_position=cutoff_position, return_hex=return_hex)
 
 
 def hash_image_any_row_order(image, cutoff_position=None, return_hex=True):
@@ -2,24 +2,33 @@
 This submodule provides functionality for low-level image input/output functions.
 """
 
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
 import functools
 import glob
 import itertools
+import json
 import operator
 import os
 import os.path
 import pathlib
+import struct
 import tempfile
+import threading
 import time
 import uuid
+import zipfile
 
 import cv2
 import numpy as np
 
+import dito.inspection
 import dito.utils
 
 
-def load(filename, color=None, np_kwargs=None, czi_kwargs=None):
+def load(filename, color=None, np_kwargs=None, czi_kwargs=None, mmap=False, reduce=None, max_size=None, roi=None, roi_pad_kwargs=None):
     """
     Load image from file given by `filename` and return NumPy array.
 
@@ -28,7 +37,31 @@ def load(filename, color=None, np_kwargs=None, czi_kwargs=None):
     via `numpy.load`).
 
     In addition, it can load ".czi" (Carl Zeiss Image) files, if the package
-    `pylibCZIrw` is installed.
+    `pylibCZIrw` is installed, and ".dia" image archives (see `ImageArchive`),
+    whose images are stacked along a new first axis.
+
+    If `mmap` is True, NumPy files are not read into memory, but memory-mapped
+    (read-only). This works for ".npy" files and for ".npz" files whose array
+    is stored uncompressed (e.g., saved via `numpy.savez`). For compressed
+    ".npz" files and all other file types, `mmap` has no effect.
+
+    If `reduce` or `max_size` is given, the image is loaded at a reduced
+    resolution (e.g., for previews). For files loaded via OpenCV, the reduced
+    decoding modes (`cv2.IMREAD_REDUCED_GRAYSCALE_2`, ...,
+    `cv2.IMREAD_REDUCED_COLOR_8`) are used if possible, which is much faster
+    than decoding the full image, especially for JPEG files. For `max_size`,
+    the largest reduction factor which still yields an image at least as
+    large as the requested size is used, and the result is resized exactly
+    via `dito.core.resize`. Images are never enlarged.
+
+    If `roi` is given, only the region of interest `(x, y, width, height)` is
+    returned. For ".npy" files (and uncompressed ".npz" files), only the
+    needed rows are read via memory-mapping, and for ".czi" files, only the
+    region of interest is read (see `LazyCziArray`). All other files are
+    loaded completely and cropped afterwards. Regions of interest which are
+    (partially) out of bounds are padded (as for `dito.core.PaddedImageIndexer`).
+    If `roi` is combined with `reduce` or `max_size`, the image is cropped
+    first and reduced afterwards.
 
     Parameters
     ----------
@@ -41,11 +74,25 @@ def load(filename, color=None, np_kwargs=None, czi_kwargs=None):
         Arguments to supply to `np.load` when loading NumPy files.
     czi_kwargs : dict
         Arguments to supply to `_load_czi` when loading ".czi" files.
+    mmap : bool, optional
+        Whether to memory-map NumPy files instead of reading them into memory. Default is False.
+    reduce : int or None, optional
+        If given, reduce the image width and height by this factor (one of 1, 2, 4, 8). Default is None.
+    max_size : int or tuple of int or None, optional
+        If given, downscale the image (preserving its aspect ratio) such that its size does not exceed `max_size`,
+        which is either a tuple `(max_width, max_height)` or a single int used for both. Default is None.
+    roi : tuple of int or None, optional
+        If given, the region of interest `(x, y, width, height)` to be returned. For stacks of images (".czi" and
+        ".dia" files), it applies to the Y and X axes of all images. Default is None.
+    roi_pad_kwargs : dict or None, optional
+        Arguments to supply to `np.pad` for regions of interest which are out of bounds (see
+        `dito.core.PaddedImageIndexer`). Default is None, which pads with zeros.
 
     Returns
     -------
     numpy.ndarray
-        The loaded image as a NumPy array.
+        The loaded image as a NumPy array (or as read-only `numpy.memmap` if `mmap` is True and the file type
+        supports it and the image is neither reduced nor cropped).
 
     Raises
     ------
@@ -71,6 +118,23 @@ def load(filename, color=None, np_kwargs=None, czi_kwargs=None):
     if not os.path.exists(filename):
         raise FileNotFoundError("Image file '{}' does not exist".format(filename))
 
+    # check reduction arguments
+    if (reduce is not None) and (max_size is not None):
+        raise ValueError("Only one of the arguments 'reduce' and 'max_size' can be given")
+    if (reduce is not None) and (reduce not in (1, 2, 4, 8)):
+        raise ValueError("Argument 'reduce' must be one of 1, 2, 4, 8, but is {}".format(reduce))
+    if max_size is not None:
+        max_size = dito.utils.get_validated_tuple(x=max_size, type_=int, count=2, min_value=1)
+    is_reduced = False
+    image_size = None
+
+    # check region of interest
+    if roi is not None:
+        roi = dito.utils.get_validated_tuple(x=roi, type_=int, count=4)
+        if (roi[2] < 0) or (roi[3] < 0):
+            raise ValueError("Width and height of the region of interest must not be negative, but the region of interest is {}".format(roi))
+    is_cropped = False
+
     # load image
     image = None
     extension = os.path.splitext(filename)[1].lower()
@@ -80,21 +144,41 @@ def load(filename, color=None, np_kwargs=None, czi_kwargs=None):
             raise ValueError("Argument 'color' must be 'None' for NumPy images, but is '{}'".format(color))
         if np_kwargs is None:
             np_kwargs = {}
+        if mmap or (roi is not None):
+            np_kwargs = {"mmap_mode": "r", **np_kwargs}
         image = np.load(file=filename, **np_kwargs)
     elif extension == ".npz":
         # use NumPy
-        if np_kwargs is None:
-            np_kwargs = {}
-        with np.load(file=filename, **np_kwargs) as npz_file:
-            npz_keys = tuple(npz_file.keys())
-            if len(npz_keys) != 1:
-                raise ValueError("Expected exactly one image in '{}', but got {} (keys: {})".format(filename, len(npz_keys), npz_keys))
-            image = npz_file[npz_keys[0]]
+        if mmap or (roi is not None):
+            image = _load_npz_mmap(filename=filename)
+        if image is None:
+            if np_kwargs is None:
+                np_kwargs = {}
+            with np.load(file=filename, **np_kwargs) as npz_file:
+                npz_keys = tuple(npz_file.keys())
+                if len(npz_keys) != 1:
+                    raise ValueError("Expected exactly one image in '{}', but got {} (keys: {})".format(filename, len(npz_keys), npz_keys))
+                image = npz_file[npz_keys[0]]
     elif extension == ".czi":
         # use pylibCZIrw
         if czi_kwargs is None:
             czi_kwargs = {}
-        image = _load_czi(filename=filename, **czi_kwargs)
+        if roi is None:
+            image = _load_czi(filename=filename, **czi_kwargs)
+        else:
+            # only read the region of interest
+            with LazyCziArray(filename=filename, **czi_kwargs) as czi_array:
+                (x_start, y_start, x_stop, y_stop) = _get_roi_bounds(roi=roi, width=czi_array.shape[-2], height=czi_array.shape[-3])
+                image = czi_array[..., y_start:y_stop, x_start:x_stop, :]
+            image = _pad_roi(image=image, roi=roi, x_start=x_start, y_start=y_start, axes=(-3, -2), pad_kwargs=roi_pad_kwargs)
+            is_cropped = True
+    elif extension == ImageArchive.EXTENSION:
+        # use dito image archive
+        with ImageArchive(filename=filename, mode="r") as archive:
+            images = [archive.get(index_or_key=index, color=color) for index in range(len(archive))]
+        if len(images) == 0:
+            raise ValueError("Image archive '{}' contains no images".format(filename))
+        image = np.stack(images, axis=0)
     else:
         # use OpenCV
         if (os.name == "nt") and not dito.utils.is_ascii(s=str(filename)):
@@ -109,6 +193,26 @@ def load(filename, color=None, np_kwargs=None, czi_kwargs=None):
             else:
                 # force gray/color mode
                 flags = cv2.IMREAD_ANYDEPTH | (cv2.IMREAD_COLOR if color else cv2.IMREAD_GRAYSCALE)
+
+            # use reduced decoding if possible (this needs the image size, which is parsed from the file header)
+            if ((reduce is not None) or (max_size is not None)) and (roi is None):
+                header = _probe_image_header(filename=filename)
+                if header is not None:
+                    (shape, _) = header
+                    image_size = (shape[1], shape[0])
+                    if color is None:
+                        # like `cv2.IMREAD_UNCHANGED`, ignore the EXIF orientation (which is applied for reduced decoding)
+                        orientation_flags = cv2.IMREAD_IGNORE_ORIENTATION
+                    else:
+                        # the EXIF orientation is applied (as for the full decoding) - the oriented image size is needed
+                        orientation_flags = 0
+                        if _probe_jpeg_orientation(filename=filename) in (5, 6, 7, 8):
+                            image_size = (shape[0], shape[1])
+                    reduce_flags = _get_reduce_flags(image_size=image_size, channel_count=shape[2] if (len(shape) == 3) else 1, color=color, reduce=reduce, max_size=max_size)
+                    if reduce_flags is not None:
+                        flags = cv2.IMREAD_ANYDEPTH | reduce_flags | orientation_flags
+                        is_reduced = True
+
             image = cv2.imread(filename=filename, flags=flags)
 
     # check if loading was successful
@@ -117,10 +221,486 @@ def load(filename, color=None, np_kwargs=None, czi_kwargs=None):
     if not isinstance(image, np.ndarray):
         raise TypeError("Image file '{}' exists, but has wrong type (expected object of type 'np.ndarray', but got '{}'".format(filename, type(image)))
 
+    # crop the region of interest (if not already done while loading)
+    if (roi is not None) and (not is_cropped):
+        axes = (1, 2) if (extension == ImageArchive.EXTENSION) else (0, 1)
+        if image.ndim < max(axes) + 1:
+            raise ValueError("Argument 'roi' is not supported for images of shape {}".format(image.shape))
+        (x_start, y_start, x_stop, y_stop) = _get_roi_bounds(roi=roi, width=image.shape[axes[1]], height=image.shape[axes[0]])
+        item = [slice(None)] * image.ndim
+        item[axes[0]] = slice(y_start, y_stop)
+        item[axes[1]] = slice(x_start, x_stop)
+        image = _pad_roi(image=image[tuple(item)], roi=roi, x_start=x_start, y_start=y_start, axes=axes, pad_kwargs=roi_pad_kwargs)
+
+    # reduce the image size (if not already done while decoding) and/or resize it to the exact target size
+    if (reduce is not None) or (max_size is not None):
+        if image.ndim not in (2, 3):
+            raise ValueError("Arguments 'reduce' and 'max_size' are only supported for 2D and 3D images, but the image has shape {}".format(image.shape))
+        if image_size is None:
+            image_size = dito.core.size(image=image)
+        if max_size is not None:
+            target_size = _get_max_size_target(image_size=image_size, max_size=max_size)
+        elif not is_reduced:
+            target_size = tuple(max(1, -(-value // reduce)) for value in image_size)
+        else:
+            target_size = None
+        if (target_size is not None) and (dito.core.size(image=image) != target_size):
+            image = dito.core.resize(image=image, scale_or_size=target_size)
+
     return image
 
 
-def _load_czi(filename, keep_singleton_dimensions=False, keep_all_dimensions=False):
+def _get_roi_bounds(roi, width, height):
+    """
+    Internal function used by `load`, which returns the bounds `(x_start, y_start, x_stop, y_stop)` of the part of the
+    region of interest `roi` which lies within an image of the given size.
+    """
+    (x, y, roi_width, roi_height) = roi
+    x_start = min(max(x, 0), width)
+    y_start = min(max(y, 0), height)
+    x_stop = max(min(x + roi_width, width), x_start)
+    y_stop = max(min(y + roi_height, height), y_start)
+    return (x_start, y_start, x_stop, y_stop)
+
+
+def _pad_roi(image, roi, x_start, y_start, axes, pad_kwargs):
+    """
+    Internal function used by `load`, which pads the in-bounds part `image` (starting at `(x_start, y_start)`) of the
+    region of interest `roi` to its full size via `dito.core.PaddedImageIndexer`.
+    """
+    (x, y, roi_width, roi_height) = roi
+    item = [slice(None)] * image.ndim
+    item[axes[0]] = slice(y - y_start, y - y_start + roi_height)
+    item[axes[1]] = slice(x - x_start, x - x_start + roi_width)
+    return dito.core.PaddedImageIndexer(image=image, pad_kwargs=pad_kwargs)[tuple(item)]
+
+
+def _get_max_size_target(image_size, max_size):
+    """
+    Internal function used by `load`, which returns the size `(width, height)` of an image of size `image_size` which
+    is downscaled (preserving its aspect ratio) to fit into `max_size`. Images are never enlarged.
+    """
+    (width, height) = image_size
+    scale = min(max_size[0] / width, max_size[1] / height, 1.0)
+    return (min(max_size[0], max(1, int(round(width * scale)))), min(max_size[1], max(1, int(round(height * scale)))))
+
+
+def _get_reduce_flags(image_size, channel_count, color, reduce, max_size):
+    """
+    Internal function used by `load`, which returns the OpenCV `cv2.IMREAD_REDUCED_*` flag to use, or None if reduced
+    decoding is not possible (e.g., for images with alpha channel if `color` is None) or not useful.
+    """
+    if color is None:
+        # there is no reduced mode which keeps the image "as is", so only use it if it gives the same channels
+        if channel_count == 1:
+            color = False
+        elif channel_count == 3:
+            color = True
+        else:
+            return None
+
+    if max_size is not None:
+        # largest reduction factor which yields an image which is not smaller than the target size
+        (target_width, target_height) = _get_max_size_target(image_size=image_size, max_size=max_size)
+        reduce = 1
+        for factor in (2, 4, 8):
+            if ((image_size[0] // factor) >= target_width) and ((image_size[1] // factor) >= target_height):
+                reduce = factor
+
+    if reduce == 1:
+        return None
+    if color:
+        return {2: cv2.IMREAD_REDUCED_COLOR_2, 4: cv2.IMREAD_REDUCED_COLOR_4, 8: cv2.IMREAD_REDUCED_COLOR_8}[reduce]
+    else:
+        return {2: cv2.IMREAD_REDUCED_GRAYSCALE_2, 4: cv2.IMREAD_REDUCED_GRAYSCALE_4, 8: cv2.IMREAD_REDUCED_GRAYSCALE_8}[reduce]
+
+
+def _load_npz_mmap(filename):
+    """
+    Memory-map the single array stored in the ".npz" file given by `filename`.
+
+    Internal function used by `load`. Memory-mapping is only possible if the array is stored uncompressed within the
+    ZIP archive (e.g., if the file was saved via `numpy.savez`, but not via `numpy.savez_compressed`). In this case, the
+    array data is mapped directly at its offset within the ZIP archive.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the ".npz" file.
+
+    Returns
+    -------
+    numpy.memmap or None
+        The memory-mapped array, or None if the array can not be memory-mapped (e.g., because it is compressed). In
+        the latter case, the caller should fall back to `numpy.load`.
+    """
+
+    with zipfile.ZipFile(filename, mode="r") as zip_file:
+        zip_infos = zip_file.infolist()
+    if (len(zip_infos) != 1) or (zip_infos[0].compress_type != zipfile.ZIP_STORED):
+        return None
+    zip_info = zip_infos[0]
+
+    with open(filename, "rb") as npz_file:
+        # the member data starts after the local file header (30 bytes), the member filename, and the extra field
+        npz_file.seek(zip_info.header_offset)
+        local_header = npz_file.read(30)
+        if (len(local_header) != 30) or (local_header[:4] != b"PK\x03\x04"):
+            return None
+        (filename_length, extra_length) = struct.unpack("<HH", local_header[26:30])
+        npz_file.seek(zip_info.header_offset + 30 + filename_length + extra_length)
+
+        # parse the header of the .npy member
+        version = np.lib.format.read_magic(npz_file)
+        if version == (1, 0):
+            (shape, fortran_order, dtype) = np.lib.format.read_array_header_1_0(npz_file)
+        elif version == (2, 0):
+            (shape, fortran_order, dtype) = np.lib.format.read_array_header_2_0(npz_file)
+        else:
+            return None
+        offset = npz_file.tell()
+
+    if dtype.hasobject:
+        return None
+
+    return np.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=shape, order="F" if fortran_order else "C")
+
+
+def load_lazy(filename, **kwargs):
+    """
+    Load image from file given by `filename` without reading NumPy files into memory.
+
+    This is a shortcut for `load(filename=filename, mmap=True, **kwargs)`: ".npy" files and uncompressed ".npz" files
+    are memory-mapped (read-only), so only the parts of the array which are actually accessed are read from disk. All
+    other file types are loaded as usual.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        Path of the image file to be loaded.
+    **kwargs
+        Additional keyword arguments passed to `load`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The loaded image (a read-only `numpy.memmap` for NumPy files which support memory-mapping).
+
+    See Also
+    --------
+    `dito.io.load` : The function used for loading.
+    """
+    return load(filename=filename, mmap=True, **kwargs)
+
+
+ProbeInfo = collections.namedtuple("ProbeInfo", ["shape", "dtype", "width", "height", "channel_count", "bit_depth", "decoded"])
+
+
+def probe(filename):
+    """
+    Return the shape and dtype (plus width, height, channel count and bit
+    depth) of the image which `load` would return for `filename`, without
+    decoding the image data if possible.
+
+    For PNG, JPEG, BMP and TIFF files, only the file header is parsed. For
+    ".npy" and ".npz" files, only the header of the (first) array is read (via
+    `numpy.lib.format`). For ".czi" files and ".dia" image archives, only the
+    metadata is read. If the header of a file can not be parsed or does not
+    determine the result of `load` unambiguously (e.g., BMP files with a color
+    palette), the image is loaded via `load` as fallback.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        Path of the image file.
+
+    Returns
+    -------
+    collections.namedtuple
+        A named tuple with the following fields:
+        - shape: the shape of the image (as returned by `load`)
+        - dtype: the dtype of the image (as returned by `load`)
+        - width: the image width (None if the image is not 2D or 3D)
+        - height: the image height (None if the image is not 2D or 3D)
+        - channel_count: the number of channels (None if the image is not 2D or 3D)
+        - bit_depth: the number of bits per value
+        - decoded: True if the image had to be loaded, False if the header was sufficient
+
+    Raises
+    ------
+    FileNotFoundError
+        If the specified file does not exist.
+
+    See Also
+    --------
+    `dito.io.load` : The function used as fallback.
+    """
+
+    if isinstance(filename, pathlib.Path):
+        filename = str(filename)
+
+    if not os.path.exists(filename):
+        raise FileNotFoundError("Image file '{}' does not exist".format(filename))
+
+    extension = os.path.splitext(filename)[1].lower()
+    result = None
+    try:
+        if extension == ".npy":
+            with open(filename, "rb") as f:
+                result = _probe_npy_header(f=f)
+        elif extension == ".npz":
+            with zipfile.ZipFile(filename, mode="r") as zip_file:
+                zip_infos = zip_file.infolist()
+                if len(zip_infos) == 1:
+                    # only the first bytes of the (possibly compressed) member are read
+                    with zip_file.open(zip_infos[0]) as f:
+                        result = _probe_npy_header(f=f)
+        elif extension == ".czi":
+            with LazyCziArray(filename=filename) as czi_array:
+                result = (czi_array.shape, czi_array.dtype)
+        elif extension == ImageArchive.EXTENSION:
+            with ImageArchive(filename=filename, mode="r") as archive:
+                shapes_dtypes = set((tuple(entry["shape"]), np.dtype(entry["dtype"])) for entry in archive.entries if entry["encoding"] == "raw")
+                if (len(archive) > 0) and (len(shapes_dtypes) == 1) and (len(archive.entries) == sum(1 for entry in archive.entries if entry["encoding"] == "raw")):
+                    (shape, dtype) = shapes_dtypes.pop()
+                    result = ((len(archive),) + shape, dtype)
+        else:
+            result = _probe_image_header(filename=filename)
+    except (ValueError, OSError, struct.error, zipfile.BadZipFile):
+        # the header is invalid or can not be parsed -> fall back to decoding
+        result = None
+
+    if result is None:
+        image = load(filename=filename)
+        (shape, dtype) = (image.shape, image.dtype)
+        decoded = True
+    else:
+        (shape, dtype) = result
+        decoded = False
+
+    shape = tuple(int(value) for value in shape)
+    dtype = np.dtype(dtype)
+    if len(shape) == 2:
+        (height, width, channel_count) = shape + (1,)
+    elif len(shape) == 3:
+        (height, width, channel_count) = shape
+    else:
+        (height, width, channel_count) = (None, None, None)
+    return ProbeInfo(shape=shape, dtype=dtype, width=width, height=height, channel_count=channel_count, bit_depth=8 * dtype.itemsize, decoded=decoded)
+
+
+def _probe_image_header(filename):
+    """
+    Internal function used by `probe` and `load`, which returns `(shape, dtype)` from the header of an image file
+    which is loaded via OpenCV, or None if the header is unknown, invalid, or ambiguous.
+    """
+    try:
+        with open(filename, "rb") as f:
+            magic = f.read(8)
+            f.seek(0)
+            if magic == b"\x89PNG\r\n\x1a\n":
+                return _probe_png_header(f=f)
+            elif magic[:2] == b"\xff\xd8":
+                return _probe_jpeg_header(f=f)
+            elif magic[:2] == b"BM":
+                return _probe_bmp_header(f=f)
+            elif magic[:4] in (b"II*\x00", b"MM\x00*"):
+                return _probe_tiff_header(f=f)
+    except (ValueError, OSError, struct.error):
+        pass
+    return None
+
+
+def _probe_npy_header(f):
+    """
+    Internal function used by `probe`, which returns `(shape, dtype)` from the header of a ".npy" file.
+    """
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        (shape, _, dtype) = np.lib.format.read_array_header_1_0(f)
+    elif version == (2, 0):
+        (shape, _, dtype) = np.lib.format.read_array_header_2_0(f)
+    else:
+        return None
+    return (shape, dtype)
+
+
+def _probe_png_header(f):
+    """
+    Internal function used by `probe`, which returns `(shape, dtype)` from the header of a PNG file as it would be
+    returned by `load` (i.e., OpenCV with `cv2.IMREAD_UNCHANGED`).
+    """
+    f.seek(8)
+    (length, chunk_type) = struct.unpack(">I4s", f.read(8))
+    if (chunk_type != b"IHDR") or (length < 13):
+        return None
+    (width, height, bit_depth, color_type) = struct.unpack(">IIBB", f.read(10))
+    f.seek(8 + 8 + length + 4)
+
+    # OpenCV adds an alpha channel to RGB and palette images if a tRNS chunk is present (which must precede IDAT)
+    has_trns = False
+    if color_type in (2, 3):
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                return None
+            (length, chunk_type) = struct.unpack(">I4s", chunk_header)
+            if chunk_type == b"tRNS":
+                has_trns = True
+                break
+            if chunk_type in (b"IDAT", b"IEND"):
+                break
+            f.seek(length + 4, os.SEEK_CUR)
+
+    channel_counts = {0: 1, 2: 4 if has_trns else 3, 3: 4 if has_trns else 3, 4: 4, 6: 4}
+    if color_type not in channel_counts:
+        return None
+    channel_count = channel_counts[color_type]
+    shape = (height, width) if (channel_count == 1) else (height, width, channel_count)
+    return (shape, np.uint16 if (bit_depth == 16) else np.uint8)
+
+
+def _probe_jpeg_header(f):
+    """
+    Internal function used by `probe`, which returns `(shape, dtype)` from the header of a JPEG file as it would be
+    returned by `load`.
+    """
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if (len(marker) < 2) or (marker[0] != 0xFF):
+            return None
+        while marker[1] == 0xFF:
+            # fill bytes
+            marker = marker[1:] + f.read(1)
+        marker_type = marker[1]
+        if (0xD0 <= marker_type <= 0xD7) or (marker_type == 0x01):
+            # markers without payload
+            continue
+        (length,) = struct.unpack(">H", f.read(2))
+        if marker_type in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+            # start of frame
+            (precision, height, width, component_count) = struct.unpack(">BHHB", f.read(6))
+            if (precision != 8) or (component_count not in (1, 3, 4)):
+                return None
+            # OpenCV converts CMYK (four components) to BGR
+            shape = (height, width) if (component_count == 1) else (height, width, 3)
+            return (shape, np.uint8)
+        if marker_type in (0xD9, 0xDA):
+            # end of image or start of scan before any frame header
+            return None
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _probe_jpeg_orientation(filename):
+    """
+    Internal function used by `load`, which returns the EXIF orientation (1 to 8) of a JPEG file, or 1 if the file is
+    not a JPEG file or has no (valid) orientation tag. Orientations 5 to 8 swap the width and height of the image.
+    """
+    try:
+        with open(filename, "rb") as f:
+            if f.read(2) != b"\xff\xd8":
+                return 1
+            while True:
+                marker = f.read(2)
+                if (len(marker) < 2) or (marker[0] != 0xFF) or (marker[1] in (0xD9, 0xDA)):
+                    # no APP1 segment before the start of scan
+                    return 1
+                (length,) = struct.unpack(">H", f.read(2))
+                if marker[1] != 0xE1:
+                    f.seek(length - 2, os.SEEK_CUR)
+                    continue
+                payload = f.read(length - 2)
+                if payload[:6] != b"Exif\x00\x00":
+                    continue
+
+                # the TIFF structure within the APP1 segment: search IFD0 for the orientation tag (0x0112)
+                tiff = payload[6:]
+                byte_order = "<" if (tiff[:2] == b"II") else ">"
+                (ifd_offset,) = struct.unpack(byte_order + "I", tiff[4:8])
+                (entry_count,) = struct.unpack(byte_order + "H", tiff[ifd_offset:(ifd_offset + 2)])
+                for n_entry in range(entry_count):
+                    entry_offset = ifd_offset + 2 + 12 * n_entry
+                    (tag, value_type, _, value) = struct.unpack(byte_order + "HHIH", tiff[entry_offset:(entry_offset + 10)])
+                    if (tag == 0x0112) and (value_type == 3) and (1 <= value <= 8):
+                        return value
+                return 1
+    except (OSError, struct.error):
+        return 1
+
+
+def _probe_bmp_header(f):
+    """
+    Internal function used by `probe`, which returns `(shape, dtype)` from the header of a BMP file as it would be
+    returned by `load`. Only 24-bit images are supported (for other bit counts, the result depends on the palette or
+    bit masks).
+    """
+    f.seek(14)
+    (header_size,) = struct.unpack("<I", f.read(4))
+    if header_size == 12:
+        (width, height, _, bit_count) = struct.unpack("<HHHH", f.read(8))
+    elif header_size >= 40:
+        (width, height, _, bit_count) = struct.unpack("<iiHH", f.read(12))
+    else:
+        return None
+    if bit_count != 24:
+        return None
+    return ((abs(height), width, 3), np.uint8)
+
+
+def _probe_tiff_header(f):
+    """
+    Internal function used by `probe`, which returns `(shape, dtype)` from the first IFD of a TIFF file as it would be
+    returned by `load`. Only the common cases (gray, RGB and RGBA images with unsigned integer or float samples) are
+    supported.
+    """
+    byte_order = "<" if (f.read(2) == b"II") else ">"
+    (_, ifd_offset) = struct.unpack(byte_order + "HI", f.read(6))
+    f.seek(ifd_offset)
+    (entry_count,) = struct.unpack(byte_order + "H", f.read(2))
+
+    # value types: SHORT and LONG
+    type_formats = {3: "H", 4: "I"}
+    tags = {}
+    for n_entry in range(entry_count):
+        (tag, value_type, count, value_bytes) = struct.unpack(byte_order + "HHI4s", f.read(12))
+        if value_type not in type_formats:
+            continue
+        value_format = type_formats[value_type]
+        value_size = struct.calcsize(value_format)
+        if count * value_size <= 4:
+            (value,) = struct.unpack(byte_order + value_format, value_bytes[:value_size])
+        else:
+            # the values are stored elsewhere, only the first one is needed
+            (value_offset,) = struct.unpack(byte_order + "I", value_bytes)
+            position = f.tell()
+            f.seek(value_offset)
+            (value,) = struct.unpack(byte_order + value_format, f.read(value_size))
+            f.seek(position)
+        tags[tag] = value
+
+    # ImageWidth, ImageLength, BitsPerSample, PhotometricInterpretation, SamplesPerPixel, SampleFormat
+    if (256 not in tags) or (257 not in tags):
+        return None
+    (width, height) = (tags[256], tags[257])
+    bits_per_sample = tags.get(258, 1)
+    photometric = tags.get(262, None)
+    samples_per_pixel = tags.get(277, 1)
+    sample_format = tags.get(339, 1)
+
+    dtypes = {(1, 8): np.uint8, (1, 16): np.uint16, (3, 32): np.float32, (3, 64): np.float64}
+    if (sample_format, bits_per_sample) not in dtypes:
+        return None
+    if (samples_per_pixel == 1) and (photometric in (0, 1)):
+        shape = (height, width)
+    elif (samples_per_pixel in (3, 4)) and (photometric == 2):
+        shape = (height, width, samples_per_pixel)
+    else:
+        return None
+    return (shape, dtypes[(sample_format, bits_per_sample)])
+
+
+def _load_czi(filename, keep_singleton_dimensions=False, keep_all_dimensions=False, worker_count=None):
     """
     Load a "*.czi" (Carl Zeiss Image) image from file given by `filename` and return NumPy array.
 
@@ -140,6 +720,8 @@ def _load_czi(filename, keep_singleton_dimensions=False, keep_all_dimensions=Fal
     keep_all_dimensions : bool
         If `True`, the final NumPy array will have all possible dimensions as defined in `pylibCZIrw.czi.CziReader.CZI_DIMS`.
         Dimensions not present in the CZI file will then be of size 1.
+    worker_count : int or None
+        Number of threads used to read the image planes concurrently. If `None` or 1, the planes are read serially.
 
     Returns
     -------
@@ -152,19 +734,87 @@ def _load_czi(filename, keep_singleton_dimensions=False, keep_all_dimensions=Fal
         If `pylibCZIrw` is not installed.
     ValueError
         If `keep_all_dimensions` is `True`, but `keep_singleton_dimensions` is not.
+
+    See Also
+    --------
+    `dito.io.LazyCziArray` : The class used for reading, which can also be used to read only parts of the image.
     """
+    with LazyCziArray(filename=filename, keep_singleton_dimensions=keep_singleton_dimensions, keep_all_dimensions=keep_all_dimensions, worker_count=worker_count) as czi_array:
+        return czi_array[...]
 
-    # only import on demand
-    import pylibCZIrw.czi
 
-    # check arguments
-    if keep_all_dimensions and (not keep_singleton_dimensions):
-        raise ValueError("Argument 'keep_all_dimensions' is True, but 'keep_singleton_dimensions' is not")
+class LazyCziArray():
+    """
+    Array-like, read-only view of a "*.czi" (Carl Zeiss Image) file, which reads the image data on demand.
+
+    In contrast to `load` (which reads all image planes of a CZI file into one NumPy array), this class only reads the
+    planes and regions of interest which are actually requested. It requires the package `pylibCZIrw` to be installed.
 
-    # be on the safe side and get all possible dimension names in the order defined by `pylibCZIrw.czi.CziReader.CZI_DIMS`
-    dim_names = tuple(dim_item[0] for dim_item in sorted(pylibCZIrw.czi.CziReader.CZI_DIMS.items(), key=operator.itemgetter(1)))
+    The array has the shape `(dim_1, dim_2, ..., dim_N, Y, X, channel_count)`, exactly as the array returned by `load`
+    for the same arguments (see `_load_czi`). It supports NumPy-like indexing via integers and slices, e.g.:
+    * `czi_array[3]` reads the fourth plane along the first extra dimension
+    * `czi_array[..., 100:200, 300:500, :]` reads a 200x100 tile from all planes
+    * `czi_array[...]` reads the full image (equivalent to `load`)
+
+    For regions of interest along the Y and X axes, only the corresponding tile is read from the file. Planes can also
+    be streamed one by one via `iter_planes`. If `worker_count` is larger than one, multiple planes are read
+    concurrently by a thread pool (each thread uses its own reader).
+
+    Example
+    -------
+    >>> with LazyCziArray("image.czi") as czi_array: # doctest: +SKIP
+    ...     for (indices, plane) in czi_array.iter_planes():
+    ...         print(indices, plane.shape)
+    """
+
+    def __init__(self, filename, keep_singleton_dimensions=False, keep_all_dimensions=False, worker_count=None):
+        """
+        Open the CZI file and determine the shape and dtype of the image.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            Path of the image file to be read.
+        keep_singleton_dimensions : bool
+            If `True`, keep dimensions even if their size is 1. See `_load_czi`.
+        keep_all_dimensions : bool
+            If `True`, use all possible dimensions as defined in `pylibCZIrw.czi.CziReader.CZI_DIMS`. See `_load_czi`.
+        worker_count : int or None
+            Number of threads used to read multiple image planes concurrently. If `None` or 1, the planes are read
+            serially.
+
+        Raises
+        ------
+        ImportError
+            If `pylibCZIrw` is not installed.
+        ValueError
+            If `keep_all_dimensions` is `True`, but `keep_singleton_dimensions` is not.
+        """
+
+        # only import on demand
+        import pylibCZIrw.czi
+
+        # check arguments
+        if keep_all_dimensions and (not keep_singleton_dimensions):
+            raise ValueError("Argument 'keep_all_dimensions' is True, but 'keep_singleton_dimensions' is not")
+
+        self.filename = str(filename)
+        self.worker_count = 1 if (worker_count is None) else worker_count
+        if self.worker_count < 1:
+            raise ValueError("Argument 'worker_count' must be at least 1, but is {}".format(self.worker_count))
+
+        # one reader per thread (plus one for the calling thread), all readers are closed via the exit stack
+        self._open_czi = pylibCZIrw.czi.open_czi
+        self._exit_stack = contextlib.ExitStack()
+        self._readers_lock = threading.Lock()
+        self._thread_local = threading.local()
+        self._executor = None
+
+        # be on the safe side and get all possible dimension names in the order defined by `pylibCZIrw.czi.CziReader.CZI_DIMS`
+        dim_names = tuple(dim_item[0] for dim_item in sorted(pylibCZIrw.czi.CziReader.CZI_DIMS.items(), key=operator.itemgetter(1)))
+
+        czi = self._get_reader()
 
-    with pylibCZIrw.czi.open_czi(str(filename)) as czi:
         # get the bounding box for all dimensions
         bbox = czi.total_bounding_box
 
@@ -193,30 +843,263 @@ def _load_czi(filename, keep_singleton_dimensions=False, keep_all_dimensions=Fal
             used_dim_names.append(dim_name)
             used_dim_sizes.append(dim_size)
 
-        # create all possible combinations for the indices of all dimensions
-        used_dim_indices = [tuple(range(used_dim_size)) for used_dim_size in used_dim_sizes]
-        index_product = itertools.product(*used_dim_indices)
+        self.dim_names = tuple(used_dim_names)
+        self.dim_sizes = tuple(used_dim_sizes)
+
+        # the X/Y offsets of the image within the CZI coordinate system
+        self.rect = czi.total_bounding_rectangle
+
+        # read a single pixel to get the dtype and the channel count
+        pixel = czi.read(roi=(self.rect.x, self.rect.y, 1, 1), plane=self._get_plane(indices=(0,) * len(self.dim_sizes)))
+        self.dtype = pixel.dtype
+        self.shape = self.dim_sizes + (self.rect.h, self.rect.w, pixel.shape[2])
+
+    def __enter__(self):
+        """
+        Enter the context.
+
+        Returns
+        -------
+        self
+            This object.
+        """
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        """
+        Exit the context and close the file.
+        """
+        self.close()
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self, dtype=None, copy=None):
+        image = self[...]
+        if dtype is not None:
+            image = image.astype(dtype)
+        return image
+
+    def __repr__(self):
+        return "{}(filename={}, shape={}, dtype={})".format(type(self).__name__, repr(self.filename), self.shape, self.dtype)
+
+    @property
+    def ndim(self):
+        """
+        The number of axes of the array.
+        """
+        return len(self.shape)
+
+    @property
+    def size(self):
+        """
+        The number of elements of the array.
+        """
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes which the full array would consume in memory.
+        """
+        return self.size * self.dtype.itemsize
+
+    def close(self):
+        """
+        Close all readers (and the thread pool, if used).
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._exit_stack.close()
+
+    def _get_reader(self):
+        """
+        Internal method which returns the reader of the current thread (and opens it, if needed).
+        """
+        reader = getattr(self._thread_local, "reader", None)
+        if reader is None:
+            with self._readers_lock:
+                reader = self._exit_stack.enter_context(self._open_czi(self.filename))
+            self._thread_local.reader = reader
+        return reader
+
+    def _get_plane(self, indices):
+        """
+        Internal method which converts a tuple of extra dimension indices into a plane dict for `pylibCZIrw`.
+        """
+        return {dim_name: index for (dim_name, index) in zip(self.dim_names, indices)}
+
+    def read_plane(self, indices, roi=None):
+        """
+        Read a single image plane (or a region of interest within it).
+
+        Parameters
+        ----------
+        indices : tuple of int
+            The indices of the plane along the extra dimensions (one index for each entry of `dim_names`).
+        roi : tuple of int or None
+            Region of interest `(x, y, width, height)` within the plane. It must lie within the image bounds. If
+            `None`, the full plane is read.
+
+        Returns
+        -------
+        numpy.ndarray
+            The image plane (or the region of interest) of shape `(Y, X, channel_count)`.
+
+        Raises
+        ------
+        ValueError
+            If the number of indices is wrong or if the region of interest is out of bounds.
+        """
+        indices = tuple(indices)
+        if len(indices) != len(self.dim_sizes):
+            raise ValueError("Expected {} plane indices (for dimensions '{}'), but got {}".format(len(self.dim_sizes), "".join(self.dim_names), len(indices)))
+
+        if roi is None:
+            roi = (0, 0, self.rect.w, self.rect.h)
+        (x, y, width, height) = roi
+        if (x < 0) or (y < 0) or (width < 1) or (height < 1) or (x + width > self.rect.w) or (y + height > self.rect.h):
+            raise ValueError("Invalid region of interest {} for image of size {}".format(roi, (self.rect.w, self.rect.h)))
+
+        return self._get_reader().read(roi=(self.rect.x + x, self.rect.y + y, width, height), plane=self._get_plane(indices=indices))
+
+    def _iter_read_planes(self, indicess, roi):
+        """
+        Internal method which reads the planes given by `indicess` (in order), concurrently if `worker_count` > 1.
+        """
+        if self.worker_count == 1:
+            for indices in indicess:
+                yield self.read_plane(indices=indices, roi=roi)
+            return
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.worker_count, thread_name_prefix="dito.czi")
+
+        # bounded read-ahead, such that streaming consumers do not need to keep all planes in memory
+        indicess = iter(indicess)
+        pending_futures = collections.deque()
+        try:
+            for indices in itertools.islice(indicess, 2 * self.worker_count):
+                pending_futures.append(self._executor.submit(self.read_plane, indices=indices, roi=roi))
+            while len(pending_futures) > 0:
+                future = pending_futures.popleft()
+                for indices in itertools.islice(indicess, 1):
+                    pending_futures.append(self._executor.submit(self.read_plane, indices=indices, roi=roi))
+                yield future.result()
+        finally:
+            for future in pending_futures:
+                future.cancel()
+
+    def iter_planes(self, roi=None):
+        """
+        Iterate over all image planes (or regions of interest within them) and yield them one by one.
+
+        Parameters
+        ----------
+        roi : tuple of int or None
+            Region of interest `(x, y, width, height)` within each plane. See `read_plane`.
+
+        Yields
+        ------
+        tuple
+            A tuple `(indices, plane)`, where `indices` are the indices of the plane along the extra dimensions and
+            `plane` is the image plane of shape `(Y, X, channel_count)`.
+        """
+        indicess = list(itertools.product(*(range(dim_size) for dim_size in self.dim_sizes)))
+        for (indices, plane) in zip(indicess, self._iter_read_planes(indicess=indicess, roi=roi)):
+            yield (indices, plane)
+
+    def __getitem__(self, item):
+        """
+        Read the part of the image specified by `item` and return it as NumPy array.
+
+        Parameters
+        ----------
+        item : int or slice or ellipsis or tuple thereof
+            NumPy-like index. Advanced indexing (via arrays or lists) and `np.newaxis` are not supported.
+
+        Returns
+        -------
+        numpy.ndarray
+            The requested part of the image.
 
-        # for each index combination ("plane"), ...
-        combined_image = None
-        for indices in index_product:
-            # ... get the image plane for the current index combination
-            plane = {}
-            for (used_dim_name, index) in zip(used_dim_names, indices):
-                plane[used_dim_name] = index
-            image = czi.read(plane=plane)
+        Raises
+        ------
+        IndexError
+            If an index is out of bounds or if too many indices are given.
+        TypeError
+            If an index is of an unsupported type.
+        """
+        if not isinstance(item, tuple):
+            item = (item,)
+
+        # replace the ellipsis (if any) by full slices
+        ellipsis_positions = [n_index for (n_index, index) in enumerate(item) if index is Ellipsis]
+        if len(ellipsis_positions) > 1:
+            raise IndexError("An index can only have a single ellipsis ('...')")
+        elif len(ellipsis_positions) == 1:
+            ellipsis_position = ellipsis_positions[0]
+            item = item[:ellipsis_position] + (slice(None),) * (self.ndim - len(item) + 1) + item[(ellipsis_position + 1):]
+        if len(item) > self.ndim:
+            raise IndexError("Too many indices ({}) for array with {} axes".format(len(item), self.ndim))
+        item = item + (slice(None),) * (self.ndim - len(item))
+
+        # convert each index of the extra dimensions and of the Y and X axes into a range
+        ranges = []
+        for (n_axis, index) in enumerate(item[:-1]):
+            axis_size = self.shape[n_axis]
+            if isinstance(index, (int, np.integer)):
+                index = int(index)
+                if not (-axis_size <= index < axis_size):
+                    raise IndexError("Index {} is out of bounds for axis {} with size {}".format(index, n_axis, axis_size))
+                index = index % axis_size
+                ranges.append(range(index, index + 1))
+            elif isinstance(index, slice):
+                ranges.append(range(*index.indices(axis_size)))
+            else:
+                raise TypeError("Unsupported index type '{}' for axis {} (only integers and slices are supported)".format(type(index).__name__, n_axis))
+        channel_index = item[-1]
+        extra_ranges = ranges[:-2]
+        (y_range, x_range) = ranges[-2:]
+
+        # determine the tile to read and the indices within that tile
+        tile_indices = []
+        roi = []
+        for axis_range in (x_range, y_range):
+            if len(axis_range) == 0:
+                tile_indices.append(slice(0, 0))
+                roi += [0, 1]
+                continue
+            axis_min = min(axis_range[0], axis_range[-1])
+            axis_max = max(axis_range[0], axis_range[-1])
+            roi += [axis_min, axis_max - axis_min + 1]
+            if axis_range.step == 1:
+                tile_indices.append(slice(None))
+            else:
+                tile_indices.append(np.array(axis_range) - axis_min)
+        (x_tile_index, y_tile_index) = tile_indices
+        roi = (roi[0], roi[2], roi[1], roi[3])
 
-            # use the first plane image to get the correct shape and dtype of the final NumPy array
-            if combined_image is None:
-                combined_image = np.zeros(shape=tuple(used_dim_sizes) + image.shape, dtype=image.dtype)
+        def postprocess(tile):
+            tile = tile[y_tile_index, ...]
+            tile = tile[:, x_tile_index, ...]
+            return tile[:, :, channel_index]
 
-            # insert the image plane into the final NumPy array
-            combined_image[indices + (slice(None), slice(None), slice(None))] = image
+        # read all planes
+        tile_shape = postprocess(np.zeros(shape=(roi[3], roi[2], self.shape[-1]), dtype=self.dtype)).shape
+        image = np.zeros(shape=tuple(len(extra_range) for extra_range in extra_ranges) + tile_shape, dtype=self.dtype)
+        if image.size > 0:
+            out_indicess = list(itertools.product(*(range(len(extra_range)) for extra_range in extra_ranges)))
+            indicess = list(itertools.product(*extra_ranges))
+            for (out_indices, tile) in zip(out_indicess, self._iter_read_planes(indicess=indicess, roi=roi)):
+                image[out_indices] = postprocess(tile)
 
-    return combined_image
+        # remove the axes which were indexed by integers
+        return image[tuple(0 if isinstance(index, (int, np.integer)) else slice(None) for index in item[:-1])]
 
 
-def load_multiple_iter(*args, color=None):
+def load_multiple_iter(*args, color=None, reduce=None, max_size=None):
     """
     Iterator that loads all images whose filenames match a specified glob pattern.
 
@@ -226,61 +1109,210 @@ def load_multiple_iter(*args, color=None):
         Arguments that, when joined with `os.path.join`, give the file pattern of the images to load.
     color : bool or None, optional
         Whether to load the images as color (True), grayscale (False), or as is (None). Default is None. See `load`.
+    reduce : int or None, optional
+        If given, reduce the image width and height by this factor. Default is None. See `load`.
+    max_size : int or tuple of int or None, optional
+        If given, downscale the images such that their size does not exceed `max_size`. Default is None. See `load`.
 
     Yields
     ------
     numpy.ndarray
         The loaded image as a NumPy array.
     """
-    filename_pattern = os.path.join(*args)
-    filenames = sorted(glob.glob(filename_pattern))
-    for filename in filenames:
-        image = load(filename=filename, color=color)
+    for filename in _get_multiple_filenames(*args):
+        image = load(filename=filename, color=color, reduce=reduce, max_size=max_size)
         yield image
 
 
-def load_multiple(*args, color=None):
+def _get_multiple_filenames(*args):
     """
-    Load all images whose filenames match a specified glob pattern.
+    Return the sorted list of all filenames which match a specified glob pattern.
+
+    Internal function used by `load_multiple_iter` and related functions.
 
     Parameters
     ----------
     *args : str
-        Arguments that, when joined with `os.path.join`, give the file pattern of the images to load.
-    color : bool or None, optional
-        Whether to load the images as color (True), grayscale (False), or as is (None). Default is None. See `load`.
+        Arguments that, when joined with `os.path.join`, give the file pattern.
 
     Returns
     -------
-    list of numpy.ndarray
-        A list of NumPy arrays, each corresponding to an image that was loaded.
+    list of str
+        The sorted filenames.
     """
-    return list(load_multiple_iter(*args, color=color))
+    filename_pattern = os.path.join(*args)
+    return sorted(glob.glob(filename_pattern))
 
 
-def save(filename, image, mkdir=True, imwrite_params=None, np_kwargs=None, czi_kwargs=None):
+def load_multiple_prefetch_iter(*args, color=None, worker_count=None, prefetch_count=None, ordered=True, errors="raise", return_filenames=False, transform=None, filenames=None):
     """
-    Save a NumPy array `image` as an image file at `filename`.
-
-    Supported file formats are those supported by OpenCV (via `cv2.imwrite`,
-    e.g., ".jpg", ".png", ".tif", etc.) and uncompressed or compressed NumPy
-    binary files (via `numpy.save` for ".npy" or via `np.savez_compressed` for
-    ".npz").
-
-    In addition, it can save ".czi" (Carl Zeiss Image) files, if the package
-    `pylibCZIrw` is installed.
+    Iterator that loads all images whose filenames match a specified glob pattern, using a thread pool for prefetching.
 
-    If `mkdir` is `True`, create the parent directories of the given filename
-    before saving the image.
+    This is a parallel counterpart of `load_multiple_iter`. Images are loaded in the background by a pool of
+    `worker_count` threads (this is efficient, since OpenCV releases the GIL during decoding). At most `prefetch_count`
+    images are loaded in advance, which bounds the memory consumption if the consumer is slower than the loading.
 
     Parameters
     ----------
-    filename : str or pathlib.Path
-        Path to the file where the image should be saved. The extension is used
-        to determine whether to use NumPy (".npy", ".npz") or OpenCV (any other
-        case).
-    image : numpy.ndarray
-        The image data to be saved.
+    *args : str
+        Arguments that, when joined with `os.path.join`, give the file pattern of the images to load.
+    color : bool or None, optional
+        Whether to load the images as color (True), grayscale (False), or as is (None). Default is None. See `load`.
+    worker_count : int or None, optional
+        Number of worker threads. If None (default), it is set to the number of CPU cores available.
+    prefetch_count : int or None, optional
+        Maximum number of images which are loaded (or being loaded) in advance. If None (default), it is set to twice
+        the number of worker threads.
+    ordered : bool, optional
+        If True (default), the images are yielded in the sorted order of their filenames (as for `load_multiple_iter`).
+        If False, the images are yielded as soon as they are loaded, which maximizes the throughput. In this case, it
+        is recommended to set `return_filenames` to True.
+    errors : str, optional
+        How to handle errors which occur while loading a single file:
+        - "raise" (default): re-raise the error when the corresponding image is due to be yielded
+        - "skip": silently skip the file
+        - "yield": yield the exception object instead of the image, and continue with the next file
+    return_filenames : bool, optional
+        If True, yield tuples `(filename, image)` instead of only the images. Default is False.
+    transform : callable or None, optional
+        If given, `transform(image)` is applied to each loaded image by the worker threads (e.g., color conversion or
+        resizing), and its result is yielded instead of the image. Errors raised by `transform` are handled according
+        to `errors`. Default is None.
+    filenames : list of str or None, optional
+        If given, load these files (in the given order) instead of the files matching the pattern given by `args`
+        (which must be empty then). Default is None.
+
+    Yields
+    ------
+    numpy.ndarray or Exception or tuple
+        The loaded image as a NumPy array (or the exception, if `errors` is "yield"). If `return_filenames` is True,
+        a tuple `(filename, image)` is yielded instead.
+
+    Raises
+    ------
+    ValueError
+        If any of the arguments `worker_count`, `prefetch_count`, or `errors` is invalid, or if both a pattern and
+        `filenames` are given.
+
+    See Also
+    --------
+    `load_multiple_iter` : The serial version of this function.
+    """
+
+    # check arguments
+    if worker_count is None:
+        worker_count = os.cpu_count() or 1
+    if worker_count < 1:
+        raise ValueError("Argument 'worker_count' must be at least 1, but is {}".format(worker_count))
+    if prefetch_count is None:
+        prefetch_count = 2 * worker_count
+    if prefetch_count < 1:
+        raise ValueError("Argument 'prefetch_count' must be at least 1, but is {}".format(prefetch_count))
+    if errors not in ("raise", "skip", "yield"):
+        raise ValueError("Invalid value '{}' for argument 'errors' (must be one of 'raise', 'skip', 'yield')".format(errors))
+    if filenames is None:
+        filenames = _get_multiple_filenames(*args)
+    elif len(args) > 0:
+        raise ValueError("Either a file pattern or the argument 'filenames' must be given, but not both")
+
+    filenames = iter(filenames)
+    pending_futures = collections.OrderedDict()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="dito.load")
+
+    def load_and_transform(filename):
+        # executed by the worker threads
+        image = load(filename=filename, color=color)
+        if transform is not None:
+            image = transform(image)
+        return image
+
+    def submit_next():
+        # submit the next file to the pool (returns False if there are no more files)
+        filename = next(filenames, None)
+        if filename is None:
+            return False
+        pending_futures[executor.submit(load_and_transform, filename)] = filename
+        return True
+
+    try:
+        # fill the read-ahead queue
+        while (len(pending_futures) < prefetch_count) and submit_next():
+            pass
+
+        while len(pending_futures) > 0:
+            # get the next finished future (in order or as soon as any is finished)
+            if ordered:
+                (future, filename) = pending_futures.popitem(last=False)
+            else:
+                (done_futures, _) = concurrent.futures.wait(pending_futures.keys(), return_when=concurrent.futures.FIRST_COMPLETED)
+                future = next(iter(done_futures))
+                filename = pending_futures.pop(future)
+
+            # refill the read-ahead queue before handing the result to the consumer
+            submit_next()
+
+            # get result or handle error
+            try:
+                result = future.result()
+            except Exception as e:
+                if errors == "raise":
+                    raise
+                elif errors == "skip":
+                    continue
+                else:
+                    result = e
+
+            if return_filenames:
+                yield (filename, result)
+            else:
+                yield result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def load_multiple(*args, color=None):
+    """
+    Load all images whose filenames match a specified glob pattern.
+
+    Parameters
+    ----------
+    *args : str
+        Arguments that, when joined with `os.path.join`, give the file pattern of the images to load.
+    color : bool or None, optional
+        Whether to load the images as color (True), grayscale (False), or as is (None). Default is None. See `load`.
+
+    Returns
+    -------
+    list of numpy.ndarray
+        A list of NumPy arrays, each corresponding to an image that was loaded.
+    """
+    return list(load_multiple_iter(*args, color=color))
+
+
+def save(filename, image, mkdir=True, imwrite_params=None, np_kwargs=None, czi_kwargs=None):
+    """
+    Save a NumPy array `image` as an image file at `filename`.
+
+    Supported file formats are those supported by OpenCV (via `cv2.imwrite`,
+    e.g., ".jpg", ".png", ".tif", etc.) and uncompressed or compressed NumPy
+    binary files (via `numpy.save` for ".npy" or via `np.savez_compressed` for
+    ".npz").
+
+    In addition, it can save ".czi" (Carl Zeiss Image) files, if the package
+    `pylibCZIrw` is installed, and ".dia" image archives (see `ImageArchive`),
+    where each item along the first axis of `image` is stored as one entry.
+
+    If `mkdir` is `True`, create the parent directories of the given filename
+    before saving the image.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        Path to the file where the image should be saved. The extension is used
+        to determine whether to use NumPy (".npy", ".npz") or OpenCV (any other
+        case).
+    image : numpy.ndarray
+        The image data to be saved.
     mkdir : bool, optional
         Whether to create the parent directories of the given filename if they
         do not exist. Default is True.
@@ -321,6 +1353,11 @@ def save(filename, image, mkdir=True, imwrite_params=None, np_kwargs=None, czi_k
         if czi_kwargs is None:
             czi_kwargs = {}
         _save_czi(filename=filename, image=image, **czi_kwargs)
+    elif extension == ImageArchive.EXTENSION:
+        # use dito image archive (one entry per item along the first axis)
+        with ImageArchive(filename=filename, mode="w", params=imwrite_params) as archive:
+            for item in image:
+                archive.append(image=item)
     else:
         # use OpenCV
         if (os.name == "nt") and not dito.utils.is_ascii(s=str(filename)):
@@ -482,6 +1519,280 @@ def save_tmp(image):
     return filename
 
 
+class BatchSaver():
+    """
+    Save many images concurrently via a thread pool (see `save`).
+
+    Main differences compared to calling `save` in a loop:
+    * the images are written by a pool of threads, `save` returns immediately (unless too many images are pending)
+    * parent directories are created only once per directory
+    * each image is first written to a temporary file in the target directory, which is then renamed to the final
+      filename, so that readers never see partially written files
+    * `imwrite_params` can be specified once per file extension (e.g., a fast PNG compression level)
+    * the number of written files and bytes and the throughput are tracked (see `get_stats` and `print_summary`)
+
+    Example
+    -------
+    >>> with BatchSaver(imwrite_params={".png": (cv2.IMWRITE_PNG_COMPRESSION, 1)}) as saver: # doctest: +SKIP
+    ...     for (n_frame, image) in enumerate(images):
+    ...         saver.save(filename="debug/{:06d}.png".format(n_frame), image=image)
+    ...     saver.print_summary()
+    """
+
+    Stats = collections.namedtuple("Stats", ["file_count", "byte_count", "duration", "pending_count"])
+
+    def __init__(self, worker_count=None, max_pending_count=None, atomic=True, mkdir=True, imwrite_params=None, np_kwargs=None, czi_kwargs=None):
+        """
+        Create a new `BatchSaver` instance.
+
+        Parameters
+        ----------
+        worker_count : int or None, optional
+            Number of threads used for writing. If None (default), it is set to the number of CPU cores available.
+        max_pending_count : int or None, optional
+            Maximum number of images which are waiting to be written (or are being written). If more images are
+            given, `save` blocks until there is space. This bounds the memory consumption. If None (default), it is set
+            to four times the number of worker threads.
+        atomic : bool, optional
+            If True (default), write each image to a temporary file first and rename it to the final filename.
+        mkdir : bool, optional
+            Whether to create the parent directories of the given filenames if they do not exist. Default is True.
+        imwrite_params : dict or None, optional
+            Dict which maps file extensions (e.g., ".png" or "png") to the value for the argument `params` of
+            `cv2.imwrite`. Default is None.
+        np_kwargs : dict or None, optional
+            Arguments to supply to `np.save`. See `save`.
+        czi_kwargs : dict or None, optional
+            Arguments to supply to `_save_czi`. See `save`.
+
+        Raises
+        ------
+        ValueError
+            If `worker_count` or `max_pending_count` is invalid.
+        """
+        if worker_count is None:
+            worker_count = os.cpu_count() or 1
+        if worker_count < 1:
+            raise ValueError("Argument 'worker_count' must be at least 1, but is {}".format(worker_count))
+        if max_pending_count is None:
+            max_pending_count = 4 * worker_count
+        if max_pending_count < 1:
+            raise ValueError("Argument 'max_pending_count' must be at least 1, but is {}".format(max_pending_count))
+
+        self.worker_count = worker_count
+        self.max_pending_count = max_pending_count
+        self.atomic = atomic
+        self.mkdir = mkdir
+        self.imwrite_params = {self._normalize_extension(extension): params for (extension, params) in (imwrite_params or {}).items()}
+        self.np_kwargs = np_kwargs
+        self.czi_kwargs = czi_kwargs
+
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.worker_count, thread_name_prefix="dito.save")
+        self.pending_futures = collections.deque()
+        self.created_dirnames = set()
+        self.lock = threading.Lock()
+        self.file_count = 0
+        self.byte_count = 0
+        self.time_start = None
+        self.time_end = None
+
+    def __enter__(self):
+        """
+        Enter the context.
+
+        Returns
+        -------
+        self
+            This object.
+        """
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        """
+        Exit the context and wait until all images are written.
+
+        Parameters
+        ----------
+        *args, **kwargs
+            Arguments passed to the `exit` function. These are ignored.
+        """
+        self.close()
+
+    @staticmethod
+    def _normalize_extension(extension):
+        """
+        Internal method which returns the given extension in lower case and with leading dot.
+        """
+        extension = extension.lower()
+        if not extension.startswith("."):
+            extension = "." + extension
+        return extension
+
+    def save(self, filename, image, imwrite_params=None):
+        """
+        Schedule `image` to be saved at `filename`.
+
+        The image is copied, so it can be modified by the caller afterwards. Errors which occur while writing are
+        raised by a later call of `save`, `flush`, or `close`.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            Path to the file where the image should be saved. See `save`.
+        image : numpy.ndarray
+            The image data to be saved.
+        imwrite_params : tuple or None, optional
+            If given, overrides the `imwrite_params` defined for the extension of `filename`.
+
+        Raises
+        ------
+        RuntimeError
+            If `image` is not a NumPy array.
+        """
+        if not isinstance(image, np.ndarray):
+            raise RuntimeError("Invalid image (type '{}')".format(type(image).__name__))
+        filename = str(filename)
+        if imwrite_params is None:
+            imwrite_params = self.imwrite_params.get(self._normalize_extension(os.path.splitext(filename)[1]), None)
+
+        # bound the number of pending images (this also raises errors of finished writes)
+        while len(self.pending_futures) >= self.max_pending_count:
+            self.pending_futures.popleft().result()
+        while (len(self.pending_futures) > 0) and self.pending_futures[0].done():
+            self.pending_futures.popleft().result()
+
+        if self.time_start is None:
+            self.time_start = time.time()
+        self.pending_futures.append(self.executor.submit(self._save, filename=filename, image=image.copy(), imwrite_params=imwrite_params))
+
+    def _save(self, filename, image, imwrite_params):
+        """
+        Internal method which is run by the worker threads to save a single image.
+        """
+        dirname = os.path.dirname(filename)
+        if self.mkdir and (dirname not in self.created_dirnames):
+            dito.utils.mkdir(dirname=dirname)
+            with self.lock:
+                self.created_dirnames.add(dirname)
+
+        if self.atomic:
+            # keep the extension, because it determines the file format
+            (basename, extension) = os.path.splitext(os.path.basename(filename))
+            temp_filename = os.path.join(dirname, ".{}.{}.tmp{}".format(basename, uuid.uuid4().hex, extension))
+            try:
+                save(filename=temp_filename, image=image, mkdir=False, imwrite_params=imwrite_params, np_kwargs=self.np_kwargs, czi_kwargs=self.czi_kwargs)
+                byte_count = os.path.getsize(temp_filename)
+                os.replace(temp_filename, filename)
+            except BaseException:
+                if os.path.exists(temp_filename):
+                    os.remove(temp_filename)
+                raise
+        else:
+            save(filename=filename, image=image, mkdir=False, imwrite_params=imwrite_params, np_kwargs=self.np_kwargs, czi_kwargs=self.czi_kwargs)
+            byte_count = os.path.getsize(filename)
+
+        with self.lock:
+            self.file_count += 1
+            self.byte_count += byte_count
+            self.time_end = time.time()
+
+    def flush(self):
+        """
+        Wait until all scheduled images are written.
+
+        Raises
+        ------
+        Exception
+            The first error which occurred while writing an image (if any).
+        """
+        while len(self.pending_futures) > 0:
+            self.pending_futures.popleft().result()
+
+    def close(self):
+        """
+        Wait until all scheduled images are written and shut down the thread pool.
+        """
+        try:
+            self.flush()
+        finally:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_stats(self):
+        """
+        Get statistics about the images written so far.
+
+        Returns
+        -------
+        collections.namedtuple
+            A named tuple with the following fields:
+            - file_count: number of written files
+            - byte_count: number of written bytes
+            - duration: time in seconds between the first call of `save` and the end of the last finished write
+            - pending_count: number of images which are not written yet
+        """
+        with self.lock:
+            if (self.time_start is None) or (self.time_end is None):
+                duration = 0.0
+            else:
+                duration = self.time_end - self.time_start
+            return self.Stats(
+                file_count=self.file_count,
+                byte_count=self.byte_count,
+                duration=duration,
+                pending_count=sum(1 for future in self.pending_futures if not future.done()),
+            )
+
+    def print_summary(self, file=None):
+        """
+        Print a summary of the written images (count, bytes, throughput) to the given file object or to the console.
+
+        Parameters
+        ----------
+        file : file object, optional
+            The file object to which the summary should be written. Default is None, meaning stdout.
+        """
+        stats = self.get_stats()
+        duration = max(stats.duration, 1e-9)
+        rows = [
+            ["Written", ""],
+            ["..Files", stats.file_count],
+            ["..Bytes", dito.utils.human_bytes(byte_count=stats.byte_count)],
+            ["..Pending", stats.pending_count],
+            ["Throughput", ""],
+            ["..Duration", "{:.2f} s".format(stats.duration)],
+            ["..Files/s", "{:.2f}".format(stats.file_count / duration)],
+            ["..MB/s", "{:.2f}".format(stats.byte_count / duration / 1e6)],
+        ]
+        dito.utils.ptable(rows=rows, print_kwargs={"file": file})
+
+
+def save_many(filenames, images, worker_count=None, atomic=True, mkdir=True, imwrite_params=None, np_kwargs=None, czi_kwargs=None):
+    """
+    Save each image of `images` at the corresponding filename of `filenames`,
+    using a thread pool.
+
+    This is a convenience wrapper around `BatchSaver`, see there for details.
+
+    Parameters
+    ----------
+    filenames : iterable of str or pathlib.Path
+        Paths to the files where the images should be saved.
+    images : iterable of numpy.ndarray
+        The images to be saved.
+    worker_count, atomic, mkdir, imwrite_params, np_kwargs, czi_kwargs
+        See `BatchSaver`.
+
+    Returns
+    -------
+    collections.namedtuple
+        The statistics of the written files (see `BatchSaver.get_stats`).
+    """
+    with BatchSaver(worker_count=worker_count, atomic=atomic, mkdir=mkdir, imwrite_params=imwrite_params, np_kwargs=np_kwargs, czi_kwargs=czi_kwargs) as saver:
+        for (filename, image) in zip(filenames, images):
+            saver.save(filename=filename, image=image)
+    return saver.get_stats()
+
+
 def encode(image, extension="png", params=None):
     """
     Encode the given `image` into a byte array which contains the same bytes
@@ -529,9 +1840,13 @@ def decode(b, color=None):
     The byte array should contain the *encoded* image data, which can be obtained
     with the `encode` function or by loading the raw bytes of an image file.
 
+    Any bytes-like object (e.g., `bytes`, `bytearray`, `memoryview`, or a
+    contiguous NumPy array) is accepted. Its buffer is used directly, so there
+    is no need to convert it to `bytes` first (which would copy the data).
+
     Parameters
     ----------
-    b : bytes
+    b : bytes-like
         The byte array containing the encoded image data.
     color : bool or None, optional
         Whether to load the image as color (True), grayscale (False), or as is (None). Default is None. See `load`.
@@ -546,19 +1861,669 @@ def decode(b, color=None):
     `cv2.imdecode` : OpenCV function used for the decoding.
     """
 
-    # byte array -> NumPy array
-    buf = np.frombuffer(b, dtype=np.uint8)
+    # byte array -> NumPy array (without copying the data)
+    buf = np.frombuffer(b, dtype=np.uint8)
+
+    # flags - select grayscale or color mode
+    if color is None:
+        flags = cv2.IMREAD_UNCHANGED
+    else:
+        flags = cv2.IMREAD_ANYDEPTH | (cv2.IMREAD_COLOR if color else cv2.IMREAD_GRAYSCALE)
+
+    # read image
+    image = cv2.imdecode(buf=buf, flags=flags)
+
+    return image
+
+
+def _thread_map(func, items, worker_count):
+    """
+    Internal helper which returns `[func(item) for item in items]`, computed by a thread pool with `worker_count`
+    threads (or serially, if `worker_count` is 1).
+    """
+    items = list(items)
+    if worker_count is None:
+        worker_count = os.cpu_count() or 1
+    if worker_count < 1:
+        raise ValueError("Argument 'worker_count' must be at least 1, but is {}".format(worker_count))
+
+    worker_count = min(worker_count, len(items))
+    if worker_count <= 1:
+        return [func(item) for item in items]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="dito.io") as executor:
+        return list(executor.map(func, items))
+
+
+def encode_many(images, extension="png", params=None, worker_count=None):
+    """
+    Encode multiple images concurrently (see `encode`) and return the results
+    in the same order.
+
+    OpenCV releases the GIL while encoding, so the images are encoded by a
+    thread pool.
+
+    Parameters
+    ----------
+    images : iterable of numpy.ndarray
+        The images to be encoded.
+    extension : str, optional
+        The file extension to use for encoding the images. Default is "png".
+        See `encode`.
+    params : int or None, optional
+        Parameters to pass to the encoder. Default is None. See `encode`.
+    worker_count : int or None, optional
+        Number of threads to use. If None, the number of CPU cores is used.
+        Default is None.
+
+    Returns
+    -------
+    list of bytes
+        The encoded images, in the same order as `images`.
+
+    See Also
+    --------
+    `encode` : Function used to encode each image.
+    `decode_many` : The inverse function.
+    """
+    return _thread_map(func=functools.partial(encode, extension=extension, params=params), items=images, worker_count=worker_count)
+
+
+def decode_many(bs, color=None, worker_count=None):
+    """
+    Decode multiple images concurrently (see `decode`) and return the results
+    in the same order.
+
+    OpenCV releases the GIL while decoding, so the images are decoded by a
+    thread pool. As for `decode`, the items of `bs` can be any bytes-like
+    objects (e.g., `bytes`, `bytearray`, `memoryview`), which are not copied.
+
+    Parameters
+    ----------
+    bs : iterable of bytes-like
+        The byte arrays containing the encoded image data.
+    color : bool or None, optional
+        Whether to load the images as color (True), grayscale (False), or as
+        is (None). Default is None. See `load`.
+    worker_count : int or None, optional
+        Number of threads to use. If None, the number of CPU cores is used.
+        Default is None.
+
+    Returns
+    -------
+    list of numpy.ndarray
+        The decoded images, in the same order as `bs`.
+
+    See Also
+    --------
+    `decode` : Function used to decode each image.
+    `encode_many` : The inverse function.
+    """
+    return _thread_map(func=functools.partial(decode, color=color), items=bs, worker_count=worker_count)
+
+
+#
+# asyncio interface
+#
+
+
+async def _run_in_executor(executor, func, *args, **kwargs):
+    """
+    Internal helper which runs `func(*args, **kwargs)` in `executor` (or in the default executor of the running event
+    loop if `executor` is None) and returns its result.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+async def aload(filename, color=None, np_kwargs=None, czi_kwargs=None, mmap=False, executor=None):
+    """
+    Coroutine version of `load`, which loads the image in an executor without blocking the event loop.
+
+    Parameters
+    ----------
+    filename, color, np_kwargs, czi_kwargs, mmap
+        See `load`.
+    executor : concurrent.futures.Executor or None, optional
+        The executor in which `load` is run. If None, the default executor of the running event loop is used (see
+        `asyncio.loop.set_default_executor`). Default is None.
+
+    Returns
+    -------
+    numpy.ndarray
+        The loaded image.
+    """
+    return await _run_in_executor(executor, load, filename=filename, color=color, np_kwargs=np_kwargs, czi_kwargs=czi_kwargs, mmap=mmap)
+
+
+async def asave(filename, image, mkdir=True, imwrite_params=None, np_kwargs=None, czi_kwargs=None, executor=None):
+    """
+    Coroutine version of `save`, which saves the image in an executor without blocking the event loop.
+
+    Parameters
+    ----------
+    filename, image, mkdir, imwrite_params, np_kwargs, czi_kwargs
+        See `save`.
+    executor : concurrent.futures.Executor or None, optional
+        The executor in which `save` is run. If None, the default executor of the running event loop is used. Default
+        is None.
+    """
+    return await _run_in_executor(executor, save, filename=filename, image=image, mkdir=mkdir, imwrite_params=imwrite_params, np_kwargs=np_kwargs, czi_kwargs=czi_kwargs)
+
+
+async def aencode(image, extension="png", params=None, executor=None):
+    """
+    Coroutine version of `encode`, which encodes the image in an executor without blocking the event loop.
+
+    Parameters
+    ----------
+    image, extension, params
+        See `encode`.
+    executor : concurrent.futures.Executor or None, optional
+        The executor in which `encode` is run. If None, the default executor of the running event loop is used.
+        Default is None.
+
+    Returns
+    -------
+    bytes
+        A byte array which contains the encoded image data.
+    """
+    return await _run_in_executor(executor, encode, image=image, extension=extension, params=params)
+
+
+async def adecode(b, color=None, executor=None):
+    """
+    Coroutine version of `decode`, which decodes the image in an executor without blocking the event loop.
+
+    Parameters
+    ----------
+    b, color
+        See `decode`.
+    executor : concurrent.futures.Executor or None, optional
+        The executor in which `decode` is run. If None, the default executor of the running event loop is used.
+        Default is None.
+
+    Returns
+    -------
+    numpy.ndarray
+        The decoded image.
+    """
+    return await _run_in_executor(executor, decode, b=b, color=color)
+
+
+async def aload_multiple_iter(*args, color=None, prefetch_count=None, ordered=True, return_filenames=False, executor=None):
+    """
+    Asynchronous iterator that loads all images whose filenames match a specified glob pattern.
+
+    This is the asyncio counterpart of `load_multiple_iter`. At most `prefetch_count` images are loaded concurrently
+    (or are waiting to be consumed), which bounds the memory consumption.
+
+    Parameters
+    ----------
+    *args : str
+        Arguments that, when joined with `os.path.join`, give the file pattern of the images to load.
+    color : bool or None, optional
+        Whether to load the images as color (True), grayscale (False), or as is (None). Default is None. See `load`.
+    prefetch_count : int or None, optional
+        Maximum number of images which are loaded (or being loaded) concurrently. If None (default), it is set to
+        twice the number of CPU cores available.
+    ordered : bool, optional
+        If True (default), the images are yielded in the sorted order of their filenames. If False, the images are
+        yielded as soon as they are loaded.
+    return_filenames : bool, optional
+        If True, yield tuples `(filename, image)` instead of only the images. Default is False.
+    executor : concurrent.futures.Executor or None, optional
+        The executor in which `load` is run. If None, the default executor of the running event loop is used. Default
+        is None.
+
+    Yields
+    ------
+    numpy.ndarray or tuple
+        The loaded image as a NumPy array. If `return_filenames` is True, a tuple `(filename, image)` is yielded
+        instead.
+
+    Raises
+    ------
+    ValueError
+        If `prefetch_count` is invalid.
+
+    See Also
+    --------
+    `load_multiple_iter` : The synchronous version of this function.
+    `load_multiple_prefetch_iter` : The thread-based version of this function.
+
+    Example
+    -------
+    >>> async def count_images(): # doctest: +SKIP
+    ...     return len([image async for image in aload_multiple_iter("images", "*.png")])
+    """
+
+    # check arguments
+    if prefetch_count is None:
+        prefetch_count = 2 * (os.cpu_count() or 1)
+    if prefetch_count < 1:
+        raise ValueError("Argument 'prefetch_count' must be at least 1, but is {}".format(prefetch_count))
+
+    loop = asyncio.get_running_loop()
+    filenames = iter(_get_multiple_filenames(*args))
+    pending_futures = collections.OrderedDict()
+
+    def submit_next():
+        # submit the next file to the executor (returns False if there are no more files)
+        filename = next(filenames, None)
+        if filename is None:
+            return False
+        future = loop.run_in_executor(executor, functools.partial(load, filename=filename, color=color))
+        pending_futures[future] = filename
+        return True
+
+    try:
+        while (len(pending_futures) < prefetch_count) and submit_next():
+            pass
+
+        while len(pending_futures) > 0:
+            if ordered:
+                (future, filename) = pending_futures.popitem(last=False)
+                await asyncio.wait([future])
+            else:
+                (done_futures, _) = await asyncio.wait(pending_futures.keys(), return_when=asyncio.FIRST_COMPLETED)
+                future = next(iter(done_futures))
+                filename = pending_futures.pop(future)
+
+            submit_next()
+
+            image = future.result()
+            if return_filenames:
+                yield (filename, image)
+            else:
+                yield image
+    finally:
+        for future in pending_futures:
+            future.cancel()
+
+
+class ImageArchive():
+    """
+    Append-only container file (extension ".dia", "dito image archive") which stores many images with random access.
+
+    Each image is stored as encoded image data (e.g., PNG or JPEG, see `encode`) or as raw array data. An index with
+    the offset, shape, dtype and (optional) key of each image is kept in memory, so any image can be accessed in O(1)
+    by its index (`archive[3]`) or key (`archive["crop_3"]`). For reading, the file is memory-mapped, i.e., only the
+    accessed images are read from disk, and raw images are returned as read-only views without copying.
+
+    File layout:
+    * file header: magic bytes `b"DITOARC1"`
+    * one record per image: magic bytes `b"DREC"`, the lengths of the metadata and of the payload (`"<IQ"`), the
+      metadata (JSON, padded such that the payload is 64-byte aligned), and the payload
+    * index footer (written by `close`): the index (JSON), its length (`"<Q"`) and magic bytes `b"DITOIDX1"`
+
+    If the footer is missing (e.g., because the writing process crashed), the index is rebuilt by scanning the record
+    headers when the file is opened. In append mode ("a"), the footer is removed when opening the file and re-written
+    when closing it.
+
+    Example
+    -------
+    >>> with ImageArchive("crops.dia", mode="w") as archive: # doctest: +SKIP
+    ...     for (n_crop, crop) in enumerate(crops):
+    ...         archive.append(image=crop, key="crop_{}".format(n_crop))
+    >>> with ImageArchive("crops.dia") as archive: # doctest: +SKIP
+    ...     image = archive["crop_3"]
+    """
+
+    EXTENSION = ".dia"
+    FILE_MAGIC = b"DITOARC1"
+    RECORD_MAGIC = b"DREC"
+    RECORD_STRUCT = struct.Struct("<IQ")
+    FOOTER_MAGIC = b"DITOIDX1"
+    FOOTER_STRUCT = struct.Struct("<Q")
+    ALIGNMENT = 64
+    ENCODINGS = ("auto", "png", "jpg", "raw")
+
+    def __init__(self, filename, mode="r", encoding="auto", params=None):
+        """
+        Open the archive file.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            Path of the archive file.
+        mode : str, optional
+            "r" (default) to read an existing archive, "w" to create a new (or truncate an existing) archive, or "a"
+            to append to an existing archive (which is created if it does not exist).
+        encoding : str, optional
+            Default encoding for appended images: "png", "jpg", "raw" (uncompressed array data), or "auto" (default),
+            which uses "png" for non-empty 8-bit and 16-bit images with 1, 3 or 4 channels and "raw" otherwise.
+        params : tuple or None, optional
+            Default encoder parameters for appended images (see `encode`). Default is None.
+
+        Raises
+        ------
+        ValueError
+            If `mode` or `encoding` is invalid, or if the file is not a valid archive.
+        FileNotFoundError
+            If the file does not exist and `mode` is "r".
+        """
+        if mode not in ("r", "w", "a"):
+            raise ValueError("Invalid mode '{}' (must be one of 'r', 'w', 'a')".format(mode))
+        if encoding not in self.ENCODINGS:
+            raise ValueError("Invalid encoding '{}' (must be one of {})".format(encoding, self.ENCODINGS))
+
+        self.filename = str(filename)
+        self.mode = mode
+        self.encoding = encoding
+        self.params = params
+
+        self.entries = []
+        self.key_to_index = {}
+        self.file = None
+        self.mmap = None
+
+        if (mode == "w") or ((mode == "a") and (not os.path.exists(self.filename))):
+            dito.utils.mkdir(dirname=os.path.dirname(self.filename))
+            self.file = open(self.filename, "w+b")
+            self.file.write(self.FILE_MAGIC)
+            self.end_offset = len(self.FILE_MAGIC)
+        else:
+            if not os.path.exists(self.filename):
+                raise FileNotFoundError("Archive file '{}' does not exist".format(self.filename))
+            self.file = open(self.filename, "rb" if (mode == "r") else "r+b")
+            try:
+                self._read_index()
+            except BaseException:
+                self.file.close()
+                raise
+            if mode == "a":
+                # remove the footer, it is re-written when closing the archive
+                self.file.truncate(self.end_offset)
+            self.file.seek(self.end_offset)
+
+    def __enter__(self):
+        """
+        Enter the context.
+
+        Returns
+        -------
+        self
+            This object.
+        """
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        """
+        Exit the context and close the archive.
+
+        Parameters
+        ----------
+        *args, **kwargs
+            Arguments passed to the `exit` function. These are ignored.
+        """
+        self.close()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.get(index)
+
+    def __getitem__(self, index_or_key):
+        return self.get(index_or_key)
+
+    def __contains__(self, key):
+        return key in self.key_to_index
+
+    def keys(self):
+        """
+        Return the keys of all images (None for images which were appended without key).
+
+        Returns
+        -------
+        list
+            The keys, in the order of the images in the archive.
+        """
+        return [entry["key"] for entry in self.entries]
+
+    def _read_index(self):
+        """
+        Internal method which reads the index from the footer (or rebuilds it by scanning the records).
+        """
+        file_size = os.path.getsize(self.filename)
+        self.file.seek(0)
+        if self.file.read(len(self.FILE_MAGIC)) != self.FILE_MAGIC:
+            raise ValueError("File '{}' is not a valid image archive".format(self.filename))
+
+        # try to read the index from the footer
+        footer_size = self.FOOTER_STRUCT.size + len(self.FOOTER_MAGIC)
+        if file_size >= len(self.FILE_MAGIC) + footer_size:
+            self.file.seek(file_size - footer_size)
+            footer = self.file.read(footer_size)
+            if footer[self.FOOTER_STRUCT.size:] == self.FOOTER_MAGIC:
+                (index_size,) = self.FOOTER_STRUCT.unpack(footer[:self.FOOTER_STRUCT.size])
+                self.end_offset = file_size - footer_size - index_size
+                self.file.seek(self.end_offset)
+                for entry in json.loads(self.file.read(index_size).decode("utf-8")):
+                    self._add_entry(entry=entry)
+                return
+
+        # no (valid) footer -> scan the record headers
+        offset = len(self.FILE_MAGIC)
+        record_header_size = len(self.RECORD_MAGIC) + self.RECORD_STRUCT.size
+        while offset + record_header_size <= file_size:
+            self.file.seek(offset)
+            record_header = self.file.read(record_header_size)
+            if record_header[:len(self.RECORD_MAGIC)] != self.RECORD_MAGIC:
+                break
+            (meta_size, payload_size) = self.RECORD_STRUCT.unpack(record_header[len(self.RECORD_MAGIC):])
+            payload_offset = offset + record_header_size + meta_size
+            if payload_offset + payload_size > file_size:
+                # incomplete record
+                break
+            entry = json.loads(self.file.read(meta_size).decode("utf-8"))
+            entry["offset"] = payload_offset
+            entry["size"] = payload_size
+            self._add_entry(entry=entry)
+            offset = payload_offset + payload_size
+        self.end_offset = offset
+
+    def _add_entry(self, entry):
+        """
+        Internal method which adds an entry to the in-memory index.
+        """
+        if entry["key"] is not None:
+            if entry["key"] in self.key_to_index:
+                raise ValueError("Key '{}' already exists in the archive".format(entry["key"]))
+            self.key_to_index[entry["key"]] = len(self.entries)
+        self.entries.append(entry)
+
+    def append(self, image, key=None, encoding=None, params=None):
+        """
+        Append an image to the archive.
+
+        Parameters
+        ----------
+        image : numpy.ndarray
+            The image to be stored.
+        key : str or None, optional
+            Optional unique key which can be used to access the image. Default is None.
+        encoding : str or None, optional
+            The encoding to use (see `__init__`). If None (default), the encoding of the archive is used.
+        params : tuple or None, optional
+            Encoder parameters (see `encode`). If None (default), the parameters of the archive are used.
+
+        Returns
+        -------
+        int
+            The index of the appended image.
+
+        Raises
+        ------
+        RuntimeError
+            If the archive was opened for reading only or the image could not be encoded.
+        TypeError
+            If `key` is neither a string nor None.
+        ValueError
+            If `key` already exists or `encoding` is invalid.
+        """
+        if self.mode == "r":
+            raise RuntimeError("Can't append images to an archive which was opened for reading only")
+        if (key is not None) and (not isinstance(key, str)):
+            raise TypeError("Argument 'key' must be a string or None, but is of type '{}'".format(type(key).__name__))
+        if (key is not None) and (key in self.key_to_index):
+            raise ValueError("Key '{}' already exists in the archive".format(key))
+
+        if encoding is None:
+            encoding = self.encoding
+        if params is None:
+            params = self.params
+        if encoding not in self.ENCODINGS:
+            raise ValueError("Invalid encoding '{}' (must be one of {})".format(encoding, self.ENCODINGS))
+        if encoding == "auto":
+            is_png_compatible = (image.size > 0) and (image.dtype in (np.uint8, np.uint16)) and ((image.ndim == 2) or ((image.ndim == 3) and (image.shape[2] in (1, 3, 4))))
+            encoding = "png" if is_png_compatible else "raw"
+
+        if encoding == "raw":
+            image = np.ascontiguousarray(image)
+            payload = memoryview(image).cast("B") if image.size > 0 else b""
+        else:
+            (success, array) = cv2.imencode(ext="." + encoding, img=image, params=params if (params is not None) else tuple())
+            if not success:
+                raise RuntimeError("Could not encode image of shape {} and dtype '{}' as '{}'".format(image.shape, image.dtype, encoding))
+            payload = array.data
+
+        # metadata, padded such that the payload is aligned
+        meta = {"key": key, "encoding": encoding, "shape": list(image.shape), "dtype": image.dtype.str}
+        meta_bytes = json.dumps(meta).encode("utf-8")
+        record_header_size = len(self.RECORD_MAGIC) + self.RECORD_STRUCT.size
+        padding_size = -(self.end_offset + record_header_size + len(meta_bytes)) % self.ALIGNMENT
+        meta_bytes += b" " * padding_size
+        payload_size = len(payload) if isinstance(payload, bytes) else payload.nbytes
+
+        self.file.seek(self.end_offset)
+        self.file.write(self.RECORD_MAGIC + self.RECORD_STRUCT.pack(len(meta_bytes), payload_size) + meta_bytes)
+        self.file.write(payload)
+
+        meta["offset"] = self.end_offset + record_header_size + len(meta_bytes)
+        meta["size"] = payload_size
+        self.end_offset = meta["offset"] + payload_size
+        self._add_entry(entry=meta)
+        return len(self.entries) - 1
+
+    def get_index(self, index_or_key):
+        """
+        Return the index of the image given by its index or key.
+
+        Parameters
+        ----------
+        index_or_key : int or str
+            The index (negative values count from the end) or the key of the image.
+
+        Returns
+        -------
+        int
+            The non-negative index of the image.
+
+        Raises
+        ------
+        KeyError
+            If the key does not exist.
+        IndexError
+            If the index is out of range.
+        """
+        if isinstance(index_or_key, str):
+            return self.key_to_index[index_or_key]
+        index = operator.index(index_or_key)
+        if index < 0:
+            index += len(self.entries)
+        if not (0 <= index < len(self.entries)):
+            raise IndexError("Index {} is out of range for archive with {} images".format(index_or_key, len(self.entries)))
+        return index
+
+    def get_info(self, index_or_key):
+        """
+        Return the index entry (key, encoding, shape, dtype, offset, size) of the image given by its index or key.
+
+        Parameters
+        ----------
+        index_or_key : int or str
+            The index or the key of the image.
+
+        Returns
+        -------
+        dict
+            A copy of the index entry.
+        """
+        return dict(self.entries[self.get_index(index_or_key)])
+
+    def get(self, index_or_key, color=None):
+        """
+        Return the image given by its index or key.
+
+        Parameters
+        ----------
+        index_or_key : int or str
+            The index or the key of the image.
+        color : bool or None, optional
+            Whether to decode the image as color (True), grayscale (False), or as is (None). Default is None. Must be
+            None for raw images.
+
+        Returns
+        -------
+        numpy.ndarray
+            The image. Raw images are read-only views of the memory-mapped file.
+
+        Raises
+        ------
+        ValueError
+            If `color` is not None for a raw image.
+        RuntimeError
+            If the image could not be decoded.
+        """
+        entry = self.entries[self.get_index(index_or_key)]
+        (offset, size) = (entry["offset"], entry["size"])
+        shape = tuple(entry["shape"])
+        dtype = np.dtype(entry["dtype"])
+
+        if size == 0:
+            buffer = np.zeros(shape=(0,), dtype=np.uint8)
+        else:
+            buffer = self._get_mmap(end_offset=offset + size)[offset:(offset + size)]
+
+        if entry["encoding"] == "raw":
+            if color is not None:
+                raise ValueError("Argument 'color' must be 'None' for raw images, but is '{}'".format(color))
+            return buffer.view(dtype).reshape(shape)
 
-    # flags - select grayscale or color mode
-    if color is None:
-        flags = cv2.IMREAD_UNCHANGED
-    else:
-        flags = cv2.IMREAD_ANYDEPTH | (cv2.IMREAD_COLOR if color else cv2.IMREAD_GRAYSCALE)
+        image = decode(b=buffer, color=color)
+        if image is None:
+            raise RuntimeError("Image {} of archive '{}' could not be decoded".format(index_or_key, self.filename))
+        return image
 
-    # read image
-    image = cv2.imdecode(buf=buf, flags=flags)
+    def _get_mmap(self, end_offset):
+        """
+        Internal method which returns a read-only memory map of the file which covers at least `end_offset` bytes.
+        """
+        if (self.mmap is None) or (self.mmap.size < end_offset):
+            self.file.flush()
+            self.mmap = np.memmap(self.filename, dtype=np.uint8, mode="r", shape=(self.end_offset,))
+            self.mmap.flags.writeable = False
+        return self.mmap
 
-    return image
+    def close(self):
+        """
+        Write the index footer (if the archive was opened for writing) and close the file.
+        """
+        if self.file is None:
+            return
+        try:
+            if self.mode != "r":
+                index_bytes = json.dumps(self.entries).encode("utf-8")
+                self.file.seek(self.end_offset)
+                self.file.write(index_bytes + self.FOOTER_STRUCT.pack(len(index_bytes)) + self.FOOTER_MAGIC)
+                self.file.truncate()
+        finally:
+            self.file.close()
+            self.file = None
+            self.mmap = None
 
 
 class CachedImageLoader():
@@ -568,6 +2533,17 @@ class CachedImageLoader():
     If `CachedImageLoader.load` is called with the same arguments again, the
     result is returned from cache and not loaded from disk.
 
+    By default, the cache is bounded by the number of cached images (via
+    `functools.lru_cache`). If `max_bytes` is given, a byte-budgeted cache is
+    used instead, which bounds the total memory of all cached images (via
+    `numpy.ndarray.nbytes`) and supports the eviction policies "lru" (least
+    recently used) and "lfu" (least frequently used). In this mode, cached
+    entries are invalidated when the modification time or size of the
+    corresponding file changes, and the returned images are read-only views of
+    the cached arrays, such that callers cannot corrupt the cache. The
+    byte-budgeted cache is thread-safe, so a single instance can be shared by
+    multiple threads.
+
     Notes
     -----
     The cache is only valid for the lifetime of the object. When the object is
@@ -579,20 +2555,51 @@ class CachedImageLoader():
     `dito.io.load` : The function that is wrapped by this class.
     """
 
-    def __init__(self, max_count=128):
+    CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize", "evictions", "invalidations", "maxbytes", "currbytes"])
+
+    def __init__(self, max_count=128, max_bytes=None, policy="lru", validate=True):
         """
         Create a new `CachedImageLoader` instance.
 
         Parameters
         ----------
-        max_count : int, optional
+        max_count : int or None, optional
             The maximum number of items that can be stored in the cache. This
-            defaults to 128.
+            defaults to 128. If `max_bytes` is given, it can be None (meaning
+            that the number of items is not bounded).
+        max_bytes : int or None, optional
+            If given, use a byte-budgeted cache which stores at most this many
+            bytes of image data. Images which are larger than `max_bytes` are
+            never cached. Default is None.
+        policy : str, optional
+            The eviction policy of the byte-budgeted cache, either "lru"
+            (default) or "lfu". Ignored if `max_bytes` is None.
+        validate : bool, optional
+            If True (default), check the modification time and size of the
+            file for each cache hit and reload the image if they changed.
+            Ignored if `max_bytes` is None.
+
+        Raises
+        ------
+        ValueError
+            If `policy` is invalid.
         """
-        # decorate here, because maxsize can be specified by the user
-        self.load = functools.lru_cache(maxsize=max_count, typed=True)(self.load)
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.validate = validate
+
+        if self.max_bytes is None:
+            # decorate here, because maxsize can be specified by the user
+            self.load = functools.lru_cache(maxsize=max_count, typed=True)(self.load)
+        else:
+            if self.policy not in ("lru", "lfu"):
+                raise ValueError("Invalid policy '{}' (must be 'lru' or 'lfu')".format(self.policy))
+            self.lock = threading.RLock()
+            self.entries = collections.OrderedDict()
+            self.clear_cache()
 
-    def load(self, filename, color=None):
+    def load(self, filename, color=None, reduce=None, max_size=None):
         """
         Load an image from the specified file and return it as a NumPy array.
 
@@ -607,17 +2614,103 @@ class CachedImageLoader():
             The path to the file containing the image to load.
         color : bool or None, optional
             Whether to load the image as color (True), grayscale (False), or as is (None). Default is None. See `load`.
+        reduce : int or None, optional
+            If given, reduce the image width and height by this factor. Default is None. See `load`.
+        max_size : int or tuple of int or None, optional
+            If given, downscale the image such that its size does not exceed `max_size`. Must be hashable (i.e., not
+            a list). Default is None. See `load`.
 
         Returns
         -------
         numpy.ndarray
-            The loaded image as a NumPy array.
+            The loaded image as a NumPy array. For the byte-budgeted cache, it
+            is a read-only view of the cached array (unless the image is larger
+            than `max_bytes` and thus not cached).
 
         See Also
         -----
         `dito.io.load` : The wrapped function used for image loading.
         """
-        return load(filename=filename, color=color)
+        if self.max_bytes is None:
+            return load(filename=filename, color=color, reduce=reduce, max_size=max_size)
+        else:
+            return self._load_byte_budgeted(filename=filename, color=color, reduce=reduce, max_size=max_size)
+
+    def _load_byte_budgeted(self, filename, color, reduce, max_size):
+        """
+        Internal method which implements `load` for the byte-budgeted cache.
+        """
+        key = (str(filename), color, reduce, max_size)
+        stat = self._get_file_stat(filename=filename) if self.validate else None
+
+        with self.lock:
+            entry = self.entries.get(key, None)
+            if (entry is not None) and self.validate and (entry["stat"] != stat):
+                # the file has changed since it was cached
+                self._remove_entry(key=key)
+                self.invalidations += 1
+                entry = None
+
+            if entry is not None:
+                # cache hit
+                self.hits += 1
+                entry["use_count"] += 1
+                self.entries.move_to_end(key)
+                return entry["image"].view()
+
+            self.misses += 1
+
+        # cache miss - load the image without holding the lock
+        image = load(filename=filename, color=color, reduce=reduce, max_size=max_size)
+        if image.nbytes > self.max_bytes:
+            # the image is never cached, so it can be returned as is
+            return image
+
+        # cached images are shared between all callers, so they must be read-only
+        image.flags.writeable = False
+        with self.lock:
+            if key in self.entries:
+                # another thread has loaded the same image in the meantime
+                self._remove_entry(key=key)
+            self.entries[key] = {"image": image, "stat": stat, "use_count": 1}
+            self.currbytes += image.nbytes
+            self._evict(new_key=key)
+
+        return image.view()
+
+    @staticmethod
+    def _get_file_stat(filename):
+        """
+        Internal method which returns the modification time and size of a file (used for cache validation).
+        """
+        stat = os.stat(filename)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _remove_entry(self, key):
+        """
+        Internal method which removes an entry from the byte-budgeted cache (the lock must be held).
+        """
+        entry = self.entries.pop(key)
+        self.currbytes -= entry["image"].nbytes
+
+    def _evict(self, new_key=None):
+        """
+        Internal method which evicts entries from the byte-budgeted cache until its limits are met (the lock must be
+        held).
+
+        The entry `new_key` (which was just inserted) is only evicted if no other entries are left. Otherwise, with
+        policy "lfu", a new entry (with a use count of one) would immediately be evicted whenever all older entries
+        have been used more often, and the cache would never take new images.
+        """
+        while (self.currbytes > self.max_bytes) or ((self.max_count is not None) and (len(self.entries) > self.max_count)):
+            if (self.policy == "lru") or (len(self.entries) == 1):
+                # the order of the entries reflects the recency of their use (the new entry is the last one)
+                key = next(iter(self.entries.keys()))
+            else:
+                # for equal use counts, `min` returns the least recently used entry
+                key = min((key_ for key_ in self.entries.keys() if key_ != new_key), key=lambda key_: self.entries[key_]["use_count"])
+            self._remove_entry(key=key)
+            self.evictions += 1
 
     def get_cache_info(self):
         """
@@ -631,14 +2724,347 @@ class CachedImageLoader():
             - misses: number of cache misses
             - maxsize: maximum size of the cache
             - currsize: current size of the cache
+            For the byte-budgeted cache, the following additional fields are
+            present:
+            - evictions: number of evicted cache entries
+            - invalidations: number of entries invalidated due to file changes
+            - maxbytes: maximum number of bytes of the cache
+            - currbytes: current number of bytes of the cache
         """
-        return self.load.cache_info()
+        if self.max_bytes is None:
+            return self.load.cache_info()
+        else:
+            with self.lock:
+                return self.CacheInfo(
+                    hits=self.hits,
+                    misses=self.misses,
+                    maxsize=self.max_count,
+                    currsize=len(self.entries),
+                    evictions=self.evictions,
+                    invalidations=self.invalidations,
+                    maxbytes=self.max_bytes,
+                    currbytes=self.currbytes,
+                )
 
     def clear_cache(self):
         """
         Remove all items from the cache used by this `CachedImageLoader` instance.
         """
-        self.load.cache_clear()
+        if self.max_bytes is None:
+            self.load.cache_clear()
+        else:
+            with self.lock:
+                self.entries.clear()
+                self.hits = 0
+                self.misses = 0
+                self.evictions = 0
+                self.invalidations = 0
+                self.currbytes = 0
+
+
+class DiskCachedImageLoader():
+    """
+    A class that wraps the `load` function and caches the decoded images persistently on disk.
+
+    The first time an image is loaded, it is decoded via `load` and the
+    resulting array is stored as raw ".npy" file in the cache directory. All
+    later loads of the same image (also across different runs and processes)
+    then only need to memory-map that file instead of decoding the original
+    image again.
+
+    Cache entries are keyed on the absolute path, modification time and size
+    of the image file and on the `color` argument. Optionally (`use_hash`), the
+    SHA-512 hash of the file content (via `dito.inspection.hash_file`) can be
+    used instead of path, modification time, and size.
+
+    If the total size of the cache files exceeds `max_bytes`, the least
+    recently used cache files are removed.
+
+    Notes
+    -----
+    The cache can safely be used by multiple processes at the same time: cache
+    files are written to a temporary file first, which is then atomically
+    renamed, so readers never see partially written files.
+
+    Only files named "dito-cache-<key>.npy" (and the temporary files
+    "dito-cache-<key>.npy.<id>.tmp") are considered to be part of the cache,
+    so other files in the cache directory are never removed. Temporary files
+    left over by interrupted writes are removed if they are older than one
+    hour (or by `clear_cache`).
+
+    The total size of the cache files is tracked by each instance, and the
+    cache directory is only scanned when the instance is created and when the
+    tracked size exceeds `max_bytes` (which also accounts for files written
+    by other processes).
+
+    Cache files of images which are modified or deleted are not removed
+    immediately, but only by the size-based eviction.
+
+    See Also
+    --------
+    `dito.io.load` : The function that is wrapped by this class.
+    `dito.io.CachedImageLoader` : In-memory cache for loaded images.
+    """
+
+    CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "evictions", "currsize", "maxbytes", "currbytes"])
+
+    # prefix of all files written by the cache (other files in the cache directory are never touched)
+    CACHE_FILE_PREFIX = "dito-cache-"
+
+    # minimum age (in seconds) of temporary files before they are considered to be left over by interrupted writes
+    TEMP_FILE_MAX_AGE = 3600.0
+
+    def __init__(self, cache_dir=None, max_bytes=2 * 1024**3, use_hash=False, mmap=True):
+        """
+        Create a new `DiskCachedImageLoader` instance.
+
+        Parameters
+        ----------
+        cache_dir : str or pathlib.Path or None, optional
+            The directory where the cache files are stored. If None (default),
+            the directory "dito.disk_cache" within the temporary directory
+            returned by `tempfile.gettempdir()` is used.
+        max_bytes : int or None, optional
+            The maximum total size of all cache files in bytes. Default is 2 GiB.
+            If None, the cache size is not bounded.
+        use_hash : bool, optional
+            If True, use the hash value of the file content as cache key
+            instead of the path, modification time, and size of the file.
+            This is slower (since every file must be read completely), but the
+            cache entries remain valid if files are moved, copied or touched.
+            Default is False.
+        mmap : bool, optional
+            If True (default), cached images are returned as read-only
+            memory-mapped arrays. Otherwise, they are read into memory.
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(tempfile.gettempdir(), "dito.disk_cache")
+        self.cache_dir = str(cache_dir)
+        self.max_bytes = max_bytes
+        self.use_hash = use_hash
+        self.mmap = mmap
+
+        dito.utils.mkdir(dirname=self.cache_dir)
+
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # running total of the size of all cache files (updated by a full scan only if the size limit is exceeded)
+        self.currbytes = sum(cache_file[2] for cache_file in self._get_cache_files(remove_temp_files=True))
+
+    def get_cache_filename(self, filename, color=None):
+        """
+        Return the filename of the cache file for the given image file and color mode.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            The path to the image file.
+        color : bool or None, optional
+            The color mode. See `load`.
+
+        Returns
+        -------
+        str
+            The path of the (possibly not yet existing) cache file.
+        """
+        if self.use_hash:
+            key = "hash={}".format(dito.inspection.hash_file(path=filename))
+        else:
+            stat = os.stat(filename)
+            key = "path={}|mtime_ns={}|size={}".format(os.path.abspath(str(filename)), stat.st_mtime_ns, stat.st_size)
+        key += "|color={}".format(color)
+        return os.path.join(self.cache_dir, self.CACHE_FILE_PREFIX + dito.inspection.hash_bytes(bytes_=key.encode("utf-8"), cutoff_position=32) + ".npy")
+
+    def load(self, filename, color=None):
+        """
+        Load an image from the specified file and return it as a NumPy array.
+
+        If the image is found in the cache, it is loaded from there. Otherwise,
+        it is loaded via `dito.io.load` and written to the cache.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            The path to the file containing the image to load.
+        color : bool or None, optional
+            Whether to load the image as color (True), grayscale (False), or as is (None). Default is None. See `load`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The loaded image as a NumPy array (or as read-only `numpy.memmap`
+            if `mmap` is True, for cache hits and misses alike).
+
+        Raises
+        ------
+        FileNotFoundError
+            If the specified file does not exist.
+        """
+        if isinstance(filename, pathlib.Path):
+            filename = str(filename)
+        if not os.path.exists(filename):
+            raise FileNotFoundError("Image file '{}' does not exist".format(filename))
+
+        cache_filename = self.get_cache_filename(filename=filename, color=color)
+
+        # cache hit
+        try:
+            image = np.load(file=cache_filename, mmap_mode="r" if self.mmap else None)
+        except (OSError, ValueError):
+            # cache file does not exist (or was evicted/corrupted in the meantime)
+            pass
+        else:
+            self._touch(filename=cache_filename)
+            with self.lock:
+                self.hits += 1
+            return image
+
+        # cache miss
+        with self.lock:
+            self.misses += 1
+        image = load(filename=filename, color=color)
+        self._write(cache_filename=cache_filename, image=image)
+        if self.mmap:
+            # return the same as for a cache hit, i.e., the read-only memory-mapped cache file
+            try:
+                image = np.load(file=cache_filename, mmap_mode="r")
+            except (OSError, ValueError):
+                # cache file could not be written (or was removed in the meantime)
+                image.flags.writeable = False
+        self._evict()
+        return image
+
+    @staticmethod
+    def _touch(filename):
+        """
+        Internal method which updates the modification time of a cache file (used for LRU eviction).
+        """
+        try:
+            os.utime(filename)
+        except OSError:
+            pass
+
+    def _write(self, cache_filename, image):
+        """
+        Internal method which atomically writes an image to the cache.
+        """
+        temp_filename = "{}.{}.tmp".format(cache_filename, uuid.uuid4().hex)
+        try:
+            with open(temp_filename, "wb") as temp_file:
+                np.save(file=temp_file, arr=image, allow_pickle=False)
+            cache_file_size = os.path.getsize(temp_filename)
+            os.replace(temp_filename, cache_filename)
+            with self.lock:
+                self.currbytes += cache_file_size
+        except OSError:
+            # e.g., disk full or cache dir removed - the cache is only an optimization, so do not fail
+            try:
+                os.remove(temp_filename)
+            except OSError:
+                pass
+
+    def _get_cache_files(self, remove_temp_files=False, temp_file_max_age=None):
+        """
+        Internal method which returns a list of `(filename, mtime, size)` for all cache files.
+
+        If `remove_temp_files` is True, temporary files which are older than `temp_file_max_age` seconds (default:
+        `TEMP_FILE_MAX_AGE`; zero means all) are removed.
+        """
+        if temp_file_max_age is None:
+            temp_file_max_age = self.TEMP_FILE_MAX_AGE
+        now = time.time()
+
+        cache_files = []
+        for dir_entry in os.scandir(self.cache_dir):
+            if not dir_entry.name.startswith(self.CACHE_FILE_PREFIX):
+                continue
+            try:
+                stat = dir_entry.stat()
+            except OSError:
+                # removed by another process in the meantime
+                continue
+            if dir_entry.name.endswith(".npy"):
+                cache_files.append((dir_entry.path, stat.st_mtime, stat.st_size))
+            elif remove_temp_files and dir_entry.name.endswith(".tmp") and (stat.st_mtime <= now - temp_file_max_age):
+                # left over by an interrupted write
+                try:
+                    os.remove(dir_entry.path)
+                except OSError:
+                    pass
+        return cache_files
+
+    def _evict(self):
+        """
+        Internal method which removes the least recently used cache files until the size limit is met.
+        """
+        with self.lock:
+            if (self.max_bytes is None) or (self.currbytes <= self.max_bytes):
+                return
+
+        # the tracked size exceeds the limit - get the actual cache files (which may have been changed by other processes)
+        cache_files = self._get_cache_files(remove_temp_files=True)
+        total_bytes = sum(cache_file[2] for cache_file in cache_files)
+        for (cache_filename, _, cache_file_size) in sorted(cache_files, key=operator.itemgetter(1)):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(cache_filename)
+            except FileNotFoundError:
+                # removed by another process in the meantime
+                pass
+            except OSError:
+                # e.g., the file is still memory-mapped under Windows
+                continue
+            else:
+                with self.lock:
+                    self.evictions += 1
+            total_bytes -= cache_file_size
+
+        with self.lock:
+            self.currbytes = total_bytes
+
+    def get_cache_info(self):
+        """
+        Get information about the cache used by this `DiskCachedImageLoader` instance.
+
+        Returns
+        -------
+        collections.namedtuple
+            A named tuple with the following fields:
+            - hits: number of cache hits (of this instance)
+            - misses: number of cache misses (of this instance)
+            - evictions: number of cache files removed (by this instance)
+            - currsize: current number of cache files
+            - maxbytes: maximum number of bytes of the cache
+            - currbytes: current number of bytes of the cache
+        """
+        cache_files = self._get_cache_files()
+        with self.lock:
+            return self.CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                currsize=len(cache_files),
+                maxbytes=self.max_bytes,
+                currbytes=sum(cache_file[2] for cache_file in cache_files),
+            )
+
+    def clear_cache(self):
+        """
+        Remove all cache files (and temporary files) from the cache directory.
+
+        Other files in the cache directory are not removed.
+        """
+        for (cache_filename, _, _) in self._get_cache_files(remove_temp_files=True, temp_file_max_age=0.0):
+            try:
+                os.remove(cache_filename)
+            except OSError:
+                pass
+        with self.lock:
+            self.currbytes = 0
 
 
 class VideoSaver():
@@ -652,9 +3078,14 @@ class VideoSaver():
     * the sizes of all following images are checked - if they do not match the size of the first image, an exception is
       raised
     * images are converted to gray/color mode automatically
+    * optionally, frames are converted and encoded asynchronously by a background thread (see `asynchronous`)
+
+    In asynchronous mode, `append` only puts (a copy of) the frame into a bounded queue and returns immediately, while a
+    writer thread performs the color conversion and the encoding. If the queue is full, `append` either blocks until
+    there is space (`overflow_policy="block"`) or discards the oldest queued frame (`overflow_policy="drop_oldest"`).
     """
 
-    def __init__(self, filename, codec="MJPG", fps=30.0, color=True):
+    def __init__(self, filename, codec="MJPG", fps=30.0, color=True, asynchronous=False, max_queue_size=64, overflow_policy="block"):
         """
         Initialize the `VideoSaver` object.
 
@@ -668,27 +3099,51 @@ class VideoSaver():
             Frames per second of the output video. Default is 30.0.
         color : bool, optional
             Whether to save the video in color (True) or grayscale (False). Default is True.
+        asynchronous : bool, optional
+            If True, frames are converted and encoded by a background thread. Default is False.
+        max_queue_size : int, optional
+            Maximum number of frames waiting to be encoded (only used in asynchronous mode). Default is 64.
+        overflow_policy : str, optional
+            What to do if the queue is full (only used in asynchronous mode). Either "block" (wait until there is
+            space) or "drop_oldest" (discard the oldest queued frame). Default is "block".
 
         Raises
         ------
         ValueError
-            If the `codec` argument is not a string of length 4.
+            If the `codec` argument is not a string of length 4, or if the queue arguments are invalid.
         """
         self.filename = filename
         self.codec = codec
         self.fps = fps
         self.color = color
+        self.asynchronous = asynchronous
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
 
         if isinstance(self.filename, pathlib.Path):
             self.filename = str(self.filename)
 
         if (not isinstance(self.codec, str)) or (len(self.codec) != 4):
             raise ValueError("Argument 'codec' must be a string of length 4")
+        if self.max_queue_size < 1:
+            raise ValueError("Argument 'max_queue_size' must be at least 1, but is {}".format(self.max_queue_size))
+        if self.overflow_policy not in ("block", "drop_oldest"):
+            raise ValueError("Invalid overflow policy '{}' (must be one of 'block', 'drop_oldest')".format(self.overflow_policy))
 
         self.frame_count = 0
         self.image_size = None
         self.writer = None
 
+        # state of the asynchronous mode
+        self.dropped_frame_count = 0
+        self.max_queue_depth = 0
+        self._queue = collections.deque()
+        self._queue_condition = threading.Condition()
+        self._writer_thread = None
+        self._writer_busy = False
+        self._writer_error = None
+        self._closing = False
+
     def __enter__(self):
         """
         Enter the context.
@@ -745,6 +3200,9 @@ class VideoSaver():
         """
         Add a frame to the video.
 
+        In asynchronous mode, a copy of the frame is put into the queue and the method returns as soon as there is
+        space in the queue (see `overflow_policy`).
+
         Parameters
         ----------
         image : numpy.ndarray
@@ -754,6 +3212,8 @@ class VideoSaver():
         ------
         ValueError
             If the size of the image is different from the size of the previous images.
+        RuntimeError
+            If the video was already saved (asynchronous mode only).
         """
         image_size = dito.core.size(image=image)
 
@@ -765,7 +3225,37 @@ class VideoSaver():
         if image_size != self.image_size:
             raise ValueError("Image size '{}' differs from previous image size '{}'".format(image_size, self.image_size))
 
-        # apply correct color mode
+        if not self.asynchronous:
+            self._write(image=image)
+            return
+
+        # the caller may re-use its buffer, so the queue must hold its own copy
+        image = image.copy()
+        with self._queue_condition:
+            self._raise_writer_error()
+            if self._closing:
+                raise RuntimeError("Can't append frames after the video was saved")
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(target=self._writer_loop, name="dito.VideoSaver", daemon=True)
+                self._writer_thread.start()
+
+            # apply backpressure if the queue is full
+            while len(self._queue) >= self.max_queue_size:
+                if self.overflow_policy == "drop_oldest":
+                    self._queue.popleft()
+                    self.dropped_frame_count += 1
+                else:
+                    self._queue_condition.wait()
+                    self._raise_writer_error()
+
+            self._queue.append(image)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+            self._queue_condition.notify_all()
+
+    def _write(self, image):
+        """
+        Internal method which applies the correct color mode to `image` and writes it to the video.
+        """
         if self.color:
             image = dito.core.as_color(image=image)
         else:
@@ -774,16 +3264,91 @@ class VideoSaver():
         self.writer.write(image=image)
         self.frame_count += 1
 
+    def _writer_loop(self):
+        """
+        Internal method which is run by the writer thread in asynchronous mode.
+        """
+        while True:
+            with self._queue_condition:
+                while (len(self._queue) == 0) and (not self._closing):
+                    self._queue_condition.wait()
+                if len(self._queue) == 0:
+                    # closing and nothing left to write
+                    return
+                image = self._queue.popleft()
+                self._writer_busy = True
+                self._queue_condition.notify_all()
+
+            try:
+                self._write(image=image)
+            except Exception as e:
+                with self._queue_condition:
+                    self._writer_error = e
+                    self._writer_busy = False
+                    self._queue.clear()
+                    self._queue_condition.notify_all()
+                return
+
+            with self._queue_condition:
+                self._writer_busy = False
+                self._queue_condition.notify_all()
+
+    def _raise_writer_error(self):
+        """
+        Internal method which re-raises an exception which occurred in the writer thread (if any).
+        """
+        if self._writer_error is not None:
+            raise RuntimeError("Writing a frame in the background thread failed") from self._writer_error
+
+    def get_queue_depth(self):
+        """
+        Return the number of frames which are waiting to be encoded (always 0 in synchronous mode).
+
+        Returns
+        -------
+        int
+            The current number of frames in the queue.
+        """
+        with self._queue_condition:
+            return len(self._queue)
+
+    def flush(self):
+        """
+        Wait until all queued frames have been written (asynchronous mode only, no-op otherwise).
+
+        Raises
+        ------
+        RuntimeError
+            If writing a frame in the background thread failed.
+        """
+        with self._queue_condition:
+            while ((len(self._queue) > 0) or self._writer_busy) and (self._writer_error is None):
+                self._queue_condition.wait()
+            self._raise_writer_error()
+
     def save(self):
         """
         Finish writing the video and release the writer object.
 
         This method should be called after all frames have been appended to the
         video. If the `VideoSaver` object is used via a context manager, this
-        method is called automatically when the context is exited.
+        method is called automatically when the context is exited. In
+        asynchronous mode, all queued frames are written before the writer
+        thread is stopped.
         """
-        if self.writer is not None:
-            self.writer.release()
+        try:
+            if self._writer_thread is not None:
+                try:
+                    self.flush()
+                finally:
+                    with self._queue_condition:
+                        self._closing = True
+                        self._queue_condition.notify_all()
+                    self._writer_thread.join()
+                    self._writer_thread = None
+        finally:
+            if self.writer is not None:
+                self.writer.release()
 
     def file_exists(self):
         """
@@ -827,6 +3392,7 @@ class VideoSaver():
         * the date and time the output file was last modified
         * the image size and color mode
         * the number, size, and color info of frames in the video
+        * in asynchronous mode: the queue policy, size, depth, and the number of dropped frames
         """
         file_exists = self.file_exists()
         rows = [
@@ -841,4 +3407,288 @@ class VideoSaver():
             ["..Color", self.color],
             ["..Count", self.frame_count],
         ]
+        if self.asynchronous:
+            rows += [
+                ["Queue", ""],
+                ["..Policy", self.overflow_policy],
+                ["..Max size", self.max_queue_size],
+                ["..Depth", self.get_queue_depth()],
+                ["..Max depth", self.max_queue_depth],
+                ["..Dropped", self.dropped_frame_count],
+            ]
         dito.utils.ptable(rows=rows, print_kwargs={"file": file})
+
+
+class VideoLoader():
+    """
+    Convenience wrapper for `cv2.VideoCapture`, which is the reading counterpart of `VideoSaver`.
+
+    Main features compared to `cv2.VideoCapture`:
+    * frames are decoded by a background thread while iterating (see `prefetch_count`)
+    * random access by frame index via `loader[index]`, with a small LRU cache of decoded frames
+    * striding via `iter_frames(step=...)`, where skipped frames are only grabbed, but not retrieved
+    * optional on-the-fly conversion to gray/color mode and resizing of the frames
+
+    Example
+    -------
+    >>> with VideoLoader("input.avi", color=False) as loader, VideoSaver("output.avi", fps=loader.fps, color=False) as saver: # doctest: +SKIP
+    ...     for image in loader.iter_frames(step=2):
+    ...         saver.append(image=image)
+    """
+
+    def __init__(self, filename, color=None, scale_or_size=None, prefetch_count=8, cache_count=16):
+        """
+        Open the video file.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            Path to the input video file.
+        color : bool or None, optional
+            If True, frames are converted to color mode, if False, frames are converted to gray mode. If None, the
+            frames are returned as decoded by OpenCV (usually BGR). Default is None.
+        scale_or_size : float or tuple or None, optional
+            If not None, frames are resized via `dito.core.resize` (see there). Default is None.
+        prefetch_count : int, optional
+            Maximum number of decoded frames which are buffered by the background thread while iterating. Default is 8.
+        cache_count : int, optional
+            Maximum number of decoded frames which are cached for random access. Default is 16.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the video file does not exist.
+        ValueError
+            If the video file can not be opened or if `prefetch_count` is smaller than 1.
+        """
+        self.filename = filename
+        self.color = color
+        self.scale_or_size = scale_or_size
+        self.prefetch_count = prefetch_count
+        self.cache_count = cache_count
+
+        if isinstance(self.filename, pathlib.Path):
+            self.filename = str(self.filename)
+
+        if not os.path.exists(self.filename):
+            raise FileNotFoundError("Video file '{}' not found".format(self.filename))
+        if self.prefetch_count < 1:
+            raise ValueError("Argument 'prefetch_count' must be at least 1, but is {}".format(self.prefetch_count))
+
+        # this capture object is only used for random access, iterators use their own capture object
+        self.capture = self._open_capture()
+        self.frame_count = int(self.capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        self.fps = self.capture.get(cv2.CAP_PROP_FPS)
+        self.image_size = (int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+
+        self._capture_position = 0
+        self._capture_lock = threading.Lock()
+        self._cache = collections.OrderedDict()
+
+    def __enter__(self):
+        """
+        Enter the context.
+
+        Returns
+        -------
+        self
+            This object.
+        """
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        """
+        Exit the context.
+
+        Parameters
+        ----------
+        *args, **kwargs
+            Arguments passed to the `exit` function. These are ignored.
+        """
+        self.close()
+
+    def __len__(self):
+        return self.frame_count
+
+    def __iter__(self):
+        return self.iter_frames()
+
+    def __getitem__(self, index):
+        return self.get_frame(index=index)
+
+    def _open_capture(self):
+        """
+        Internal method which opens a new capture object for the video file.
+        """
+        capture = cv2.VideoCapture(self.filename)
+        if not capture.isOpened():
+            raise ValueError("Can't open video file '{}'".format(self.filename))
+        return capture
+
+    def _process(self, image):
+        """
+        Internal method which applies the color mode and resizing to a decoded frame.
+        """
+        if self.color is True:
+            image = dito.core.as_color(image=image)
+        elif self.color is False:
+            image = dito.core.as_gray(image=image)
+        if self.scale_or_size is not None:
+            image = dito.core.resize(image=image, scale_or_size=self.scale_or_size)
+        return image
+
+    def get_frame(self, index):
+        """
+        Return the frame with the given index.
+
+        Recently accessed frames are cached. Frames shortly after the current position of the video are reached by
+        grabbing (but not retrieving) the frames in between, for all other frames the video is seeked.
+
+        Parameters
+        ----------
+        index : int
+            The frame index. Negative values count from the end of the video.
+
+        Returns
+        -------
+        numpy.ndarray
+            The (processed) frame. It is read-only, because it is shared with the frame cache.
+
+        Raises
+        ------
+        IndexError
+            If the frame index is out of range.
+        RuntimeError
+            If the frame can not be decoded.
+        """
+        index = operator.index(index)
+        if index < 0:
+            index += self.frame_count
+        if not (0 <= index < self.frame_count):
+            raise IndexError("Frame index {} is out of range for video with {} frames".format(index, self.frame_count))
+
+        with self._capture_lock:
+            try:
+                self._cache.move_to_end(index)
+                return self._cache[index]
+            except KeyError:
+                pass
+
+            # seek only if the requested frame is behind the current position or too far ahead
+            skip_count = index - self._capture_position
+            if (skip_count < 0) or (skip_count > self.cache_count):
+                self.capture.set(cv2.CAP_PROP_POS_FRAMES, index)
+                skip_count = 0
+            for _ in range(skip_count):
+                self.capture.grab()
+            (success, image) = self.capture.read()
+            if not success:
+                self._capture_position = -1
+                raise RuntimeError("Can't decode frame {} of video file '{}'".format(index, self.filename))
+            self._capture_position = index + 1
+
+            image = self._process(image=image)
+            image.flags.writeable = False
+            if self.cache_count > 0:
+                self._cache[index] = image
+                while len(self._cache) > self.cache_count:
+                    self._cache.popitem(last=False)
+            return image
+
+    def iter_frames(self, start=0, stop=None, step=1):
+        """
+        Iterate over the frames `start`, `start + step`, ... (excluding `stop`).
+
+        The frames are decoded and processed by a background thread, which runs ahead of the consumer by at most
+        `prefetch_count` frames. Skipped frames are only grabbed, but not retrieved.
+
+        Parameters
+        ----------
+        start : int, optional
+            Index of the first frame. Default is 0.
+        stop : int or None, optional
+            Index after the last frame. If None, iterate until the end of the video. Default is None.
+        step : int, optional
+            Step between two yielded frames. Must be positive. Default is 1.
+
+        Yields
+        ------
+        numpy.ndarray
+            The (processed) frames.
+
+        Raises
+        ------
+        ValueError
+            If `start` is negative or `step` is not positive.
+        """
+        if start < 0:
+            raise ValueError("Argument 'start' must be non-negative, but is {}".format(start))
+        if step < 1:
+            raise ValueError("Argument 'step' must be positive, but is {}".format(step))
+
+        capture = self._open_capture()
+        if start > 0:
+            capture.set(cv2.CAP_PROP_POS_FRAMES, start)
+
+        # the frame queue is a deque guarded by a condition, the background thread stops if `stop_event` is set
+        frames = collections.deque()
+        condition = threading.Condition()
+        stop_event = threading.Event()
+        state = {"done": False, "error": None}
+
+        def produce():
+            try:
+                index = start
+                while (not stop_event.is_set()) and ((stop is None) or (index < stop)):
+                    if not capture.grab():
+                        break
+                    (success, image) = capture.retrieve()
+                    if not success:
+                        raise RuntimeError("Can't decode frame {} of video file '{}'".format(index, self.filename))
+                    image = self._process(image=image)
+                    with condition:
+                        while (len(frames) >= self.prefetch_count) and (not stop_event.is_set()):
+                            condition.wait()
+                        frames.append(image)
+                        condition.notify_all()
+
+                    # skip frames without retrieving them
+                    for _ in range(step - 1):
+                        if not capture.grab():
+                            break
+                    index += step
+            except Exception as e:
+                state["error"] = e
+            finally:
+                with condition:
+                    state["done"] = True
+                    condition.notify_all()
+
+        thread = threading.Thread(target=produce, name="dito.VideoLoader", daemon=True)
+        thread.start()
+        try:
+            while True:
+                with condition:
+                    while (len(frames) == 0) and (not state["done"]):
+                        condition.wait()
+                    if len(frames) == 0:
+                        break
+                    image = frames.popleft()
+                    condition.notify_all()
+                yield image
+            if state["error"] is not None:
+                raise state["error"]
+        finally:
+            stop_event.set()
+            with condition:
+                condition.notify_all()
+            thread.join()
+            capture.release()
+
+    def close(self):
+        """
+        Release the capture object and clear the frame cache.
+        """
+        with self._capture_lock:
+            self.capture.release()
+            self._cache.clear()
@@ -2,10 +2,29 @@
 This submodule provides functionality for parallelizing image processing.
 """
 
+import atexit
+import collections
+import concurrent.futures
+import contextlib
+import functools
 import multiprocessing as mp
+import multiprocessing.pool
+import multiprocessing.resource_tracker
+import multiprocessing.shared_memory
+import os
+import queue
+import threading
+import uuid
 
+import cv2
+import numpy as np
 
-__all__ = ["mp_starmap"]
+
+__all__ = ["Pool", "mp_starmap", "mp_starmap_iter"]
+
+
+# descriptor of an array which is stored in a shared memory block (this is pickled instead of the array data)
+_SharedArray = collections.namedtuple("_SharedArray", ["name", "shape", "dtype"])
 
 
 def _star_wrapper(arg):
@@ -17,7 +36,312 @@ def _star_wrapper(arg):
     return func(*args)
 
 
-def mp_starmap(func, argss, process_count=None, chunksize=1, pbar_func=None, pbar_kwargs=None):
+def _is_shareable(value):
+    """
+    Internal helper function which returns True if `value` is an array which
+    can be transferred via shared memory.
+    """
+    return isinstance(value, np.ndarray) and (value.nbytes > 0) and (not value.dtype.hasobject)
+
+
+def _to_shared_memory(array, name=None):
+    """
+    Internal helper function which copies `array` into a new shared memory
+    block and returns the block and the descriptor of the array.
+    """
+    shm = mp.shared_memory.SharedMemory(name=name, create=True, size=array.nbytes)
+    try:
+        np.copyto(np.ndarray(shape=array.shape, dtype=array.dtype, buffer=shm.buf), array, casting="no")
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    return (shm, _SharedArray(name=shm.name, shape=array.shape, dtype=array.dtype.str))
+
+
+def _from_shared_memory(shared_array):
+    """
+    Internal helper function which copies the array described by
+    `shared_array` out of its shared memory block and removes the block.
+    """
+    shm = mp.shared_memory.SharedMemory(name=shared_array.name, create=False)
+    try:
+        return np.ndarray(shape=shared_array.shape, dtype=np.dtype(shared_array.dtype), buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _get_result_name(token, n_task, n_array):
+    """
+    Internal helper function which returns the name of the shared memory
+    block for the `n_array`-th array of the result of task `n_task`.
+
+    The names are deterministic, such that the parent process can remove
+    leftover blocks (e.g., if a worker or the parent fails).
+    """
+    return "dito_{}_{}_{}".format(token, n_task, n_array)
+
+
+def _star_wrapper_shared_memory(arg):
+    """
+    Internal helper function used by `mp_starmap` if `shared_memory` is True.
+
+    It attaches to the shared memory blocks of the array arguments (without
+    copying them), calls the function, and moves array results into new
+    shared memory blocks.
+    """
+    (func, args, token, n_task) = arg
+
+    shms = []
+    try:
+        # replace descriptors by arrays which use the shared memory blocks as buffer
+        args = list(args)
+        for (n_arg, value) in enumerate(args):
+            if isinstance(value, _SharedArray):
+                shm = mp.shared_memory.SharedMemory(name=value.name, create=False)
+                shms.append(shm)
+                args[n_arg] = np.ndarray(shape=value.shape, dtype=np.dtype(value.dtype), buffer=shm.buf)
+
+        result = func(*args)
+        args = None
+
+        # move array results (or arrays within a tuple result) into new shared memory blocks
+        is_tuple = isinstance(result, tuple)
+        items = list(result) if is_tuple else [result]
+        result = None
+        n_array = 0
+        for (n_item, item) in enumerate(items):
+            if _is_shareable(item):
+                (result_shm, items[n_item]) = _to_shared_memory(array=item, name=_get_result_name(token=token, n_task=n_task, n_array=n_array))
+                result_shm.close()
+                n_array += 1
+        return tuple(items) if is_tuple else items[0]
+    finally:
+        for shm in shms:
+            try:
+                shm.close()
+            except BufferError:
+                # the function kept a reference to an argument array - the block is closed when it is garbage collected
+                pass
+
+
+def _share_args(args, shms):
+    """
+    Internal helper function which copies all array arguments of `args` into
+    new shared memory blocks (which are appended to `shms`) and returns the
+    arguments with the arrays replaced by their descriptors.
+    """
+    shared_args = []
+    for value in args:
+        if _is_shareable(value):
+            (shm, value) = _to_shared_memory(array=value)
+            shms.append(shm)
+        shared_args.append(value)
+    return tuple(shared_args)
+
+
+def _unshare_result(result):
+    """
+    Internal helper function which replaces the descriptors of `result` (as
+    returned by `_star_wrapper_shared_memory`) by the actual arrays.
+    """
+    if isinstance(result, _SharedArray):
+        return _from_shared_memory(shared_array=result)
+    elif isinstance(result, tuple) and (not hasattr(result, "_fields")):
+        return tuple(_from_shared_memory(shared_array=item) if isinstance(item, _SharedArray) else item for item in result)
+    else:
+        return result
+
+
+def _remove_result_blocks(token, n_tasks):
+    """
+    Internal helper function which removes all leftover shared memory blocks
+    of the results of the tasks `n_tasks` (e.g., of tasks whose results were
+    not collected because another task failed).
+    """
+    for n_task in n_tasks:
+        n_array = 0
+        while True:
+            try:
+                shm = mp.shared_memory.SharedMemory(name=_get_result_name(token=token, n_task=n_task, n_array=n_array), create=False)
+            except FileNotFoundError:
+                break
+            shm.close()
+            shm.unlink()
+            n_array += 1
+
+
+def _ensure_resource_tracker():
+    """
+    Internal helper function which starts the resource tracker of
+    `multiprocessing` (if it is not running yet).
+
+    It must be called before worker processes are started, such that they
+    share the resource tracker of this process. Otherwise, each worker which
+    attaches to a shared memory block starts its own resource tracker, which
+    reports the block as leaked (and tries to remove it) on exit.
+    """
+    if os.name == "posix":
+        mp.resource_tracker.ensure_running()
+
+
+def _get_cpu_count():
+    """
+    Internal helper function which returns the number of CPU cores.
+    """
+    return os.cpu_count() or 1
+
+
+def _get_cv2_thread_count(worker_count):
+    """
+    Internal helper function which returns the number of threads OpenCV
+    should use within each of `worker_count` workers, such that all workers
+    together do not use more threads than there are CPU cores.
+    """
+    return max(1, _get_cpu_count() // worker_count)
+
+
+# state of the process-wide limit of OpenCV threads used by the thread backend
+_cv2_thread_limit_lock = threading.Lock()
+_cv2_thread_limit_count = 0
+_cv2_thread_count_before_limit = None
+
+
+def _acquire_cv2_thread_limit(thread_count):
+    """
+    Internal helper function which limits the number of threads used by
+    OpenCV (which is a process-wide setting) to `thread_count`, until each
+    call of this function is matched by a call of `_release_cv2_thread_limit`.
+    """
+    global _cv2_thread_limit_count, _cv2_thread_count_before_limit
+    with _cv2_thread_limit_lock:
+        if _cv2_thread_limit_count == 0:
+            _cv2_thread_count_before_limit = cv2.getNumThreads()
+            cv2.setNumThreads(thread_count)
+        _cv2_thread_limit_count += 1
+
+
+def _release_cv2_thread_limit():
+    """
+    Internal helper function which releases a limit set by
+    `_acquire_cv2_thread_limit`. The original number of OpenCV threads is
+    restored when the last limit is released.
+    """
+    global _cv2_thread_limit_count
+    with _cv2_thread_limit_lock:
+        _cv2_thread_limit_count -= 1
+        if _cv2_thread_limit_count == 0:
+            cv2.setNumThreads(_cv2_thread_count_before_limit)
+
+
+@contextlib.contextmanager
+def _thread_pool_context(pool_context, worker_count):
+    """
+    Internal helper function which wraps the context manager of a thread pool
+    such that the number of OpenCV threads is limited while it is used.
+    """
+    with pool_context as thread_pool:
+        _acquire_cv2_thread_limit(thread_count=_get_cv2_thread_count(worker_count=worker_count))
+        try:
+            yield thread_pool
+        finally:
+            _release_cv2_thread_limit()
+
+
+# global thread pool used by the thread backend (it is re-created in forked child processes, where its threads do not exist)
+_thread_pool = None
+_thread_pool_pid = None
+_thread_pool_lock = threading.Lock()
+
+# marks the worker threads of the thread pools created for the thread backend (see `_is_thread_pool_worker`)
+_thread_pool_worker_state = threading.local()
+
+
+def _init_thread_pool_worker():
+    """
+    Internal helper function which is used as initializer of the thread pools
+    created for the thread backend and marks the current thread as their
+    worker.
+    """
+    _thread_pool_worker_state.is_worker = True
+
+
+def _is_thread_pool_worker():
+    """
+    Internal helper function which returns True if the current thread is a
+    worker of a thread pool created for the thread backend.
+
+    A task which calls the thread backend again must not use the global
+    thread pool: its outer tasks would occupy all workers while waiting for
+    the inner tasks, which could then never start.
+    """
+    return getattr(_thread_pool_worker_state, "is_worker", False)
+
+
+def _get_thread_pool():
+    """
+    Internal helper function which returns the global thread pool (with one
+    thread per CPU core) which is shared by all calls using the thread
+    backend without an explicit pool or thread count.
+    """
+    global _thread_pool, _thread_pool_pid
+    with _thread_pool_lock:
+        if (_thread_pool is None) or (_thread_pool_pid != os.getpid()):
+            if _thread_pool is None:
+                atexit.register(_close_thread_pool)
+            _thread_pool = mp.pool.ThreadPool(processes=_get_cpu_count(), initializer=_init_thread_pool_worker)
+            _thread_pool_pid = os.getpid()
+        return _thread_pool
+
+
+def _close_thread_pool():
+    """
+    Internal helper function which closes the global thread pool when the
+    interpreter exits.
+    """
+    with _thread_pool_lock:
+        if (_thread_pool is not None) and (_thread_pool_pid == os.getpid()):
+            _thread_pool.close()
+            _thread_pool.join()
+
+
+def _get_pool_context(pool, process_count, backend, shared_memory):
+    """
+    Internal helper function which returns a context manager yielding the
+    `multiprocessing.Pool` (or `multiprocessing.pool.ThreadPool`) to use, the
+    number of its workers, and whether it is a thread pool.
+
+    If `pool` is None, a new process pool (for `backend="process"`) is created
+    which is terminated on exit. For `backend="thread"`, the global thread pool
+    is used (or a new one if `process_count` is given or if called from a
+    worker thread of the thread backend, to avoid deadlocks of nested calls).
+    Otherwise, the given pool is used (regardless of `backend`) and not closed
+    on exit.
+    """
+    if pool is None:
+        worker_count = process_count if (process_count is not None) else _get_cpu_count()
+        if backend == "process":
+            if shared_memory:
+                _ensure_resource_tracker()
+            return (mp.Pool(processes=worker_count, initializer=_init_worker, initargs=(None, (), _get_cv2_thread_count(worker_count=worker_count))), worker_count, False)
+        elif backend == "thread":
+            if (process_count is None) and (not _is_thread_pool_worker()):
+                pool_context = contextlib.nullcontext(_get_thread_pool())
+            else:
+                pool_context = mp.pool.ThreadPool(processes=worker_count, initializer=_init_thread_pool_worker)
+            return (_thread_pool_context(pool_context=pool_context, worker_count=worker_count), worker_count, True)
+        else:
+            raise ValueError("Invalid backend '{}' (must be 'process' or 'thread')".format(backend))
+    elif process_count is not None:
+        raise ValueError("Argument 'process_count' must be None if 'pool' is given")
+    elif isinstance(pool, Pool):
+        return (contextlib.nullcontext(pool.pool), pool.process_count, pool.backend == "thread")
+    else:
+        return (contextlib.nullcontext(pool), _get_cpu_count(), isinstance(pool, mp.pool.ThreadPool))
+
+
+def mp_starmap(func, argss, process_count=None, chunksize=1, pbar_func=None, pbar_kwargs=None, shared_memory=False, pool=None, backend="process"):
     """
     Run `func(*argss[0])`, `func(*argss[1])`, ... in parallel and return the
     results as list in the same order.
@@ -32,6 +356,33 @@ def mp_starmap(func, argss, process_count=None, chunksize=1, pbar_func=None, pba
     no progress bar is used. Optional progress bar keyword arguments (e.g.,
     "unit") can be supplied via the `pbar_kwargs` argument.
 
+    If `shared_memory` is True, NumPy array arguments and results are not
+    pickled, but transferred via `multiprocessing.shared_memory` blocks, and
+    only their descriptors (name, shape, dtype) are pickled. This is much
+    faster for large arrays (e.g., 4K images). Each array argument is copied
+    once into a new block, and the worker uses it without copying. Each array
+    result (or array item of a tuple result) is copied into a new block by the
+    worker and copied out of it by the calling process. All blocks are removed
+    when this function returns, even if a task fails.
+
+    By default, a new process pool is created (and terminated) for each call.
+    To avoid this overhead when calling this function repeatedly (e.g., once
+    per batch), a persistent pool (see `Pool`) can be given via `pool`.
+
+    If `backend` is "thread", the tasks are run by a global thread pool
+    instead, which avoids process startup and pickling altogether. This is
+    faster if `func` spends most of its time in code which releases the GIL
+    (e.g., most OpenCV functions like `cv2.resize`, `cv2.GaussianBlur`,
+    `cv2.imencode`, `cv2.LUT` and many NumPy operations on large arrays). If
+    `func` is dominated by Python code, the process backend is faster. See
+    `scripts/dev_benchmark_parallel_backends.py` for a comparison.
+
+    To avoid oversubscription, the number of threads OpenCV uses internally
+    (see `cv2.setNumThreads`) is limited to
+    `max(1, cpu_count // worker_count)` within each worker process (process
+    backend) or, since it is a process-wide setting, while the thread pool is
+    used (thread backend).
+
     Parameters
     ----------
     func : callable
@@ -40,8 +391,9 @@ def mp_starmap(func, argss, process_count=None, chunksize=1, pbar_func=None, pba
         An iterable of tuples containing the arguments to be passed to `func`.
         Each tuple is unpacked and passed to `func` as multiple arguments.
     process_count : int or None, optional
-        The number of processes to use. Default is None (which means that the
-        number of processes is set to the number of CPU cores available).
+        The number of processes (or threads for the thread backend) to use.
+        Default is None (which means that the number of processes is set to
+        the number of CPU cores available).
     chunksize : int, optional
         The size of the chunks in which to divide the iterable. Default is 1.
         See `multiprocessing.Pool.map` for details.
@@ -50,36 +402,448 @@ def mp_starmap(func, argss, process_count=None, chunksize=1, pbar_func=None, pba
         used. Default is None. Example: `tqdm.tqdm` (without parentheses).
     pbar_kwargs : dict or None, optional
         Optional keyword arguments to pass to the progress bar function.
+    shared_memory : bool, optional
+        If True, transfer array arguments and results via shared memory
+        instead of pickling them. Default is False. It has no effect for the
+        thread backend (where the arrays are not transferred at all).
+    pool : Pool or multiprocessing.pool.Pool or None, optional
+        The (persistent) pool to use. It is not closed by this function. If
+        it is None, a new pool with `process_count` processes is used.
+        Default is None.
+    backend : str, optional
+        Either "process" (use worker processes) or "thread" (use worker
+        threads). It is ignored if `pool` is given. Default is "process".
 
     Returns
     -------
     list
         A list of the results of applying `func` to the items in `argss`.
 
+    Raises
+    ------
+    ValueError
+        If both `pool` and `process_count` are given or if `backend` is
+        invalid.
+
     Notes
     -----
     The order of the returned items is guaranteed to be the same as the order
     of the corresponding input items in `argss`.
 
+    If `shared_memory` is True, modifying an array argument within `func`
+    does not affect the array of the caller (as for pickled arguments). For
+    the thread backend, `func` operates on the arrays of the caller.
+
     See Also
     --------
     `multiprocessing.Pool.map` : Function used internally if no progress bar should be used.
     `multiprocessing.Pool.imap` : Function used internally if a progress bar should be used.
+    `multiprocessing.shared_memory` : Module used internally if `shared_memory` is True.
+    """
+
+    # the arguments are collected before a new pool is created, such that its workers are not leaked if this fails
+    argss = tuple(argss)
+
+    (pool_context, _, is_thread_pool) = _get_pool_context(pool=pool, process_count=process_count, backend=backend, shared_memory=shared_memory)
+    shared_memory = shared_memory and (not is_thread_pool)
+
+    arg_shms = []
+    token = uuid.uuid4().hex[:8]
+    try:
+        with pool_context as mp_pool:
+            if shared_memory:
+                wrapper = _star_wrapper_shared_memory
+                argss_for_wrapper = tuple((func, _share_args(args=args, shms=arg_shms), token, n_task) for (n_task, args) in enumerate(argss))
+            else:
+                wrapper = _star_wrapper
+                argss_for_wrapper = tuple((func, args) for args in argss)
+
+            if (pbar_func is None) and (not shared_memory):
+                # case 1: no progress bar
+                return mp_pool.map(func=wrapper, iterable=argss_for_wrapper, chunksize=chunksize)
+            else:
+                # case 2: tqdm-compatible progress bar and/or shared memory
+                results = []
+                first_exception = None
+                if pbar_kwargs is None:
+                    pbar_kwargs = {}
+                with (contextlib.nullcontext() if pbar_func is None else pbar_func(total=len(argss), **pbar_kwargs)) as pbar:
+                    result_iter = mp_pool.imap(func=wrapper, iterable=argss_for_wrapper, chunksize=chunksize)
+                    for _ in range(len(argss)):
+                        try:
+                            result = next(result_iter)
+                        except Exception as e:
+                            if not shared_memory:
+                                raise
+                            # with shared memory, all tasks must be finished before the blocks are removed (the pool may be persistent)
+                            if first_exception is None:
+                                first_exception = e
+                            result = None
+                        else:
+                            if shared_memory:
+                                result = _unshare_result(result)
+                        if pbar is not None:
+                            pbar.update()
+                        results.append(result)
+                if first_exception is not None:
+                    raise first_exception
+                return results
+    except BaseException:
+        if shared_memory:
+            _remove_result_blocks(token=token, n_tasks=range(len(argss)))
+        raise
+    finally:
+        for shm in arg_shms:
+            shm.close()
+            shm.unlink()
+
+
+def _put_task_result(result_queue, n_task, success, value):
+    """
+    Internal helper function used as callback of the tasks submitted by
+    `mp_starmap_iter`.
+    """
+    result_queue.put((n_task, success, value))
+
+
+def mp_starmap_iter(func, argss, process_count=None, ordered=True, max_in_flight_count=None, pbar_func=None, pbar_kwargs=None, shared_memory=False, pool=None, backend="process"):
     """
+    Run `func(*args)` for each item `args` of `argss` in parallel and yield
+    the results as they are computed.
+
+    In contrast to `mp_starmap`, the arguments are pulled from `argss` lazily,
+    such that it can be a generator of unknown (or even unbounded) length
+    (e.g., built from `dito.io.load_multiple_iter`). At most
+    `max_in_flight_count` tasks are submitted but not yet yielded at any
+    time, which bounds the memory used for arguments and results.
+
+    If `ordered` is True, the results are yielded in the order of `argss`.
+    Otherwise, each result is yielded as soon as it is available (similar to
+    `multiprocessing.Pool.imap_unordered`).
+
+    If a task raises an exception, it is re-raised by this generator (for
+    `ordered=True` at the position of the task). If the generator is closed
+    early, no further tasks are submitted and the generator waits until the
+    already submitted tasks are finished before a new pool (if `pool` is None)
+    is closed. For a given pool, it only waits if `shared_memory` is True (to
+    be able to remove the shared memory blocks of the tasks).
+
+    Parameters
+    ----------
+    func : callable
+        The function to apply to each item in `argss`.
+    argss : iterable of tuples
+        An iterable (e.g., a generator) of tuples containing the arguments to
+        be passed to `func`.
+    process_count : int or None, optional
+        The number of processes to use if `pool` is None. Default is None
+        (which means that the number of processes is set to the number of CPU
+        cores available).
+    ordered : bool, optional
+        If True, yield the results in the order of `argss`. Otherwise, yield
+        them as they are computed. Default is True.
+    max_in_flight_count : int or None, optional
+        The maximum number of tasks which are submitted but not yet yielded.
+        If None, twice the number of worker processes is used. Default is
+        None.
+    pbar_func : callable or None, optional
+        The progress bar function to use. If it is `None`, no progress bar is
+        used. Default is None. Example: `tqdm.tqdm` (without parentheses). If
+        `argss` has no length, the progress bar total is None.
+    pbar_kwargs : dict or None, optional
+        Optional keyword arguments to pass to the progress bar function.
+    shared_memory : bool, optional
+        If True, transfer array arguments and results via shared memory
+        instead of pickling them (see `mp_starmap`). The shared memory blocks
+        of each task are removed as soon as its result was received. Default
+        is False. It has no effect for the thread backend.
+    pool : Pool or multiprocessing.pool.Pool or None, optional
+        The (persistent) pool to use (see `mp_starmap`). Default is None.
+    backend : str, optional
+        Either "process" or "thread" (see `mp_starmap`). It is ignored if
+        `pool` is given. Default is "process".
+
+    Yields
+    ------
+    object
+        The result of `func(*args)` for each item `args` in `argss`.
 
-    argss_for_star_wrapper = tuple((func, args) for args in argss)
-    
-    with mp.Pool(processes=process_count) as pool:
-        if pbar_func is None:
-            # case 1: no progress bar
-            return pool.map(func=_star_wrapper, iterable=argss_for_star_wrapper, chunksize=chunksize)
+    Raises
+    ------
+    ValueError
+        If `max_in_flight_count` is smaller than one, if both `pool` and
+        `process_count` are given, or if `backend` is invalid.
+
+    See Also
+    --------
+    `mp_starmap` : Non-streaming version which returns a list of all results.
+    `multiprocessing.Pool.apply_async` : Function used internally to submit the tasks.
+    """
+
+    if (max_in_flight_count is not None) and (max_in_flight_count < 1):
+        raise ValueError("Argument 'max_in_flight_count' must be None or at least 1 (but is {})".format(max_in_flight_count))
+
+    (pool_context, worker_count, is_thread_pool) = _get_pool_context(pool=pool, process_count=process_count, backend=backend, shared_memory=shared_memory)
+    shared_memory = shared_memory and (not is_thread_pool)
+    if max_in_flight_count is None:
+        max_in_flight_count = 2 * worker_count
+
+    if pbar_kwargs is None:
+        pbar_kwargs = {}
+    pbar_total = len(argss) if hasattr(argss, "__len__") else None
+
+    arg_iter = iter(argss)
+    result_queue = queue.Queue()
+    token = uuid.uuid4().hex[:8]
+    arg_shmss = {}
+    done_results = {}
+    n_tasks_running = set()
+    (submit_count, yield_count) = (0, 0)
+    first_exception = None
+
+    def receive_result():
+        """
+        Wait for the next finished task and store its result (the shared
+        memory blocks of the task are removed).
+        """
+        nonlocal first_exception
+        (n_task, success, value) = result_queue.get()
+        n_tasks_running.remove(n_task)
+        for shm in arg_shmss.pop(n_task, ()):
+            shm.close()
+            shm.unlink()
+        if success and shared_memory:
+            value = _unshare_result(value)
+        elif (not success) and (first_exception is None):
+            first_exception = value
+        done_results[n_task] = (success, value)
+
+    with pool_context as mp_pool:
+        try:
+            with (contextlib.nullcontext() if pbar_func is None else pbar_func(total=pbar_total, **pbar_kwargs)) as pbar:
+                args_exhausted = False
+                while True:
+                    # submit new tasks, until the limit of in-flight tasks is reached
+                    while (not args_exhausted) and (first_exception is None) and ((submit_count - yield_count) < max_in_flight_count):
+                        try:
+                            args = next(arg_iter)
+                        except StopIteration:
+                            args_exhausted = True
+                            break
+                        if shared_memory:
+                            arg_shmss[submit_count] = []
+                            wrapper_arg = (func, _share_args(args=args, shms=arg_shmss[submit_count]), token, submit_count)
+                            wrapper = _star_wrapper_shared_memory
+                        else:
+                            wrapper_arg = (func, args)
+                            wrapper = _star_wrapper
+                        n_tasks_running.add(submit_count)
+                        mp_pool.apply_async(
+                            func=wrapper,
+                            args=(wrapper_arg,),
+                            callback=functools.partial(_put_task_result, result_queue, submit_count, True),
+                            error_callback=functools.partial(_put_task_result, result_queue, submit_count, False),
+                        )
+                        submit_count += 1
+
+                    if yield_count == submit_count:
+                        break
+
+                    # wait for the next result and yield all results which are due
+                    receive_result()
+                    if ordered:
+                        n_tasks_due = [yield_count] if (yield_count in done_results) else []
+                    else:
+                        n_tasks_due = list(done_results.keys())
+                    while n_tasks_due:
+                        n_task = n_tasks_due.pop(0)
+                        (success, value) = done_results.pop(n_task)
+                        if not success:
+                            if shared_memory and n_tasks_running:
+                                # wait for the remaining tasks (they may still be writing shared memory blocks)
+                                while n_tasks_running:
+                                    receive_result()
+                            raise value
+                        yield_count += 1
+                        if pbar is not None:
+                            pbar.update()
+                        yield value
+                        if ordered and (yield_count in done_results):
+                            n_tasks_due.append(yield_count)
+        finally:
+            is_new_process_pool = (pool is None) and (not is_thread_pool)
+            if shared_memory or is_new_process_pool:
+                # wait until the submitted tasks are finished (a persistent pool stays alive and terminating a new pool with queued tasks may deadlock)
+                while n_tasks_running:
+                    receive_result()
+            if is_new_process_pool:
+                mp_pool.close()
+                mp_pool.join()
+            if shared_memory:
+                for shms in arg_shmss.values():
+                    for shm in shms:
+                        shm.close()
+                        shm.unlink()
+
+
+def _init_worker(initializer, initargs, cv2_thread_count):
+    """
+    Internal helper function which is called once in each worker process of
+    `Pool` (and of the pools created by `mp_starmap`) when it is started.
+    """
+    # pre-import dito (and thus NumPy and OpenCV), such that tasks do not pay the import cost
+    import dito
+
+    if cv2_thread_count is not None:
+        cv2.setNumThreads(cv2_thread_count)
+
+    if initializer is not None:
+        initializer(*initargs)
+
+
+class Pool():
+    """
+    Persistent pool of worker processes (or threads) which can be reused
+    across calls.
+
+    Creating a new `multiprocessing.Pool` (as done by `mp_starmap` by default)
+    means spawning processes and importing NumPy, OpenCV and `dito` in each of
+    them. If parallel work is done repeatedly (e.g., once per batch), a `Pool`
+    should be created once and reused (e.g., via `mp_starmap(..., pool=pool)`
+    or `pool.starmap(...)`).
+
+    With `backend="thread"`, the workers are threads (see `mp_starmap` for
+    when this is faster). In this case, the number of threads OpenCV uses
+    internally is limited (process-wide) as long as the pool is open.
+
+    It can be used as context manager, in which case it is closed (after all
+    submitted tasks are finished) on exit.
+
+    Examples
+    --------
+    >>> with Pool(process_count=2) as pool:
+    ...     pool.starmap(func=pow, argss=[(2, 3), (3, 2)])
+    [8, 9]
+    """
+
+    def __init__(self, process_count=None, initializer=None, initargs=(), maxtasksperchild=None, backend="process", cv2_thread_count=None):
+        """
+        Parameters
+        ----------
+        process_count : int or None, optional
+            The number of worker processes (or threads). If None, the number
+            of CPU cores available is used. Default is None.
+        initializer : callable or None, optional
+            Optional function which is called with `initargs` once in each
+            worker when it is started (after `dito` was imported). Default is
+            None.
+        initargs : tuple, optional
+            The arguments to pass to `initializer`. Default is ().
+        maxtasksperchild : int or None, optional
+            The number of tasks after which a worker process is replaced by a
+            new one. If None, worker processes live as long as the pool.
+            Default is None. See `multiprocessing.Pool` for details. It is not
+            supported for the thread backend.
+        backend : str, optional
+            Either "process" (use worker processes) or "thread" (use worker
+            threads). Default is "process".
+        cv2_thread_count : int or None, optional
+            The number of threads OpenCV uses within each worker process (or,
+            for the thread backend, within this process while the pool is
+            open). If None, `max(1, cpu_count // process_count)` is used.
+            Default is None.
+
+        Raises
+        ------
+        ValueError
+            If `backend` is invalid or if `maxtasksperchild` is given for the
+            thread backend.
+        """
+        self.process_count = process_count if (process_count is not None) else _get_cpu_count()
+        self.backend = backend
+        if cv2_thread_count is None:
+            cv2_thread_count = _get_cv2_thread_count(worker_count=self.process_count)
+
+        self.has_cv2_thread_limit = False
+        if backend == "process":
+            _ensure_resource_tracker()
+            self.pool = mp.Pool(processes=self.process_count, initializer=_init_worker, initargs=(initializer, tuple(initargs), cv2_thread_count), maxtasksperchild=maxtasksperchild)
+        elif backend == "thread":
+            if maxtasksperchild is not None:
+                raise ValueError("Argument 'maxtasksperchild' is not supported for the thread backend")
+            self.pool = mp.pool.ThreadPool(processes=self.process_count, initializer=initializer, initargs=tuple(initargs))
+            _acquire_cv2_thread_limit(thread_count=cv2_thread_count)
+            self.has_cv2_thread_limit = True
         else:
-            # case 2: tqdm-compatible progress bar
-            results = []
-            if pbar_kwargs is None:
-                pbar_kwargs = {}
-            with pbar_func(total=len(argss), **pbar_kwargs) as pbar:
-                for result in pool.imap(func=_star_wrapper, iterable=argss_for_star_wrapper, chunksize=chunksize):
-                    pbar.update()
-                    results.append(result)
-            return results
+            raise ValueError("Invalid backend '{}' (must be 'process' or 'thread')".format(backend))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def map(self, func, iterable, chunksize=1):
+        """
+        Return the list `[func(item) for item in iterable]`, computed in
+        parallel. See `multiprocessing.Pool.map` for details.
+        """
+        return self.pool.map(func=func, iterable=iterable, chunksize=chunksize)
+
+    def starmap(self, func, argss, chunksize=1, pbar_func=None, pbar_kwargs=None, shared_memory=False):
+        """
+        Return the list `[func(*args) for args in argss]`, computed in
+        parallel. See `mp_starmap` for details on the arguments.
+        """
+        return mp_starmap(func=func, argss=argss, chunksize=chunksize, pbar_func=pbar_func, pbar_kwargs=pbar_kwargs, shared_memory=shared_memory, pool=self)
+
+    def starmap_iter(self, func, argss, ordered=True, max_in_flight_count=None, pbar_func=None, pbar_kwargs=None, shared_memory=False):
+        """
+        Yield `func(*args)` for each item `args` of `argss` (which can be a
+        generator), computed in parallel. See `mp_starmap_iter` for details on
+        the arguments.
+        """
+        return mp_starmap_iter(func=func, argss=argss, ordered=ordered, max_in_flight_count=max_in_flight_count, pbar_func=pbar_func, pbar_kwargs=pbar_kwargs, shared_memory=shared_memory, pool=self)
+
+    def imap_unordered(self, func, iterable, chunksize=1):
+        """
+        Yield `func(item)` for each item of `iterable` as soon as it is
+        computed, i.e., not necessarily in the order of `iterable`. See
+        `multiprocessing.Pool.imap_unordered` for details.
+        """
+        return self.pool.imap_unordered(func=func, iterable=iterable, chunksize=chunksize)
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Schedule `func(*args, **kwargs)` to be run in a worker process and
+        return a `concurrent.futures.Future` representing its result.
+
+        Once submitted, tasks can not be cancelled.
+        """
+        future = concurrent.futures.Future()
+        future.set_running_or_notify_cancel()
+        self.pool.apply_async(func=func, args=args, kwds=kwargs, callback=future.set_result, error_callback=future.set_exception)
+        return future
+
+    def close(self):
+        """
+        Wait until all submitted tasks are finished and stop the worker
+        processes. Calling it more than once has no effect.
+        """
+        self.pool.close()
+        self.pool.join()
+        self._release_cv2_thread_limit()
+
+    def terminate(self):
+        """
+        Stop the worker processes immediately, without waiting for submitted
+        tasks to finish.
+        """
+        self.pool.terminate()
+        self.pool.join()
+        self._release_cv2_thread_limit()
+
+    def _release_cv2_thread_limit(self):
+        if self.has_cv2_thread_limit:
+            _release_cv2_thread_limit()
+            self.has_cv2_thread_limit = False
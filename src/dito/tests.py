@@ -1,6 +1,10 @@
+import asyncio
 import collections
+import concurrent.futures
+import multiprocessing
 import os.path
 import pathlib
+import threading
 import unittest
 
 import cv2
@@ -130,6 +134,98 @@ class CachedImageLoader_Test(TempDirTestCase):
         filename = os.path.join(self.temp_dir.name, "__nonexistent__.png")
         self.assertRaises(FileNotFoundError, lambda: loader.load(filename=filename))
 
+    def _save_images(self, count):
+        filenames = []
+        for n_image in range(count):
+            filename = os.path.join(self.temp_dir.name, "image_{}.png".format(n_image))
+            dito.save(filename=filename, image=dito.random_image(size=(32, 16), color=False))
+            filenames.append(filename)
+        return filenames
+
+    def test_CachedImageLoader_max_bytes_lru(self):
+        # each image has 512 bytes, so the cache can hold two of them
+        filenames = self._save_images(count=3)
+        loader = dito.CachedImageLoader(max_count=None, max_bytes=1024, policy="lru")
+
+        loader.load(filename=filenames[0])
+        loader.load(filename=filenames[1])
+        loader.load(filename=filenames[0])
+        loader.load(filename=filenames[2])
+        info = loader.get_cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions), (1, 3, 1))
+        self.assertEqual((info.currsize, info.currbytes), (2, 1024))
+
+        # image 1 was the least recently used one and must have been evicted
+        loader.load(filename=filenames[0])
+        loader.load(filename=filenames[1])
+        info = loader.get_cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions), (2, 4, 2))
+
+    def test_CachedImageLoader_max_bytes_lfu(self):
+        filenames = self._save_images(count=3)
+        loader = dito.CachedImageLoader(max_count=None, max_bytes=1024, policy="lfu")
+
+        loader.load(filename=filenames[0])
+        loader.load(filename=filenames[0])
+        loader.load(filename=filenames[1])
+        loader.load(filename=filenames[2])
+
+        # image 1 was the least frequently used one and must have been evicted
+        loader.load(filename=filenames[0])
+        info = loader.get_cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions), (2, 3, 1))
+        loader.load(filename=filenames[1])
+        self.assertEqual(loader.get_cache_info().misses, 4)
+
+    def test_CachedImageLoader_max_bytes_lfu_keeps_new_entry(self):
+        filenames = self._save_images(count=3)
+        loader = dito.CachedImageLoader(max_count=None, max_bytes=1024, policy="lfu")
+        for filename in filenames[:2]:
+            for _ in range(3):
+                loader.load(filename=filename)
+
+        # the new image has a lower use count than all other entries, but it must be cached nevertheless
+        loader.load(filename=filenames[2])
+        loader.load(filename=filenames[2])
+        info = loader.get_cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions, info.currsize), (5, 3, 1, 2))
+
+    def test_CachedImageLoader_max_bytes_too_large(self):
+        filenames = self._save_images(count=1)
+        loader = dito.CachedImageLoader(max_bytes=256)
+        image = loader.load(filename=filenames[0])
+        loader.load(filename=filenames[0])
+        info = loader.get_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize, info.currbytes), (0, 2, 0, 0))
+
+        # images which are not cached are not made read-only
+        self.assertTrue(image.flags.writeable)
+
+    def test_CachedImageLoader_max_bytes_read_only(self):
+        filenames = self._save_images(count=1)
+        loader = dito.CachedImageLoader(max_bytes=1024)
+        for _ in range(2):
+            image = loader.load(filename=filenames[0])
+            self.assertFalse(image.flags.writeable)
+            with self.assertRaises(ValueError):
+                image[0, 0] = 0
+
+    def test_CachedImageLoader_max_bytes_invalidation(self):
+        filenames = self._save_images(count=1)
+        loader = dito.CachedImageLoader(max_bytes=4096)
+        image_before = loader.load(filename=filenames[0])
+
+        # overwrite the file with a differently sized image
+        image_new = dito.random_image(size=(16, 16), color=False)
+        dito.save(filename=filenames[0], image=image_new)
+        image_after = loader.load(filename=filenames[0])
+        self.assertEqual(image_before.shape, (16, 32))
+        self.assertEqualImages(image_after, image_new)
+        self.assertEqual(loader.get_cache_info().invalidations, 1)
+
+    def test_CachedImageLoader_raise_on_invalid_policy(self):
+        self.assertRaises(ValueError, lambda: dito.CachedImageLoader(max_bytes=1024, policy="fifo"))
+
 
 class abs_diff_Tests(DiffTestCase):
     def test_abs_diff_bool(self):
@@ -212,6 +308,58 @@ class adaptive_round_Tests(TestCase):
         self.assertEqual(int(dito.adaptive_round(number=number, digit_count=4)), 123)
 
 
+def _apply_pointwise_square(image, scale):
+    return (image.astype(np.float32) ** 2) * scale
+
+
+class apply_pointwise_Tests(TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(seed=0)
+
+    def assertEqualArrays(self, x, y):
+        self.assertEqual(x.dtype, y.dtype)
+        self.assertTrue(np.array_equal(x, y))
+
+    def get_images(self):
+        return [
+            self.rng.integers(0, 256, size=(32, 48, 3), dtype=np.uint8),
+            self.rng.integers(0, 256, size=(32, 48), dtype=np.uint8),
+            self.rng.integers(0, 256, size=(32, 48, 1), dtype=np.uint8),
+            self.rng.integers(0, 256, size=(4, 32, 48, 3), dtype=np.uint8),
+            self.rng.integers(-128, 128, size=(32, 48, 3), dtype=np.int8),
+            self.rng.integers(0, 2, size=(32, 48)).astype(np.bool_),
+            self.rng.integers(0, 2**16, size=(256, 300), dtype=np.uint16),
+            self.rng.integers(-2**15, 2**15, size=(256, 300), dtype=np.int16),
+        ]
+
+    def test_apply_pointwise_identical(self):
+        for image in self.get_images():
+            result = dito.apply_pointwise(image, _apply_pointwise_square, 0.5)
+            self.assertEqualArrays(result, _apply_pointwise_square(image, 0.5))
+
+    def test_apply_pointwise_bool_result(self):
+        for image in self.get_images():
+            result = dito.apply_pointwise(image, np.greater, 7)
+            self.assertEqualArrays(result, np.greater(image, 7))
+
+    def test_apply_pointwise_small_image(self):
+        image = self.rng.integers(0, 2**16, size=(8, 8), dtype=np.uint16)
+        self.assertEqualArrays(dito.apply_pointwise(image, _apply_pointwise_square, 2.0), _apply_pointwise_square(image, 2.0))
+
+    def test_apply_pointwise_out(self):
+        for image in self.get_images():
+            out = np.empty(shape=image.shape, dtype=np.float32)
+            result = dito.apply_pointwise(image, _apply_pointwise_square, 1.0, out=out)
+            self.assertIs(result, out)
+            self.assertEqualArrays(out, _apply_pointwise_square(image, 1.0))
+
+    def test_apply_pointwise_input_unchanged(self):
+        image = self.rng.integers(0, 256, size=(32, 48, 3), dtype=np.uint8)
+        image_copy = image.copy()
+        dito.apply_pointwise(image, _apply_pointwise_square, 1.0)
+        self.assertEqualArrays(image, image_copy)
+
+
 class as_channel_Tests(TestCase):
     def test_as_channels_raise_on_none(self):
         self.assertRaises(ValueError, lambda: dito.as_channels(b=None, g=None, r=None))
@@ -286,6 +434,30 @@ class as_gray_Tests(TestCase):
         self.assertEqual(image_gray.shape, image.shape)
         self.assertEqualImages(image, image_gray)
 
+    def test_as_gray_batch(self):
+        images = np.stack([dito.pm5544()[::8, ::8, :], dito.pm5544()[::-8, ::8, :]])
+        images_gray = dito.as_gray(images, batch=True)
+        self.assertEqual(images_gray.shape, images.shape[:3])
+        for (image, image_gray) in zip(images, images_gray):
+            self.assertEqualImages(image_gray, dito.as_gray(image))
+
+    def test_as_gray_batch_with_keep_color_dimension(self):
+        images = np.stack([dito.pm5544()[::8, ::8, :]] * 3)
+        self.assertEqual(dito.as_gray(images, keep_color_dimension=True, batch=True).shape, images.shape[:3] + (1,))
+        images_gray = images[:, :, :, 0]
+        self.assertIs(dito.as_gray(images_gray, batch=True), images_gray)
+        self.assertEqual(dito.as_gray(images_gray[:, :, :, np.newaxis], batch=True).shape, images_gray.shape + (1,))
+
+    def test_as_gray_batch_singleton_channel(self):
+        images = np.stack([dito.pm5544()[::8, ::8, :1]] * 3)
+        images_gray = dito.as_gray(images, batch=True)
+        self.assertEqual(images_gray.shape, images.shape)
+        for (image, image_gray) in zip(images, images_gray):
+            self.assertEqual(dito.as_gray(image).shape, image_gray.shape)
+
+    def test_as_gray_batch_raise_on_single_image(self):
+        self.assertRaises(ValueError, lambda: dito.as_gray(dito.pm5544()[:, :, 0], batch=True))
+
 
 class clip_Tests(TestCase):
     def test_clip_01(self):
@@ -300,6 +472,45 @@ class clip_Tests(TestCase):
         image_clipped = dito.clip_01(image=image)
         self.assertEqualImages(image, image_copy)
 
+    def test_clip_out(self):
+        image = np.array([[0, 1, 2, 3, 4, 5, 6, 7]], dtype=np.uint8)
+        out = np.zeros_like(image)
+        image_clipped = dito.clip(image=image, lower=2, upper=5, out=out)
+        self.assertIs(image_clipped, out)
+        self.assertEqualImages(out, dito.clip(image=image, lower=2, upper=5))
+        self.assertEqualImages(image, np.array([[0, 1, 2, 3, 4, 5, 6, 7]], dtype=np.uint8))
+
+    def test_clip_inplace(self):
+        image = np.array([[-2.0, np.nan, 0.5, 2.0]], dtype=np.float32)
+        image_clipped = dito.clip_01(image=image, inplace=True)
+        self.assertIs(image_clipped, image)
+        self.assertTrue(np.array_equal(image, np.array([[0.0, np.nan, 0.5, 1.0]], dtype=np.float32), equal_nan=True))
+
+    def test_clip_bounds_outside_dtype_range(self):
+        image = np.array([[0, 5, 10, 100, 255]], dtype=np.uint8)
+        for (lower, upper, image_expected) in ((10, 300, [[10, 10, 10, 100, 255]]), (-5, 100, [[0, 5, 10, 100, 100]]), (300, 400, [[255] * 5])):
+            image_expected = np.array(image_expected, dtype=np.uint8)
+            self.assertEqualImages(dito.clip(image=image, lower=lower, upper=upper), image_expected)
+            self.assertEqualImages(dito.clip(image=image, lower=lower, upper=upper, out=np.zeros_like(image)), image_expected)
+
+    def test_clip_stack(self):
+        images = np.stack([dito.pm5544()[::8, ::8, :]] * 3)
+        images_clipped = dito.clip(image=images, lower=50, upper=200)
+        self.assertEqual(images_clipped.shape, images.shape)
+        self.assertEqualImages(images_clipped[1], dito.clip(image=images[1], lower=50, upper=200))
+
+    def test_clip_out_no_bounds(self):
+        image = np.array([[0, 1, 2]], dtype=np.uint8)
+        out = np.zeros_like(image)
+        self.assertIs(dito.clip(image=image, out=out), out)
+        self.assertEqualImages(out, image)
+
+    def test_clip_out_raise(self):
+        image = np.array([[0, 1, 2]], dtype=np.uint8)
+        self.assertRaises(ValueError, lambda: dito.clip(image=image, lower=1, out=np.zeros(shape=(1, 3), dtype=np.float32)))
+        self.assertRaises(ValueError, lambda: dito.clip(image=image, lower=1, out=np.zeros(shape=(1, 4), dtype=np.uint8)))
+        self.assertRaises(ValueError, lambda: dito.clip(image=image, lower=1, out=np.zeros_like(image), inplace=True))
+
 
 class clipped_diff_Tests(DiffTestCase):
     def test_clipped_diff_bool(self):
@@ -444,6 +655,14 @@ class convert_Tests(TestCase):
         self.assertAlmostEqual(np.min(image_converted), 0.0)
         self.assertAlmostEqual(np.max(image_converted), 1.0)
 
+    def test_convert_stack(self):
+        images = np.stack([dito.pm5544()[::8, ::8, :], dito.pm5544()[::-8, ::8, :]])
+        for dtype in (np.uint16, np.float32, np.bool_):
+            images_converted = dito.convert(image=images, dtype=dtype)
+            self.assertEqual(images_converted.shape, images.shape)
+            for (image, image_converted) in zip(images, images_converted):
+                self.assertEqualImages(image_converted, dito.convert(image=image, dtype=dtype))
+
     def test_convert_bool_uint8(self):
         image = np.array([[False, True]], dtype=np.bool_)
         image_converted = dito.convert(image=image, dtype=np.uint8)
@@ -469,6 +688,37 @@ class convert_Tests(TestCase):
         self.assertAlmostEqual(np.min(image_clipped), 0.0)
         self.assertAlmostEqual(np.max(image_clipped), 1.0)
 
+    def test_convert_float_uint8_truncated(self):
+        image = np.array([[-1.0, 0.0, 0.5, 0.999, 1.0, 2.0]], dtype=np.float32)
+        image_converted = dito.convert(image=image, dtype=np.uint8)
+        self.assertEqualImages(image_converted, np.array([[0, 0, 127, 254, 255, 255]], dtype=np.uint8))
+
+    def test_convert_out(self):
+        image = dito.pm5544()
+        for dtype in (np.uint8, np.uint16, np.float32, np.float64, np.bool_):
+            out = np.empty(shape=image.shape, dtype=dtype)
+            image_converted = dito.convert(image=image, dtype=dtype, out=out)
+            self.assertIs(image_converted, out)
+            self.assertEqualImages(out, dito.convert(image=image, dtype=dtype))
+
+    def test_convert_out_float(self):
+        image = np.array([[-2.0, 0.0, 0.25, 1.0, 2.0]], dtype=np.float64)
+        for dtype in (np.uint8, np.uint16, np.float32, np.float64):
+            out = np.empty(shape=image.shape, dtype=dtype)
+            dito.convert(image=image, dtype=dtype, out=out)
+            self.assertEqualImages(out, dito.convert(image=image, dtype=dtype))
+
+    def test_convert_inplace(self):
+        image = np.array([[-2.0, 0.5, 2.0]], dtype=np.float32)
+        image_converted = dito.convert(image=image, dtype=np.float32, inplace=True)
+        self.assertIs(image_converted, image)
+        self.assertEqualImages(image, np.array([[0.0, 0.5, 1.0]], dtype=np.float32))
+
+    def test_convert_inplace_raise(self):
+        image = dito.pm5544()
+        self.assertRaises(ValueError, lambda: dito.convert(image=image, dtype=np.float32, inplace=True))
+        self.assertRaises(ValueError, lambda: dito.convert(image=image, dtype=np.float32, out=np.empty_like(image)))
+
 
 class convert_color_Tests(TestCase):
     def test_convert_color_argument_is_color(self):
@@ -604,6 +854,129 @@ class fig_to_image_Tests(TestCase):
         self.assertDifferingImages(image_default, image_custom)
 
 
+class DiskCachedImageLoader_Tests(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.filenames = []
+        for n_image in range(3):
+            filename = os.path.join(self.temp_dir.name, "image_{}.png".format(n_image))
+            dito.save(filename=filename, image=dito.random_image(size=(64, 32), color=True))
+            self.filenames.append(filename)
+
+    def test_DiskCachedImageLoader_hit_miss(self):
+        loader = dito.DiskCachedImageLoader(cache_dir=self.cache_dir)
+        image_miss = loader.load(filename=self.filenames[0])
+        image_hit = loader.load(filename=self.filenames[0])
+        self.assertEqualImages(np.asarray(image_miss), dito.load(filename=self.filenames[0]))
+        self.assertEqualImages(np.asarray(image_hit), np.asarray(image_miss))
+        self.assertIsInstance(image_hit, np.memmap)
+
+        info = loader.get_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+        # different color mode -> different cache entry
+        image_gray = loader.load(filename=self.filenames[0], color=False)
+        self.assertNumpyShape(image_gray, (32, 64))
+        self.assertEqual(loader.get_cache_info().misses, 2)
+
+    def test_DiskCachedImageLoader_hit_miss_same_type(self):
+        for mmap in (True, False):
+            loader = dito.DiskCachedImageLoader(cache_dir=os.path.join(self.cache_dir, str(mmap)), mmap=mmap)
+            image_miss = loader.load(filename=self.filenames[0])
+            image_hit = loader.load(filename=self.filenames[0])
+            self.assertEqual((loader.get_cache_info().hits, loader.get_cache_info().misses), (1, 1))
+            self.assertIs(type(image_miss), type(image_hit))
+            self.assertEqual(image_miss.flags.writeable, image_hit.flags.writeable)
+            self.assertEqual(image_hit.flags.writeable, not mmap)
+
+    def test_DiskCachedImageLoader_persistent(self):
+        dito.DiskCachedImageLoader(cache_dir=self.cache_dir).load(filename=self.filenames[0])
+        loader = dito.DiskCachedImageLoader(cache_dir=self.cache_dir, mmap=False)
+        image = loader.load(filename=self.filenames[0])
+        self.assertNotIsInstance(image, np.memmap)
+        self.assertEqual(loader.get_cache_info().hits, 1)
+
+    def test_DiskCachedImageLoader_invalidation(self):
+        loader = dito.DiskCachedImageLoader(cache_dir=self.cache_dir)
+        loader.load(filename=self.filenames[0])
+        image_new = dito.random_image(size=(16, 16), color=True)
+        dito.save(filename=self.filenames[0], image=image_new)
+        self.assertEqualImages(np.asarray(loader.load(filename=self.filenames[0])), image_new)
+        self.assertEqual(loader.get_cache_info().misses, 2)
+
+    def test_DiskCachedImageLoader_use_hash(self):
+        loader = dito.DiskCachedImageLoader(cache_dir=self.cache_dir, use_hash=True)
+        loader.load(filename=self.filenames[0])
+        os.utime(self.filenames[0], (0, 0))
+        loader.load(filename=self.filenames[0])
+        self.assertEqual(loader.get_cache_info().hits, 1)
+
+    def test_DiskCachedImageLoader_eviction(self):
+        # each cache file is larger than 6144 bytes, so at most one of them fits into the cache
+        loader = dito.DiskCachedImageLoader(cache_dir=self.cache_dir, max_bytes=10000)
+        for filename in self.filenames:
+            loader.load(filename=filename)
+        info = loader.get_cache_info()
+        self.assertEqual((info.currsize, info.evictions), (1, 2))
+        self.assertLessEqual(info.currbytes, 10000)
+
+        # the most recently loaded image must still be cached
+        loader.load(filename=self.filenames[-1])
+        self.assertEqual(loader.get_cache_info().hits, 1)
+
+    def test_DiskCachedImageLoader_clear_cache(self):
+        loader = dito.DiskCachedImageLoader(cache_dir=self.cache_dir)
+        for filename in self.filenames:
+            loader.load(filename=filename)
+        self.assertEqual(loader.get_cache_info().currsize, 3)
+        loader.clear_cache()
+        self.assertEqual(loader.get_cache_info().currsize, 0)
+
+    def test_DiskCachedImageLoader_keeps_other_files(self):
+        loader = dito.DiskCachedImageLoader(cache_dir=self.cache_dir, max_bytes=10000)
+        other_filename = os.path.join(self.cache_dir, "mydata.npy")
+        np.save(other_filename, np.zeros(shape=(64, 64), dtype=np.uint8))
+        for filename in self.filenames:
+            loader.load(filename=filename)
+        self.assertTrue(os.path.basename(loader.get_cache_filename(filename=self.filenames[0])).startswith("dito-cache-"))
+        self.assertEqual(loader.get_cache_info().currsize, 1)
+        loader.clear_cache()
+        self.assertEqual(loader.get_cache_info().currsize, 0)
+        self.assertTrue(os.path.exists(other_filename))
+
+    def test_DiskCachedImageLoader_no_scan_on_miss(self):
+        loader = dito.DiskCachedImageLoader(cache_dir=self.cache_dir)
+        scan_count = [0]
+        get_cache_files = loader._get_cache_files
+        def get_cache_files_counted(*args, **kwargs):
+            scan_count[0] += 1
+            return get_cache_files(*args, **kwargs)
+        loader._get_cache_files = get_cache_files_counted
+        for filename in self.filenames:
+            loader.load(filename=filename)
+        self.assertEqual(scan_count[0], 0)
+        self.assertEqual(loader.currbytes, loader.get_cache_info().currbytes)
+
+    def test_DiskCachedImageLoader_removes_stale_temp_files(self):
+        dito.utils.mkdir(self.cache_dir)
+        temp_filenames = [os.path.join(self.cache_dir, "dito-cache-{}.npy.0123.tmp".format(n_file)) for n_file in range(2)]
+        for temp_filename in temp_filenames:
+            with open(temp_filename, "wb") as f:
+                f.write(b"\x00" * 100)
+        os.utime(temp_filenames[0], (0, 0))
+        dito.DiskCachedImageLoader(cache_dir=self.cache_dir)
+        self.assertFalse(os.path.exists(temp_filenames[0]))
+        self.assertTrue(os.path.exists(temp_filenames[1]))
+        dito.DiskCachedImageLoader(cache_dir=self.cache_dir).clear_cache()
+        self.assertFalse(os.path.exists(temp_filenames[1]))
+
+    def test_DiskCachedImageLoader_raise(self):
+        loader = dito.DiskCachedImageLoader(cache_dir=self.cache_dir)
+        filename = os.path.join(self.temp_dir.name, "__nonexistent__.png")
+        self.assertRaises(FileNotFoundError, lambda: loader.load(filename=filename))
+
+
 class encode_Tests(TestCase):
     def test_encode_extensions(self):
         image = dito.pm5544()
@@ -623,6 +996,26 @@ class encode_Tests(TestCase):
         image_decoded = dito.decode(b=image_encoded)
         self.assertEqualImages(image, image_decoded)
 
+    def test_decode_bytes_like(self):
+        image = dito.pm5544()
+        image_encoded = dito.encode(image=image)
+        for b in (bytearray(image_encoded), memoryview(image_encoded), np.frombuffer(image_encoded, dtype=np.uint8)):
+            self.assertEqualImages(image, dito.decode(b=b))
+
+    def test_encode_many_decode_many(self):
+        images = [dito.random_image(size=(64, 48), color=(n_image % 2 == 0)) for n_image in range(10)]
+        for worker_count in (None, 1, 3):
+            images_encoded = dito.encode_many(images=images, worker_count=worker_count)
+            self.assertEqual(images_encoded, [dito.encode(image=image) for image in images])
+            images_decoded = dito.decode_many(bs=[memoryview(b) for b in images_encoded], worker_count=worker_count)
+            self.assertEqual(len(images_decoded), len(images))
+            for (image, image_decoded) in zip(images, images_decoded):
+                self.assertEqualImages(image, image_decoded)
+
+    def test_encode_many_empty(self):
+        self.assertEqual(dito.encode_many(images=[]), [])
+        self.assertEqual(dito.decode_many(bs=[]), [])
+
 
 class gamma_Tests(TestCase):
     def setUp(self):
@@ -647,6 +1040,12 @@ class gamma_Tests(TestCase):
         image_gamma = dito.gamma(image=self.image, exponent=1.0)
         self.assertEqualImages(image_gamma, self.image)
 
+    def test_gamma_uint16_lut(self):
+        image = dito.convert(image=dito.pm5544(), dtype=np.uint16)
+        image_gamma = dito.gamma(image=image, exponent=0.5)
+        image_float_gamma = dito.convert(image=image, dtype=np.float32) ** 0.5
+        self.assertEqualImages(image_gamma, dito.convert(image=image_float_gamma, dtype=np.uint16))
+
     def test_gamma_0_5_brighter(self):
         image_gamma = dito.gamma(image=self.image, exponent=0.5)
         self.assertEqualImageContainers(image_gamma, self.image)
@@ -1060,6 +1459,19 @@ class invert_Tests(TestCase):
         image_bool_inverted = dito.invert(image=image_bool)
         self.assertEqualImages(image_bool_inverted, np.logical_not(image_bool))
 
+    def test_invert_out(self):
+        for image in (self.image, dito.convert(image=self.image, dtype=np.float32), self.image > 127):
+            out = np.empty_like(image)
+            image_inverted = dito.invert(image=image, out=out)
+            self.assertIs(image_inverted, out)
+            self.assertEqualImages(out, dito.invert(image=image))
+
+    def test_invert_inplace(self):
+        image = self.image.copy()
+        image_inverted = dito.invert(image=image, inplace=True)
+        self.assertIs(image_inverted, image)
+        self.assertEqualImages(image, 255 - self.image)
+
 
 class is_color_Tests(TestCase):
     def setUp(self):
@@ -1095,6 +1507,69 @@ class is_gray_Tests(TestCase):
         self.assertFalse(dito.is_gray(self.image[:, :, 0:2]))
 
 
+class LazyCziArray_Tests(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        image = dito.convert(np.random.uniform(size=(2, 5, 64, 128, 3)), np.uint8)
+        self.image_path = pathlib.Path(self.temp_dir.name).joinpath("image.czi")
+        dito.save(self.image_path, image, czi_kwargs={"extra_dim_names": "TZ"})
+        self.image = dito.load(self.image_path)
+
+    def test_LazyCziArray_shape_dtype(self):
+        with dito.LazyCziArray(self.image_path) as czi_array:
+            self.assertEqual(czi_array.shape, self.image.shape)
+            self.assertEqual(czi_array.dtype, self.image.dtype)
+            self.assertEqual(czi_array.dim_names, ("Z", "T"))
+            self.assertEqual(czi_array.nbytes, self.image.nbytes)
+
+    def test_LazyCziArray_getitem(self):
+        items = [
+            np.s_[...],
+            np.s_[1],
+            np.s_[1, 0],
+            np.s_[:, :, 10:20, 30:90:3],
+            np.s_[..., 5, :, 1],
+            np.s_[::-2, 1:, ::-1, -5:],
+            np.s_[..., 0:0, :, :],
+            np.s_[-1, -1, -1, -1, -1],
+        ]
+        for worker_count in (None, 3):
+            with dito.LazyCziArray(self.image_path, worker_count=worker_count) as czi_array:
+                for item in items:
+                    self.assertEqualImages(czi_array[item], self.image[item], enforce_is_image=False)
+
+    def test_LazyCziArray_getitem_raise(self):
+        with dito.LazyCziArray(self.image_path) as czi_array:
+            self.assertRaises(IndexError, lambda: czi_array[5])
+            self.assertRaises(IndexError, lambda: czi_array[0, 0, 0, 0, 0, 0])
+            self.assertRaises(IndexError, lambda: czi_array[..., 0, ...])
+            self.assertRaises(TypeError, lambda: czi_array[[0, 1]])
+
+    def test_LazyCziArray_iter_planes(self):
+        for worker_count in (None, 2):
+            with dito.LazyCziArray(self.image_path, worker_count=worker_count) as czi_array:
+                plane_count = 0
+                for (indices, plane) in czi_array.iter_planes(roi=(8, 4, 16, 32)):
+                    self.assertEqualImages(plane, self.image[indices + (slice(4, 36), slice(8, 24))])
+                    plane_count += 1
+                self.assertEqual(plane_count, 10)
+
+    def test_LazyCziArray_read_plane_raise_on_invalid_roi(self):
+        with dito.LazyCziArray(self.image_path) as czi_array:
+            self.assertRaises(ValueError, lambda: czi_array.read_plane(indices=(0, 0), roi=(120, 0, 16, 16)))
+            self.assertRaises(ValueError, lambda: czi_array.read_plane(indices=(0,)))
+
+    def test_load_czi_roi(self):
+        for roi in [(10, 20, 30, 40), (-5, -7, 30, 40), (120, 60, 20, 20), (1000, 1000, 5, 6)]:
+            image_roi = dito.load(self.image_path, roi=roi)
+            image_expected = dito.PaddedImageIndexer(self.image)[:, :, roi[1]:(roi[1] + roi[3]), roi[0]:(roi[0] + roi[2]), :]
+            self.assertEqualImages(image_roi, image_expected, enforce_is_image=False)
+
+    def test_load_czi_worker_count(self):
+        image_loaded = dito.load(self.image_path, czi_kwargs={"worker_count": 4})
+        self.assertEqualImages(image_loaded, self.image, enforce_is_image=False)
+
+
 class load_Tests(TempDirTestCase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -1150,6 +1625,398 @@ class load_Tests(TempDirTestCase):
         self.assertEqual(image_loaded.shape, (1, 1, 1, 1, 1, 1, 1, 1, 576, 768, 3))
 
 
+class load_mmap_Tests(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.image = dito.pm5544()
+
+    def test_load_mmap_npy(self):
+        filename = os.path.join(self.temp_dir.name, "image.npy")
+        dito.save(filename=filename, image=self.image)
+        image_loaded = dito.load(filename=filename, mmap=True)
+        self.assertIsInstance(image_loaded, np.memmap)
+        self.assertFalse(image_loaded.flags.writeable)
+        self.assertEqualImages(np.asarray(image_loaded), self.image)
+
+    def test_load_mmap_npz_uncompressed(self):
+        for image in (self.image, np.asfortranarray(self.image[:, :, 0])):
+            filename = os.path.join(self.temp_dir.name, "image.npz")
+            np.savez(filename, arr_0=image)
+            image_loaded = dito.load(filename=filename, mmap=True)
+            self.assertIsInstance(image_loaded, np.memmap)
+            self.assertEqualImages(np.asarray(image_loaded), image)
+
+    def test_load_mmap_npz_compressed(self):
+        filename = os.path.join(self.temp_dir.name, "image.npz")
+        dito.save(filename=filename, image=self.image)
+        image_loaded = dito.load(filename=filename, mmap=True)
+        self.assertNotIsInstance(image_loaded, np.memmap)
+        self.assertEqualImages(image_loaded, self.image)
+
+    def test_load_mmap_npz_raise_on_multiple_arrays(self):
+        filename = os.path.join(self.temp_dir.name, "image.npz")
+        np.savez(filename, arr_0=self.image, arr_1=self.image)
+        self.assertRaises(ValueError, lambda: dito.load(filename=filename, mmap=True))
+
+    def test_load_mmap_png_no_effect(self):
+        filename = os.path.join(self.temp_dir.name, "image.png")
+        dito.save(filename=filename, image=self.image)
+        image_loaded = dito.load(filename=filename, mmap=True)
+        self.assertNotIsInstance(image_loaded, np.memmap)
+        self.assertEqualImages(image_loaded, self.image)
+
+    def test_load_lazy(self):
+        filename = os.path.join(self.temp_dir.name, "image.npy")
+        dito.save(filename=filename, image=self.image)
+        image_loaded = dito.load_lazy(filename=filename)
+        self.assertIsInstance(image_loaded, np.memmap)
+
+    def test_load_mmap_info_and_stack(self):
+        filename = os.path.join(self.temp_dir.name, "image.npy")
+        dito.save(filename=filename, image=self.image)
+        image_loaded = dito.load_lazy(filename=filename)
+
+        info = dito.info(image_loaded)
+        info_expected = dito.info(self.image)
+        self.assertEqual(info.keys(), info_expected.keys())
+        for key in ("mean", "std"):
+            self.assertAlmostEqual(info[key], info_expected[key])
+        for key in ("shape", "dtype", "min", "max", "hash"):
+            self.assertEqual(info[key], info_expected[key])
+
+        self.assertEqualImages(dito.stack([image_loaded, image_loaded]), dito.stack([self.image, self.image]))
+
+
+class load_reduce_Tests(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.image = dito.pm5544()
+        self.filename_jpg = os.path.join(self.temp_dir.name, "image.jpg")
+        dito.save(filename=self.filename_jpg, image=self.image)
+
+    def test_load_reduce_jpg(self):
+        for (reduce, flags) in ((2, cv2.IMREAD_REDUCED_COLOR_2), (4, cv2.IMREAD_REDUCED_COLOR_4), (8, cv2.IMREAD_REDUCED_COLOR_8)):
+            image_reduced = dito.load(filename=self.filename_jpg, reduce=reduce)
+            self.assertEqualImages(image_reduced, cv2.imread(self.filename_jpg, flags))
+            self.assertEqual(image_reduced.shape, (576 // reduce, 768 // reduce, 3))
+        image_reduced_gray = dito.load(filename=self.filename_jpg, reduce=2, color=False)
+        self.assertEqualImages(image_reduced_gray, cv2.imread(self.filename_jpg, cv2.IMREAD_REDUCED_GRAYSCALE_2))
+        self.assertEqualImages(dito.load(filename=self.filename_jpg, reduce=1), dito.load(filename=self.filename_jpg))
+
+    def test_load_max_size(self):
+        for (max_size, expected_size) in ((200, (200, 150)), ((1000, 100), (133, 100)), (10000, (768, 576)), ((384, 288), (384, 288))):
+            image_reduced = dito.load(filename=self.filename_jpg, max_size=max_size)
+            self.assertEqual(dito.size(image_reduced), expected_size)
+
+    def test_load_reduce_exif_orientation(self):
+        # JPEG of size 400x200 with EXIF orientation 6 (rotated by 90 degrees)
+        image = np.zeros(shape=(200, 400, 3), dtype=np.uint8)
+        image[:, :200, :] = 255
+        exif_segment = b"\xff\xe1\x00\x22Exif\x00\x00II*\x00\x08\x00\x00\x00\x01\x00\x12\x01\x03\x00\x01\x00\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00"
+        b = dito.encode(image=image, extension="jpg")
+        filename = os.path.join(self.temp_dir.name, "image_rotated.jpg")
+        with open(filename, "wb") as f:
+            f.write(b[:2] + exif_segment + b[2:])
+
+        # the reduced images must have the orientation of the fully decoded image
+        for color in (None, True, False):
+            image_full = dito.load(filename=filename, color=color)
+            (width, height) = dito.size(image_full)
+            self.assertEqual(dito.size(dito.load(filename=filename, color=color, reduce=2)), (width // 2, height // 2))
+            self.assertEqual(dito.size(dito.load(filename=filename, color=color, max_size=100)), (100, 50) if (width > height) else (50, 100))
+        self.assertEqual(dito.load(filename=filename, color=True).shape, (400, 200, 3))
+        self.assertEqual(dito.load(filename=filename).shape, (200, 400, 3))
+
+    def test_load_reduce_without_reduced_decoding(self):
+        # images with alpha channel and NumPy images are resized after loading
+        image_alpha = np.random.randint(0, 256, size=(30, 41, 4), dtype=np.uint8)
+        for extension in (".png", ".npy"):
+            filename = os.path.join(self.temp_dir.name, "image_alpha{}".format(extension))
+            dito.save(filename=filename, image=image_alpha)
+            self.assertEqual(dito.load(filename=filename, reduce=4).shape, (8, 11, 4))
+            self.assertEqual(dito.load(filename=filename, max_size=20).shape, (15, 20, 4))
+
+    def test_load_reduce_raise_on_invalid_args(self):
+        self.assertRaises(ValueError, lambda: dito.load(filename=self.filename_jpg, reduce=3))
+        self.assertRaises(ValueError, lambda: dito.load(filename=self.filename_jpg, reduce=2, max_size=100))
+        self.assertRaises(ValueError, lambda: dito.load(filename=self.filename_jpg, max_size=0))
+
+    def test_load_multiple_iter_max_size(self):
+        images = list(dito.load_multiple_iter(self.temp_dir.name, "*.jpg", max_size=100))
+        self.assertEqual(len(images), 1)
+        self.assertEqual(dito.size(images[0]), (100, 75))
+
+    def test_CachedImageLoader_reduce(self):
+        for max_bytes in (None, 2 ** 24):
+            loader = dito.CachedImageLoader(max_bytes=max_bytes)
+            image_full = loader.load(filename=self.filename_jpg)
+            image_reduced = loader.load(filename=self.filename_jpg, reduce=4)
+            self.assertEqual(image_full.shape, (576, 768, 3))
+            self.assertEqual(image_reduced.shape, (144, 192, 3))
+            self.assertEqual(loader.get_cache_info().misses, 2)
+
+
+class load_roi_Tests(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.image = dito.pm5544()
+        self.rois = [(10, 20, 30, 40), (-5, -7, 30, 40), (760, 570, 20, 20), (1000, 1000, 5, 6), (0, 0, 0, 0)]
+
+    def get_expected(self, image, roi):
+        return dito.PaddedImageIndexer(image)[roi[1]:(roi[1] + roi[3]), roi[0]:(roi[0] + roi[2])]
+
+    def test_load_roi(self):
+        for extension in (".npy", ".npz", ".png"):
+            filename = os.path.join(self.temp_dir.name, "image{}".format(extension))
+            dito.save(filename=filename, image=self.image)
+            for roi in self.rois:
+                image_roi = dito.load(filename=filename, roi=roi)
+                self.assertNotIsInstance(image_roi, np.memmap)
+                self.assertEqualImages(image_roi, self.get_expected(image=self.image, roi=roi), enforce_is_image=False)
+
+    def test_load_roi_uncompressed_npz(self):
+        filename = os.path.join(self.temp_dir.name, "image.npz")
+        np.savez(filename, self.image)
+        for roi in self.rois:
+            self.assertEqualImages(dito.load(filename=filename, roi=roi), self.get_expected(image=self.image, roi=roi), enforce_is_image=False)
+
+    def test_load_roi_pad_kwargs(self):
+        filename = os.path.join(self.temp_dir.name, "image.png")
+        dito.save(filename=filename, image=self.image)
+        image_roi = dito.load(filename=filename, roi=(-10, -10, 20, 20), roi_pad_kwargs={"mode": "edge"})
+        self.assertEqualImages(image_roi[:10, :10], np.broadcast_to(self.image[0, 0], (10, 10, 3)))
+
+    def test_load_roi_max_size(self):
+        filename = os.path.join(self.temp_dir.name, "image.jpg")
+        dito.save(filename=filename, image=self.image)
+        self.assertEqual(dito.load(filename=filename, roi=(0, 0, 400, 300), max_size=100).shape, (75, 100, 3))
+
+    def test_load_roi_raise_on_invalid_roi(self):
+        filename = os.path.join(self.temp_dir.name, "image.png")
+        dito.save(filename=filename, image=self.image)
+        self.assertRaises(ValueError, lambda: dito.load(filename=filename, roi=(0, 0, -1, 10)))
+        self.assertRaises(ValueError, lambda: dito.load(filename=filename, roi=(0, 0, 10)))
+
+
+class load_multiple_prefetch_iter_Tests(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.images = [dito.random_image(size=(32, 24), color=True) for _ in range(12)]
+        for (n_image, image) in enumerate(self.images):
+            dito.save(filename=os.path.join(self.temp_dir.name, "image_{:02d}.png".format(n_image)), image=image)
+
+    def test_load_multiple_prefetch_iter_ordered(self):
+        images_loaded = list(dito.load_multiple_prefetch_iter(self.temp_dir.name, "*.png", worker_count=3, prefetch_count=2))
+        self.assertEqual(len(images_loaded), len(self.images))
+        for (image, image_loaded) in zip(self.images, images_loaded):
+            self.assertEqualImages(image, image_loaded)
+
+    def test_load_multiple_prefetch_iter_equal_to_serial(self):
+        images_serial = list(dito.load_multiple_iter(self.temp_dir.name, "*.png", color=False))
+        images_prefetch = list(dito.load_multiple_prefetch_iter(self.temp_dir.name, "*.png", color=False))
+        self.assertEqual(len(images_serial), len(images_prefetch))
+        for (image_serial, image_prefetch) in zip(images_serial, images_prefetch):
+            self.assertEqualImages(image_serial, image_prefetch)
+
+    def test_load_multiple_prefetch_iter_unordered(self):
+        results = list(dito.load_multiple_prefetch_iter(self.temp_dir.name, "*.png", ordered=False, return_filenames=True))
+        self.assertEqual(len(results), len(self.images))
+        for (filename, image_loaded) in results:
+            n_image = int(os.path.splitext(os.path.basename(filename))[0].split("_")[1])
+            self.assertEqualImages(self.images[n_image], image_loaded)
+
+    def test_load_multiple_prefetch_iter_errors(self):
+        # create a file which can not be decoded
+        with open(os.path.join(self.temp_dir.name, "image_05_broken.png"), "wb") as f:
+            f.write(b"not an image")
+
+        with self.assertRaises(RuntimeError):
+            list(dito.load_multiple_prefetch_iter(self.temp_dir.name, "*.png", errors="raise"))
+
+        results_skip = list(dito.load_multiple_prefetch_iter(self.temp_dir.name, "*.png", errors="skip"))
+        self.assertEqual(len(results_skip), len(self.images))
+
+        results_yield = list(dito.load_multiple_prefetch_iter(self.temp_dir.name, "*.png", errors="yield"))
+        self.assertEqual(len(results_yield), len(self.images) + 1)
+        self.assertIsInstance(results_yield[6], RuntimeError)
+
+    def test_load_multiple_prefetch_iter_transform(self):
+        images_loaded = list(dito.load_multiple_prefetch_iter(self.temp_dir.name, "*.png", transform=lambda image: dito.resize(dito.as_gray(image), 0.5)))
+        self.assertEqual(len(images_loaded), len(self.images))
+        for (image, image_loaded) in zip(self.images, images_loaded):
+            self.assertEqualImages(image_loaded, dito.resize(dito.as_gray(image), 0.5))
+
+    def test_load_multiple_prefetch_iter_filenames(self):
+        filenames = [os.path.join(self.temp_dir.name, "image_{:02d}.png".format(n_image)) for n_image in (3, 1, 2)]
+        images_loaded = list(dito.load_multiple_prefetch_iter(filenames=filenames))
+        for (n_image, image_loaded) in zip((3, 1, 2), images_loaded):
+            self.assertEqualImages(self.images[n_image], image_loaded)
+        self.assertRaises(ValueError, lambda: list(dito.load_multiple_prefetch_iter(self.temp_dir.name, "*.png", filenames=filenames)))
+
+
+class ImageArchive_Tests(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.filename = os.path.join(self.temp_dir.name, "archive.dia")
+        self.images = [
+            dito.random_image(size=(32, 24), color=True),
+            dito.random_image(size=(16, 8), color=False),
+            dito.convert(dito.random_image(size=(20, 10)), np.uint16),
+            np.random.uniform(size=(5, 7, 2)).astype(np.float32),
+            np.zeros(shape=(0, 4), dtype=np.uint8),
+        ]
+
+    def write_archive(self):
+        with dito.ImageArchive(filename=self.filename, mode="w") as archive:
+            for (n_image, image) in enumerate(self.images):
+                self.assertEqual(archive.append(image=image, key="image_{}".format(n_image)), n_image)
+
+    def test_ImageArchive_roundtrip(self):
+        self.write_archive()
+        with dito.ImageArchive(filename=self.filename) as archive:
+            self.assertEqual(len(archive), len(self.images))
+            self.assertEqual(archive.keys(), ["image_{}".format(n_image) for n_image in range(len(self.images))])
+            for (n_image, image) in enumerate(self.images):
+                self.assertEqualImages(archive[n_image], image, enforce_is_image=False)
+                self.assertEqualImages(archive["image_{}".format(n_image)], image, enforce_is_image=False)
+            self.assertEqualImages(archive[-1], self.images[-1], enforce_is_image=False)
+            self.assertEqual(archive.get_info(0)["encoding"], "png")
+            self.assertEqual(archive.get_info(3)["encoding"], "raw")
+            self.assertEqual(archive.get_info(3)["offset"] % dito.ImageArchive.ALIGNMENT, 0)
+            self.assertFalse(archive[3].flags.writeable)
+            self.assertRaises(IndexError, lambda: archive[len(self.images)])
+            self.assertRaises(KeyError, lambda: archive["nonexistent"])
+            self.assertRaises(RuntimeError, lambda: archive.append(image=self.images[0]))
+
+    def test_ImageArchive_append_mode(self):
+        self.write_archive()
+        with dito.ImageArchive(filename=self.filename, mode="a", encoding="jpg") as archive:
+            self.assertEqual(archive.append(image=self.images[0]), len(self.images))
+            self.assertRaises(ValueError, lambda: archive.append(image=self.images[0], key="image_0"))
+            # images can also be read while writing
+            self.assertEqualImages(archive[1], self.images[1])
+        with dito.ImageArchive(filename=self.filename) as archive:
+            self.assertEqual(len(archive), len(self.images) + 1)
+            self.assertEqual(archive.get_info(-1)["encoding"], "jpg")
+            self.assertEqual(archive[-1].shape, self.images[0].shape)
+            self.assertEqualImages(archive[2], self.images[2])
+
+    def test_ImageArchive_recover_without_footer(self):
+        archive = dito.ImageArchive(filename=self.filename, mode="w")
+        for image in self.images[:3]:
+            archive.append(image=image)
+        archive.file.flush()
+
+        # simulate a crash (no footer) and an incomplete trailing record
+        with open(self.filename, "ab") as f:
+            f.write(b"DREC\x10")
+        with dito.ImageArchive(filename=self.filename) as archive_recovered:
+            self.assertEqual(len(archive_recovered), 3)
+            self.assertEqualImages(archive_recovered[2], self.images[2])
+        archive.file.close()
+
+    def test_ImageArchive_raise_on_invalid_file(self):
+        filename = os.path.join(self.temp_dir.name, "invalid.dia")
+        with open(filename, "wb") as f:
+            f.write(b"not an archive")
+        self.assertRaises(ValueError, lambda: dito.ImageArchive(filename=filename))
+        self.assertRaises(FileNotFoundError, lambda: dito.ImageArchive(filename=os.path.join(self.temp_dir.name, "nonexistent.dia")))
+
+    def test_ImageArchive_load_save(self):
+        images = np.stack([dito.random_image(size=(32, 24), color=True) for _ in range(4)], axis=0)
+        dito.save(filename=self.filename, image=images)
+        self.assertEqualImages(dito.load(filename=self.filename), images, enforce_is_image=False)
+        self.assertEqual(dito.load(filename=self.filename, color=False).shape, (4, 24, 32))
+
+
+class BatchSaver_Tests(TempDirTestCase):
+    def test_BatchSaver_save(self):
+        images = [dito.random_image(size=(32, 24), color=(n_image % 2 == 0)) for n_image in range(10)]
+        filenames = [os.path.join(self.temp_dir.name, "dir_{}".format(n_image % 3), "image_{:02d}.png".format(n_image)) for n_image in range(len(images))]
+        with dito.BatchSaver(worker_count=3, max_pending_count=2) as saver:
+            for (filename, image) in zip(filenames, images):
+                saver.save(filename=filename, image=image)
+            saver.flush()
+            stats = saver.get_stats()
+        self.assertEqual(stats.file_count, len(images))
+        self.assertEqual(stats.byte_count, sum(os.path.getsize(filename) for filename in filenames))
+        self.assertEqual(stats.pending_count, 0)
+        self.assertEqual(len(saver.created_dirnames), 3)
+        for (filename, image) in zip(filenames, images):
+            self.assertEqualImages(dito.load(filename=filename), image)
+
+        # no temporary files must be left
+        for n_dir in range(3):
+            self.assertEqual(len(os.listdir(os.path.join(self.temp_dir.name, "dir_{}".format(n_dir)))), len(range(n_dir, len(images), 3)))
+
+    def test_BatchSaver_imwrite_params(self):
+        image = dito.pm5544()
+        filename_fast = os.path.join(self.temp_dir.name, "fast.png")
+        filename_small = os.path.join(self.temp_dir.name, "small.png")
+        with dito.BatchSaver(imwrite_params={"PNG": (cv2.IMWRITE_PNG_COMPRESSION, 0)}) as saver:
+            saver.save(filename=filename_fast, image=image)
+            saver.save(filename=filename_small, image=image, imwrite_params=(cv2.IMWRITE_PNG_COMPRESSION, 9))
+        self.assertGreater(os.path.getsize(filename_fast), os.path.getsize(filename_small))
+
+    def test_BatchSaver_raise_on_error(self):
+        saver = dito.BatchSaver(mkdir=False)
+        saver.save(filename=os.path.join(self.temp_dir.name, "nonexistent_dir", "image.npy"), image=dito.pm5544())
+        self.assertRaises(FileNotFoundError, saver.close)
+        self.assertRaises(RuntimeError, lambda: saver.save(filename=os.path.join(self.temp_dir.name, "image.png"), image=None))
+
+    def test_save_many(self):
+        images = [dito.random_image(size=(32, 24)) for _ in range(5)]
+        filenames = [os.path.join(self.temp_dir.name, "image_{}.npy".format(n_image)) for n_image in range(len(images))]
+        stats = dito.save_many(filenames=filenames, images=images, atomic=False)
+        self.assertEqual(stats.file_count, len(images))
+        for (filename, image) in zip(filenames, images):
+            self.assertEqualImages(dito.load(filename=filename), image)
+
+
+class asyncio_io_Tests(TempDirTestCase):
+    def test_aload_asave(self):
+        image = dito.random_image(size=(32, 24), color=True)
+        filename = os.path.join(self.temp_dir.name, "image.png")
+
+        async def run():
+            await dito.asave(filename=filename, image=image)
+            return await dito.aload(filename=filename, color=False)
+
+        image_loaded = asyncio.run(run())
+        self.assertEqualImages(image_loaded, dito.load(filename=filename, color=False))
+
+    def test_aencode_adecode(self):
+        image = dito.pm5544()
+
+        async def run():
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                b = await dito.aencode(image=image, executor=executor)
+                return await dito.adecode(b=b, executor=executor)
+
+        self.assertEqualImages(asyncio.run(run()), image)
+
+    def test_aload_multiple_iter(self):
+        images = [dito.random_image(size=(32, 24), color=True) for _ in range(7)]
+        for (n_image, image) in enumerate(images):
+            dito.save(filename=os.path.join(self.temp_dir.name, "image_{:02d}.png".format(n_image)), image=image)
+
+        async def run(**kwargs):
+            return [result async for result in dito.aload_multiple_iter(self.temp_dir.name, "*.png", **kwargs)]
+
+        images_loaded = asyncio.run(run(prefetch_count=2))
+        self.assertEqual(len(images_loaded), len(images))
+        for (image, image_loaded) in zip(images, images_loaded):
+            self.assertEqualImages(image, image_loaded)
+
+        results = asyncio.run(run(ordered=False, return_filenames=True))
+        self.assertEqual(sorted(filename for (filename, _) in results), dito.io._get_multiple_filenames(self.temp_dir.name, "*.png"))
+
+    def test_load_multiple_prefetch_iter_raise_on_invalid_args(self):
+        self.assertRaises(ValueError, lambda: list(dito.load_multiple_prefetch_iter(self.temp_dir.name, "*.png", worker_count=0)))
+        self.assertRaises(ValueError, lambda: list(dito.load_multiple_prefetch_iter(self.temp_dir.name, "*.png", prefetch_count=0)))
+        self.assertRaises(ValueError, lambda: list(dito.load_multiple_prefetch_iter(self.temp_dir.name, "*.png", errors="ignore")))
+
+
 class mkdir_Tests(TempDirTestCase):
     def test_mkdir_str(self):
         dirname = os.path.join(str(self.temp_dir.name), "dir_str")
@@ -1171,6 +2038,269 @@ class mkdir_Tests(TempDirTestCase):
         dito.mkdir(dirname=dir_path)
 
 
+def _mp_starmap_add_scaled(image_a, image_b, factor):
+    return image_a + factor * image_b
+
+
+def _mp_starmap_split(image, label):
+    image[0, 0] = 255
+    return (image[:, :, 0].copy(), label, int(image.sum()))
+
+
+def _mp_starmap_fail(image, n):
+    if n == 2:
+        raise ValueError("Task {} failed".format(n))
+    return image
+
+
+class mp_starmap_Tests(TestCase):
+    def get_argss(self):
+        return [(dito.random_image(size=(64, 48)).astype(np.float32), np.ones(shape=(48, 64, 3), dtype=np.float32), n) for n in range(6)]
+
+    def test_mp_starmap(self):
+        argss = self.get_argss()
+        results = dito.mp_starmap(func=_mp_starmap_add_scaled, argss=argss, process_count=2)
+        self.assertEqual(len(results), len(argss))
+        for (result, args) in zip(results, argss):
+            self.assertTrue(np.array_equal(result, _mp_starmap_add_scaled(*args)))
+
+    def test_mp_starmap_shared_memory(self):
+        argss = self.get_argss()
+        results = dito.mp_starmap(func=_mp_starmap_add_scaled, argss=argss, process_count=2)
+        results_shared_memory = dito.mp_starmap(func=_mp_starmap_add_scaled, argss=argss, process_count=2, shared_memory=True)
+        self.assertEqual(len(results_shared_memory), len(results))
+        for (result_shared_memory, result) in zip(results_shared_memory, results):
+            self.assertEqual(result_shared_memory.dtype, result.dtype)
+            self.assertTrue(np.array_equal(result_shared_memory, result))
+
+    def test_mp_starmap_shared_memory_tuple_result(self):
+        image = dito.random_image(size=(32, 16))
+        image_copy = image.copy()
+        (results,) = dito.mp_starmap(func=_mp_starmap_split, argss=[(image, "label")], process_count=1, shared_memory=True)
+        self.assertEqual(len(results), 3)
+        self.assertNumpyShape(results[0], (16, 32))
+        self.assertEqual(results[0][0, 0], 255)
+        self.assertEqual(results[1], "label")
+        self.assertIsInstance(results[2], int)
+
+        # the array of the caller is not modified
+        self.assertTrue(np.array_equal(image, image_copy))
+
+    def test_mp_starmap_shared_memory_non_array_args(self):
+        argss = [(np.zeros(shape=(0, 3), dtype=np.uint8), np.array(1, dtype=object), n) for n in range(3)]
+        results = dito.mp_starmap(func=_mp_starmap_add_scaled, argss=argss, process_count=1, shared_memory=True)
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertNumpyShape(result, (0, 3))
+
+    def test_mp_starmap_shared_memory_pbar(self):
+        class DummyPbar():
+            def __init__(self, total):
+                self.total = total
+                self.count = 0
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc_val, exc_tb):
+                pass
+
+            def update(self):
+                self.count += 1
+
+        argss = self.get_argss()
+        results = dito.mp_starmap(func=_mp_starmap_add_scaled, argss=argss, process_count=2, pbar_func=DummyPbar, shared_memory=True)
+        for (result, args) in zip(results, argss):
+            self.assertTrue(np.array_equal(result, _mp_starmap_add_scaled(*args)))
+
+    def test_mp_starmap_shared_memory_error(self):
+        argss = [(dito.random_image(size=(32, 16)), n) for n in range(4)]
+        self.assertRaises(ValueError, lambda: dito.mp_starmap(func=_mp_starmap_fail, argss=argss, process_count=2, shared_memory=True))
+        if os.path.isdir("/dev/shm"):
+            self.assertEqual([name for name in os.listdir("/dev/shm") if name.startswith("dito_")], [])
+
+    def test_mp_starmap_argss_error_no_leaked_workers(self):
+        def get_argss_iter():
+            yield (dito.random_image(size=(32, 16)), 0)
+            raise RuntimeError("Invalid arguments")
+
+        children_before = set(multiprocessing.active_children())
+        for shared_memory in (False, True):
+            try:
+                dito.mp_starmap(func=_mp_starmap_fail, argss=get_argss_iter(), process_count=2, shared_memory=shared_memory)
+            except RuntimeError:
+                # check while the traceback (and thus any pool created by `mp_starmap`) is still alive
+                children_leaked = set(multiprocessing.active_children()) - children_before
+            else:
+                self.fail("RuntimeError not raised")
+            self.assertEqual(children_leaked, set())
+
+
+class mp_starmap_iter_Tests(TestCase):
+    def get_argss_iter(self, count, pulled=None):
+        for n in range(count):
+            if pulled is not None:
+                pulled.append(n)
+            yield (np.full(shape=(16, 32, 3), fill_value=n, dtype=np.uint8), np.ones(shape=(16, 32, 3), dtype=np.uint8), n)
+
+    def test_mp_starmap_iter_ordered(self):
+        for shared_memory in (False, True):
+            results = list(dito.mp_starmap_iter(func=_mp_starmap_add_scaled, argss=self.get_argss_iter(count=12), process_count=2, shared_memory=shared_memory))
+            self.assertEqual([int(result[0, 0, 0]) for result in results], [2 * n for n in range(12)])
+
+    def test_mp_starmap_iter_unordered(self):
+        for shared_memory in (False, True):
+            results = list(dito.mp_starmap_iter(func=_mp_starmap_add_scaled, argss=self.get_argss_iter(count=12), process_count=2, ordered=False, shared_memory=shared_memory))
+            self.assertEqual(sorted(int(result[0, 0, 0]) for result in results), [2 * n for n in range(12)])
+
+    def test_mp_starmap_iter_max_in_flight_count(self):
+        pulled = []
+        result_iter = dito.mp_starmap_iter(func=_mp_starmap_add_scaled, argss=self.get_argss_iter(count=100, pulled=pulled), process_count=1, max_in_flight_count=3, shared_memory=True)
+        self.assertEqual(pulled, [])
+        next(result_iter)
+        self.assertEqual(len(pulled), 3)
+        next(result_iter)
+        self.assertEqual(len(pulled), 4)
+        result_iter.close()
+        self.assertEqual(len(pulled), 4)
+        if os.path.isdir("/dev/shm"):
+            self.assertEqual([name for name in os.listdir("/dev/shm") if name.startswith("dito_")], [])
+
+    def test_mp_starmap_iter_close_early_stress(self):
+        # closing the generator with tasks in flight must neither deadlock nor leak workers or shared memory blocks
+        def close_early():
+            for n_run in range(100):
+                for shared_memory in (False, True):
+                    result_iter = dito.mp_starmap_iter(func=_mp_starmap_add_scaled, argss=self.get_argss_iter(count=100), process_count=1 + n_run % 2, max_in_flight_count=1 + n_run % 4, shared_memory=shared_memory)
+                    for _ in range(n_run % 3):
+                        next(result_iter)
+                    result_iter.close()
+
+        children_before = set(multiprocessing.active_children())
+        thread = threading.Thread(target=close_early, daemon=True)
+        thread.start()
+        thread.join(timeout=120.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(set(multiprocessing.active_children()) - children_before, set())
+        if os.path.isdir("/dev/shm"):
+            self.assertEqual([name for name in os.listdir("/dev/shm") if name.startswith("dito_")], [])
+
+    def test_mp_starmap_iter_pbar(self):
+        class DummyPbar():
+            instances = []
+
+            def __init__(self, total):
+                self.total = total
+                self.count = 0
+                self.instances.append(self)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, exc_type, exc_val, exc_tb):
+                pass
+
+            def update(self):
+                self.count += 1
+
+        list(dito.mp_starmap_iter(func=pow, argss=((2, n) for n in range(5)), process_count=1, pbar_func=DummyPbar))
+        list(dito.mp_starmap_iter(func=pow, argss=[(2, n) for n in range(3)], process_count=1, pbar_func=DummyPbar))
+        self.assertEqual([(pbar.total, pbar.count) for pbar in DummyPbar.instances], [(None, 5), (3, 3)])
+
+    def test_mp_starmap_iter_error(self):
+        argss = ((dito.random_image(size=(32, 16)), n) for n in range(8))
+        with dito.Pool(process_count=2) as pool:
+            self.assertRaises(ValueError, lambda: list(pool.starmap_iter(func=_mp_starmap_fail, argss=argss, shared_memory=True)))
+            if os.path.isdir("/dev/shm"):
+                self.assertEqual([name for name in os.listdir("/dev/shm") if name.startswith("dito_")], [])
+            self.assertEqual(list(pool.starmap_iter(func=pow, argss=[(2, 2)])), [4])
+
+    def test_mp_starmap_iter_invalid_max_in_flight_count(self):
+        self.assertRaises(ValueError, lambda: list(dito.mp_starmap_iter(func=pow, argss=[(2, 2)], max_in_flight_count=0)))
+
+
+def _mp_starmap_get_cv2_thread_count():
+    return cv2.getNumThreads()
+
+
+def _mp_starmap_nested_sum(n):
+    return sum(dito.mp_starmap(func=pow, argss=[(n, 2), (n, 3)], backend="thread"))
+
+
+class mp_starmap_backend_Tests(TestCase):
+    def setUp(self):
+        self.cv2_thread_count = cv2.getNumThreads()
+        cv2.setNumThreads(4)
+
+    def tearDown(self):
+        cv2.setNumThreads(self.cv2_thread_count)
+
+    def test_mp_starmap_thread(self):
+        argss = [(dito.random_image(size=(64, 48)).astype(np.float32), np.ones(shape=(48, 64, 3), dtype=np.float32), n) for n in range(6)]
+        results_process = dito.mp_starmap(func=_mp_starmap_add_scaled, argss=argss, process_count=2, backend="process")
+        results_thread = dito.mp_starmap(func=_mp_starmap_add_scaled, argss=argss, backend="thread")
+        results_thread_shared_memory = dito.mp_starmap(func=_mp_starmap_add_scaled, argss=argss, process_count=2, backend="thread", shared_memory=True)
+        for (result_process, result_thread, result_thread_shared_memory) in zip(results_process, results_thread, results_thread_shared_memory):
+            self.assertTrue(np.array_equal(result_thread, result_process))
+            self.assertTrue(np.array_equal(result_thread_shared_memory, result_process))
+
+    def test_mp_starmap_iter_thread(self):
+        results = list(dito.mp_starmap_iter(func=pow, argss=((2, n) for n in range(10)), backend="thread"))
+        self.assertEqual(results, [2 ** n for n in range(10)])
+        results = list(dito.mp_starmap_iter(func=pow, argss=((2, n) for n in range(10)), process_count=3, ordered=False, backend="thread"))
+        self.assertEqual(sorted(results), [2 ** n for n in range(10)])
+
+    def test_mp_starmap_thread_nested(self):
+        # more outer tasks than workers of the global pool - nested calls must not wait for the occupied global pool
+        outer_count = 2 * (os.cpu_count() or 1) + 1
+        results = []
+        thread = threading.Thread(target=lambda: results.extend(dito.mp_starmap(func=_mp_starmap_nested_sum, argss=[(n,) for n in range(outer_count)], backend="thread")), daemon=True)
+        thread.start()
+        thread.join(timeout=60.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(results, [n ** 2 + n ** 3 for n in range(outer_count)])
+        results_iter = list(dito.mp_starmap_iter(func=_mp_starmap_nested_sum, argss=[(n,) for n in range(outer_count)], backend="thread"))
+        self.assertEqual(results_iter, results)
+
+    def test_mp_starmap_thread_uses_caller_arrays(self):
+        image = np.zeros(shape=(8, 8, 3), dtype=np.uint8)
+        dito.mp_starmap(func=_mp_starmap_split, argss=[(image, "label")], backend="thread")
+        self.assertEqual(image[0, 0, 0], 255)
+
+    def test_mp_starmap_cv2_thread_count(self):
+        # thread backend: limited while the pool is used and restored afterwards
+        self.assertEqual(dito.mp_starmap(func=_mp_starmap_get_cv2_thread_count, argss=[()], backend="thread"), [1])
+        self.assertEqual(dito.mp_starmap(func=_mp_starmap_get_cv2_thread_count, argss=[()], process_count=1, backend="thread"), [max(1, os.cpu_count() // 1)])
+        self.assertEqual(cv2.getNumThreads(), 4)
+
+        # process backend: limited within each worker process
+        self.assertEqual(dito.mp_starmap(func=_mp_starmap_get_cv2_thread_count, argss=[()], process_count=2), [max(1, os.cpu_count() // 2)])
+        self.assertEqual(cv2.getNumThreads(), 4)
+
+    def test_mp_starmap_invalid_backend(self):
+        self.assertRaises(ValueError, lambda: dito.mp_starmap(func=pow, argss=[(2, 2)], backend="fiber"))
+        self.assertRaises(ValueError, lambda: list(dito.mp_starmap_iter(func=pow, argss=[(2, 2)], backend="fiber")))
+
+    def test_Pool_thread(self):
+        with dito.Pool(process_count=2, backend="thread", cv2_thread_count=2) as pool:
+            self.assertEqual(cv2.getNumThreads(), 2)
+            self.assertEqual(pool.map(func=_Pool_square, iterable=range(4)), [0, 1, 4, 9])
+            self.assertEqual(pool.starmap(func=_Pool_get_pid, argss=[()]), [os.getpid()])
+            self.assertEqual(dito.mp_starmap(func=pow, argss=[(2, 3)], pool=pool, shared_memory=True), [8])
+            self.assertEqual(pool.submit(pow, 2, 4).result(), 16)
+        self.assertEqual(cv2.getNumThreads(), 4)
+        pool.close()
+        self.assertEqual(cv2.getNumThreads(), 4)
+
+    def test_Pool_process_cv2_thread_count(self):
+        with dito.Pool(process_count=1, cv2_thread_count=3) as pool:
+            self.assertEqual(pool.starmap(func=_mp_starmap_get_cv2_thread_count, argss=[()]), [3])
+
+    def test_Pool_invalid_backend(self):
+        self.assertRaises(ValueError, lambda: dito.Pool(backend="fiber"))
+        self.assertRaises(ValueError, lambda: dito.Pool(backend="thread", maxtasksperchild=1))
+
+
 class MultiShow_Tests(TempDirTestCase):
     def get_random_image(self):
         return dito.random_image(size=(256, 128))
@@ -1333,6 +2463,21 @@ class normalize_Tests(TestCase):
             mode="minmax",
         )
     
+    def test_normalize_minmax_int16_wide_range(self):
+        # the interval width does not fit into the dtype
+        self.run_in_out_test(
+            image_in=np.array([[-30000, 0, 15000, 30000]], dtype=np.int16),
+            image_out=np.array([[-32768, 0, 16383, 32767]], dtype=np.int16),
+            mode="minmax",
+        )
+    
+    def test_normalize_minmax_int32_wide_range(self):
+        self.run_in_out_test(
+            image_in=np.array([[-2000000000, 0, 1000000000, 2000000000]], dtype=np.int32),
+            image_out=np.array([[-2147483648, 0, 1073741823, 2147483647]], dtype=np.int32),
+            mode="minmax",
+        )
+    
     def test_normalize_minmax_float32(self):
         self.run_in_out_test(
             image_in=np.array([[-1.0, 0.0, 1.0]], dtype=np.float32),
@@ -1363,6 +2508,88 @@ class normalize_Tests(TestCase):
             p=10.0,
         )
     
+    def test_normalize_percentile_float32_approximate(self):
+        image = np.random.default_rng(seed=123).normal(size=(48, 64)).astype(np.float32)
+        image_normalized = dito.normalize(image=image, mode="percentile", q=2.0, approximate=True)
+        self.assertEqual(image_normalized.dtype, np.float32)
+        self.assertTrue(np.allclose(image_normalized, dito.normalize(image=image, mode="percentile", q=2.0), atol=1e-3))
+    
+    def test_normalize_batch(self):
+        images = np.random.default_rng(seed=123).integers(0, 200, size=(4, 24, 32, 3)).astype(np.uint8)
+        images[1] //= 4
+        for images_typed in (images, images.astype(np.int16) - 100, dito.convert(images, np.float32)):
+            for (mode, kwargs) in (("minmax", {}), ("percentile", {"q": 5.0}), ("interval", {"lower": 10, "upper": 100})):
+                images_normalized = dito.normalize(image=images_typed, mode=mode, batch=True, **kwargs)
+                self.assertEqual(images_normalized.dtype, images_typed.dtype)
+                for (image, image_normalized) in zip(images_typed, images_normalized):
+                    self.assertTrue(np.allclose(image_normalized, dito.normalize(image=image, mode=mode, **kwargs), rtol=0.0, atol=1e-6))
+    
+    def test_normalize_batch_integer_dtypes(self):
+        rng = np.random.default_rng(seed=123)
+        for dtype in (np.uint8, np.int8, np.uint16, np.int16, np.uint32, np.int32):
+            dtype_range = dito.dtype_range(dtype)
+            images = rng.integers(dtype_range[0], dtype_range[1], size=(3, 12, 16), endpoint=True).astype(dtype)
+            images[1] //= 4
+            images[2, 0, :2] = dtype_range
+            for (mode, kwargs) in (("none", {}), ("interval", {"lower": dtype_range[0] // 2, "upper": dtype_range[1] // 2}), ("minmax", {}), ("zminmax", {}), ("percentile", {"q": 5.0})):
+                images_normalized = dito.normalize(image=images, mode=mode, batch=True, **kwargs)
+                self.assertEqual(images_normalized.dtype, images.dtype)
+                for (image, image_normalized) in zip(images, images_normalized):
+                    self.assertEqualImages(image_normalized, dito.normalize(image=image, mode=mode, **kwargs))
+
+    def test_normalize_batch_interval_per_image(self):
+        images = np.stack([np.array([[0.0, 0.25, 0.5]], dtype=np.float32)] * 2)
+        images_normalized = dito.normalize(image=images, mode="interval", batch=True, lower=[0.0, 0.25], upper=[0.5, 0.5])
+        self.assertTrue(np.allclose(images_normalized, np.array([[[0.0, 0.5, 1.0]], [[0.0, 0.0, 1.0]]], dtype=np.float32)))
+    
+    def test_normalize_batch_out(self):
+        images = np.stack([dito.pm5544()[::8, ::8, :] // 2] * 2)
+        out = np.zeros_like(images)
+        self.assertIs(dito.normalize(image=images, batch=True, out=out), out)
+        self.assertEqualImages(out[0], dito.normalize(image=images[0]))
+    
+    def test_normalize_batch_raise_on_single_image(self):
+        self.assertRaises(ValueError, lambda: dito.normalize(image=dito.pm5544()[:, :, 0], batch=True))
+    
+    def test_normalize_minmax_int8_full_range(self):
+        self.run_in_out_test(
+            image_in=np.array([[-128, 0, 127]], dtype=np.int8),
+            image_out=np.array([[-128, 0, 127]], dtype=np.int8),
+            mode="minmax",
+        )
+
+    def test_normalize_out(self):
+        for image in (dito.pm5544(), dito.convert(image=dito.pm5544(), dtype=np.float32) * 0.5):
+            for (mode, kwargs) in (("none", {}), ("minmax", {}), ("zminmax", {}), ("percentile", {"q": 5.0}), ("interval", {"lower": 0.1, "upper": 0.3})):
+                out = np.zeros_like(image)
+                image_normalized = dito.normalize(image=image, mode=mode, out=out, **kwargs)
+                self.assertIs(image_normalized, out)
+                self.assertEqualImages(out, dito.normalize(image=image, mode=mode, **kwargs))
+
+    def test_normalize_uint16_lut(self):
+        image = np.random.default_rng(seed=0).integers(1000, 50000, size=(256, 512), dtype=np.uint16)
+        image_normalized = dito.normalize(image=image, mode="minmax")
+        image_float = (image.astype(np.float64) - np.min(image)) / (float(np.max(image)) - float(np.min(image))) * 65535.0
+        self.assertEqualImages(image_normalized, image_float.astype(np.uint16))
+        self.assertEqual(np.min(image_normalized), 0)
+        self.assertEqual(np.max(image_normalized), 65535)
+
+    def test_normalize_inplace(self):
+        image = np.array([[-1.0, 0.0, 1.0]], dtype=np.float32)
+        image_normalized = dito.normalize(image=image, mode="minmax", inplace=True)
+        self.assertIs(image_normalized, image)
+        self.assertEqualImages(image, np.array([[0.0, 0.5, 1.0]], dtype=np.float32))
+
+        image = np.array([[0, 1, 2]], dtype=np.uint8)
+        self.assertIs(dito.normalize(image=image, mode="minmax", inplace=True), image)
+        self.assertEqualImages(image, np.array([[0, 127, 255]], dtype=np.uint8))
+
+    def test_normalize_input_unchanged(self):
+        image = np.array([[-1.0, 0.0, 1.0]], dtype=np.float32)
+        image_copy = image.copy()
+        dito.normalize(image=image, mode="minmax")
+        self.assertEqualImages(image, image_copy)
+
     def test_normalize_raise_invalid_mode(self):
         image = np.array([[0, 1, 2]], dtype=np.uint8)
         self.assertRaises(ValueError, lambda: dito.normalize(image=image, mode="__NON-EXISTING-MODE__"))
@@ -1663,6 +2890,78 @@ class otsu_theta_Tests(TestCase):
         self.assertAlmostEqual(theta, 89.0)
 
 
+class percentile_Tests(TestCase):
+    def setUp(self):
+        self.qs = [0.0, 0.1, 2.0, 25.0, 33.3, 50.0, 75.0, 98.0, 99.99, 100.0]
+
+    def run_exact_test(self, dtype, low, high, size):
+        image = np.random.default_rng(seed=123).integers(low, high, size=size, dtype=dtype)
+        # compare against the float64 version, because `np.percentile` overflows when interpolating 8-bit integers
+        self.assertTrue(np.array_equal(dito.percentile(image, self.qs), np.percentile(image.astype(np.float64), self.qs)))
+
+    def test_percentile_exact_uint8(self):
+        for size in (1, 2, 7, (48, 64, 3)):
+            self.run_exact_test(dtype=np.uint8, low=0, high=256, size=size)
+
+    def test_percentile_exact_int8(self):
+        for size in (1, 2, 7, (48, 64, 3)):
+            self.run_exact_test(dtype=np.int8, low=-128, high=128, size=size)
+
+    def test_percentile_exact_uint16(self):
+        for size in (1, 2, 7, (48, 64)):
+            self.run_exact_test(dtype=np.uint16, low=0, high=2**16, size=size)
+        self.run_exact_test(dtype=np.uint16, low=1000, high=1010, size=(48, 64))
+
+    def test_percentile_exact_int16(self):
+        for size in (1, 2, 7, (48, 64)):
+            self.run_exact_test(dtype=np.int16, low=-2**15, high=2**15, size=size)
+
+    def test_percentile_exact_bool(self):
+        image = np.array([[True, False, False, True, True]], dtype=bool)
+        self.assertTrue(np.array_equal(dito.percentile(image, self.qs), np.percentile(image.astype(np.float64), self.qs)))
+
+    def test_percentile_exact_non_contiguous(self):
+        image = dito.pm5544()[::3, ::5, :]
+        self.assertTrue(np.array_equal(dito.percentile(image, self.qs), np.percentile(image.astype(np.float64), self.qs)))
+
+    def test_percentile_float(self):
+        image = np.random.default_rng(seed=123).normal(size=(48, 64)).astype(np.float32)
+        self.assertTrue(np.array_equal(dito.percentile(image, self.qs), np.percentile(image, self.qs)))
+
+    def test_percentile_scalar(self):
+        image = np.array([[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]], dtype=np.uint8)
+        result = dito.percentile(image, 95.0)
+        self.assertEqual(np.ndim(result), 0)
+        self.assertEqual(result, 9.5)
+        self.assertEqual(dito.percentile(image, [95.0]).shape, (1,))
+
+    def test_percentile_approximate(self):
+        image = np.random.default_rng(seed=123).normal(size=(480, 640)).astype(np.float32)
+        bin_width = (np.max(image) - np.min(image)) / 4096
+        result = dito.percentile(image, self.qs, approximate=True, bin_count=4096)
+        self.assertEqual(result.dtype, np.float32)
+        self.assertTrue(np.all(np.abs(result - np.percentile(image, self.qs)) <= bin_width))
+
+    def test_percentile_approximate_constant(self):
+        image = np.full(shape=(8, 8), fill_value=0.25, dtype=np.float32)
+        self.assertTrue(np.array_equal(dito.percentile(image, self.qs, approximate=True), np.full(shape=(len(self.qs),), fill_value=0.25)))
+
+    def test_percentile_approximate_nan(self):
+        image = np.array([[0.0, np.nan, 1.0]], dtype=np.float32)
+        self.assertTrue(np.isnan(dito.percentile(image, 50.0, approximate=True)))
+
+    def test_percentile_max_sample_count(self):
+        image = np.random.default_rng(seed=123).integers(0, 256, size=(480, 640), dtype=np.uint8)
+        result = dito.percentile(image, [2.0, 50.0, 98.0], max_sample_count=10000)
+        self.assertTrue(np.all(np.abs(result - np.percentile(image, [2.0, 50.0, 98.0])) <= 5.0))
+        self.assertTrue(np.array_equal(dito.percentile(image, [2.0, 50.0, 98.0], max_sample_count=image.size), np.percentile(image, [2.0, 50.0, 98.0])))
+
+    def test_percentile_raise_on_invalid_q(self):
+        image = dito.pm5544()
+        self.assertRaises(ValueError, lambda: dito.percentile(image, -1.0))
+        self.assertRaises(ValueError, lambda: dito.percentile(image, [50.0, 100.5]))
+
+
 class pinfo_Tests(TempDirTestCase):
     def test_pinfo_file(self):
         image = dito.pm5544()
@@ -1675,6 +2974,138 @@ class pinfo_Tests(TempDirTestCase):
             lines = f.readlines()
         self.assertEqual(len(lines), 5)
 
+    def test_pinfo_minimal_filename(self):
+        filename = os.path.join(self.temp_dir.name, "image.png")
+        dito.save(filename=filename, image=dito.pm5544())
+        info_filename = os.path.join(self.temp_dir.name, "pinfo.txt")
+        with open(info_filename, "w") as f:
+            dito.pinfo(pathlib.Path(filename), minimal_=True, file_=f)
+        with open(info_filename, "r") as f:
+            lines = f.readlines()
+        self.assertEqual(len(lines), 5)
+        self.assertIn("(576, 768, 3)", lines[3])
+        self.assertIn("uint8", lines[3])
+
+
+def _Pool_square(x):
+    return x * x
+
+
+def _Pool_get_pid():
+    return os.getpid()
+
+
+class Pool_Tests(TestCase):
+    def test_Pool_map(self):
+        with dito.Pool(process_count=2) as pool:
+            self.assertEqual(pool.map(func=_Pool_square, iterable=range(8)), [x * x for x in range(8)])
+            self.assertEqual(sorted(pool.imap_unordered(func=_Pool_square, iterable=range(8))), [x * x for x in range(8)])
+
+    def test_Pool_starmap(self):
+        argss = [(dito.random_image(size=(32, 16)), np.zeros(shape=(16, 32, 3), dtype=np.uint8), n) for n in range(4)]
+        with dito.Pool(process_count=2) as pool:
+            self.assertEqual(pool.process_count, 2)
+            results = pool.starmap(func=_mp_starmap_add_scaled, argss=argss)
+            results_shared_memory = pool.starmap(func=_mp_starmap_add_scaled, argss=argss, shared_memory=True)
+            results_mp_starmap = dito.mp_starmap(func=_mp_starmap_add_scaled, argss=argss, pool=pool)
+        for (result, result_shared_memory, result_mp_starmap, args) in zip(results, results_shared_memory, results_mp_starmap, argss):
+            self.assertTrue(np.array_equal(result, args[0]))
+            self.assertTrue(np.array_equal(result_shared_memory, args[0]))
+            self.assertTrue(np.array_equal(result_mp_starmap, args[0]))
+
+    def test_Pool_submit(self):
+        with dito.Pool(process_count=1) as pool:
+            future = pool.submit(pow, 2, 10)
+            self.assertIsInstance(future, concurrent.futures.Future)
+            self.assertEqual(future.result(), 1024)
+            future = pool.submit(divmod, 1, 0)
+            self.assertIsInstance(future.exception(), ZeroDivisionError)
+
+    def test_Pool_reuse_processes(self):
+        with dito.Pool(process_count=1) as pool:
+            pids = set(pool.starmap(func=_Pool_get_pid, argss=[()] * 4))
+            pids.update(pool.starmap(func=_Pool_get_pid, argss=[()] * 4))
+        self.assertEqual(len(pids), 1)
+        self.assertNotIn(os.getpid(), pids)
+
+    def test_Pool_shared_memory_error(self):
+        argss = [(dito.random_image(size=(32, 16)), n) for n in range(6)]
+        with dito.Pool(process_count=2) as pool:
+            self.assertRaises(ValueError, lambda: pool.starmap(func=_mp_starmap_fail, argss=argss, shared_memory=True))
+            if os.path.isdir("/dev/shm"):
+                self.assertEqual([name for name in os.listdir("/dev/shm") if name.startswith("dito_")], [])
+
+            # the pool can still be used after a task failed
+            self.assertEqual(pool.map(func=_Pool_square, iterable=[3]), [9])
+
+    def test_mp_starmap_pool_and_process_count(self):
+        with dito.Pool(process_count=1) as pool:
+            self.assertRaises(ValueError, lambda: dito.mp_starmap(func=pow, argss=[(2, 3)], process_count=1, pool=pool))
+
+
+class probe_Tests(TempDirTestCase):
+    def assertProbeEqualsLoad(self, filename, decoded=False):
+        probe_info = dito.probe(filename=filename)
+        image = dito.load(filename=filename)
+        self.assertEqual(probe_info.shape, image.shape)
+        self.assertEqual(probe_info.dtype, image.dtype)
+        self.assertEqual(probe_info.bit_depth, 8 * image.dtype.itemsize)
+        self.assertEqual(probe_info.decoded, decoded)
+        return probe_info
+
+    def test_probe_image_files(self):
+        images = [
+            dito.random_image(size=(32, 24), color=False),
+            dito.random_image(size=(32, 24), color=True),
+            np.random.randint(0, 256, size=(24, 32, 4), dtype=np.uint8),
+            dito.convert(dito.random_image(size=(32, 24), color=False), np.uint16),
+            dito.convert(dito.random_image(size=(32, 24), color=True), np.float32),
+        ]
+        extensions = {
+            ".png": (np.uint8, np.uint16),
+            ".jpg": (np.uint8,),
+            ".tif": (np.uint8, np.uint16, np.float32),
+        }
+        for (n_image, image) in enumerate(images):
+            for (extension, dtypes) in extensions.items():
+                if (image.dtype not in dtypes) or ((extension == ".jpg") and (image.ndim == 3) and (image.shape[2] == 4)):
+                    continue
+                filename = os.path.join(self.temp_dir.name, "image_{}{}".format(n_image, extension))
+                dito.save(filename=filename, image=image)
+                probe_info = self.assertProbeEqualsLoad(filename=filename)
+                self.assertEqual((probe_info.width, probe_info.height), (32, 24))
+
+    def test_probe_bmp(self):
+        filename = os.path.join(self.temp_dir.name, "image.bmp")
+        dito.save(filename=filename, image=dito.random_image(size=(32, 24), color=True))
+        self.assertEqual(self.assertProbeEqualsLoad(filename=filename).channel_count, 3)
+
+        # gray BMP files use a palette -> fallback to decoding
+        dito.save(filename=filename, image=dito.random_image(size=(32, 24), color=False))
+        self.assertProbeEqualsLoad(filename=filename, decoded=True)
+
+    def test_probe_numpy_files(self):
+        image = np.random.uniform(size=(3, 5, 7)).astype(np.float32)
+        for extension in (".npy", ".npz"):
+            filename = os.path.join(self.temp_dir.name, "image{}".format(extension))
+            dito.save(filename=filename, image=image)
+            probe_info = self.assertProbeEqualsLoad(filename=filename)
+            self.assertEqual((probe_info.width, probe_info.height, probe_info.channel_count), (5, 3, 7))
+
+    def test_probe_image_archive(self):
+        filename = os.path.join(self.temp_dir.name, "archive.dia")
+        with dito.ImageArchive(filename=filename, mode="w", encoding="raw") as archive:
+            for _ in range(3):
+                archive.append(image=dito.random_image(size=(32, 24)))
+        self.assertProbeEqualsLoad(filename=filename)
+
+    def test_probe_fallback_on_invalid_header(self):
+        filename = os.path.join(self.temp_dir.name, "image.png")
+        with open(filename, "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+        self.assertRaises(RuntimeError, lambda: dito.probe(filename=filename))
+        self.assertRaises(FileNotFoundError, lambda: dito.probe(filename=os.path.join(self.temp_dir.name, "nonexistent.png")))
+
 
 class random_image_Tests(TestCase):
     def test_random_image_color(self):
@@ -1707,6 +3138,70 @@ class resize_Tests(TestCase):
         image_resized = dito.resize(image_bool, 0.5)
         self.assertEqual(image_resized.shape, (288, 384, 3))
 
+    def test_resize_pyramid(self):
+        image = dito.pm5544()
+        for scale_or_size in (0.9, 0.5, 0.3, 0.1, (100, 50)):
+            image_resized = dito.resize(image, scale_or_size, interpolation_down="pyramid")
+            self.assertEqual(image_resized.shape, dito.resize(image, scale_or_size).shape)
+            self.assertEqual(image_resized.dtype, image.dtype)
+
+    def test_resize_pyramid_no_aliasing(self):
+        image = np.zeros(shape=(1000, 1000), dtype=np.uint8)
+        image[:, ::2] = 255
+        for interpolation_down in ("pyramid", "auto"):
+            image_resized = dito.resize(image, 0.13, interpolation_down=interpolation_down)
+            self.assertTrue(np.all(np.abs(image_resized.astype(np.int32) - 128) <= 1))
+
+    def test_resize_pyramid_returns_copy(self):
+        image = dito.pm5544()
+        image_resized = dito.resize(image, dito.size(image), interpolation_down="pyramid")
+        self.assertIsNot(image_resized, image)
+        self.assertEqualImages(image_resized, image)
+
+    def test_resize_pyramid_one_pixel_target(self):
+        for shape in ((5, 5), (5, 1), (1, 5), (7, 4, 3)):
+            image = np.full(shape=shape, fill_value=200, dtype=np.uint8)
+            for interpolation_down in ("pyramid", "auto"):
+                self.assertEqualImages(dito.resize(image, (1, 1), interpolation_down=interpolation_down), np.full(shape=(1, 1) + shape[2:], fill_value=200, dtype=np.uint8))
+        self.assertEqual(dito.resize(np.zeros(shape=(5, 5), dtype=np.uint8), 0.25, interpolation_down="pyramid").shape, (1, 1))
+
+    def test_resize_auto(self):
+        image = dito.pm5544()
+        self.assertEqualImages(dito.resize(image, 0.75, interpolation_down="auto"), dito.resize(image, 0.75, interpolation_down=cv2.INTER_CUBIC))
+        self.assertEqualImages(dito.resize(image, 0.25, interpolation_down="auto"), dito.resize(image, 0.25, interpolation_down=cv2.INTER_AREA))
+        self.assertEqualImages(dito.resize(image, 0.3, interpolation_down="auto"), dito.resize(image, 0.3, interpolation_down="pyramid"))
+
+    def test_resize_pyramid_bool(self):
+        image = dito.pm5544()[:, :, 0] > 127
+        image_resized = dito.resize(image, 0.3, interpolation_down="pyramid")
+        self.assertEqual(image_resized.dtype, bool)
+        self.assertEqual(image_resized.shape, (173, 230))
+
+    def test_resize_raise_on_invalid_mode(self):
+        self.assertRaises(ValueError, lambda: dito.resize(dito.pm5544(), 0.3, interpolation_down="invalid"))
+
+    def test_resize_batch(self):
+        images = np.stack([dito.pm5544()[:, :, 0], dito.pm5544()[::-1, :, 1], dito.pm5544()[:, ::-1, 2]])
+        for scale_or_size in (0.5, (100, 80)):
+            for thread_count in (None, 2):
+                for interpolation_down in (cv2.INTER_CUBIC, "pyramid"):
+                    images_resized = dito.resize(images, scale_or_size, interpolation_down=interpolation_down, batch=True, thread_count=thread_count)
+                    self.assertEqual(images_resized.shape[0], images.shape[0])
+                    for (image, image_resized) in zip(images, images_resized):
+                        self.assertEqualImages(image_resized, dito.resize(image, scale_or_size, interpolation_down=interpolation_down))
+
+    def test_resize_batch_singleton_channel(self):
+        images = np.stack([dito.pm5544()[:, :, :1]] * 2)
+        self.assertEqual(dito.resize(images, 0.5, batch=True).shape, (2, 288, 384, 1))
+
+    def test_resize_batch_empty(self):
+        images = np.zeros(shape=(0, 40, 30, 3), dtype=np.uint8)
+        self.assertEqual(dito.resize(images, 0.5, batch=True).shape, (0, 20, 15, 3))
+        self.assertEqual(dito.resize(images, (12, 8), batch=True).shape, (0, 8, 12, 3))
+
+    def test_resize_batch_raise_on_single_image(self):
+        self.assertRaises(ValueError, lambda: dito.resize(dito.pm5544()[:, :, 0], 0.5, batch=True))
+
 
 class rotate_Tests(TestCase):
     def setUp(self):
@@ -2179,6 +3674,126 @@ class VideoSaver_Tests(TempDirTestCase):
                     image = dito.random_image(size=tuple(value + 1 for value in image_size))
                     self.assertRaises(ValueError, lambda: saver.append(image=image))
 
+    def test_VideoSaver_asynchronous(self):
+        filename = os.path.join(self.temp_dir.name, "VideoSaver.avi")
+        frame_count = 12
+        images = [dito.random_image(size=(320, 240), color=(n_frame % 2 == 0)) for n_frame in range(frame_count)]
+
+        with dito.VideoSaver(filename=filename, codec="MJPG", fps=12.0, asynchronous=True, max_queue_size=4) as saver:
+            for image in images:
+                saver.append(image=image)
+            saver.flush()
+            self.assertEqual(saver.get_queue_depth(), 0)
+            self.assertEqual(saver.frame_count, frame_count)
+            self.assertLessEqual(saver.max_queue_depth, 4)
+
+            summary_filename = os.path.join(self.temp_dir.name, "VideoSaver_summary.txt")
+            with open(summary_filename, "w") as f:
+                saver.print_summary(file=f)
+
+        self.assertTrue(saver.file_exists())
+        self.assertEqual(saver.dropped_frame_count, 0)
+        with open(summary_filename, "r") as f:
+            lines = f.readlines()
+        self.assertEqual(len(lines), 18)
+
+        # the saved video must be identical to the one written synchronously
+        filename_sync = os.path.join(self.temp_dir.name, "VideoSaver_sync.avi")
+        with dito.VideoSaver(filename=filename_sync, codec="MJPG", fps=12.0) as saver_sync:
+            for image in images:
+                saver_sync.append(image=image)
+        self.assertEqual(saver.get_file_size(), saver_sync.get_file_size())
+
+    def test_VideoSaver_asynchronous_drop_oldest(self):
+        filename = os.path.join(self.temp_dir.name, "VideoSaver.avi")
+        frame_count = 50
+
+        with dito.VideoSaver(filename=filename, asynchronous=True, max_queue_size=1, overflow_policy="drop_oldest") as saver:
+            for n_frame in range(frame_count):
+                saver.append(image=dito.random_image(size=(320, 240)))
+        self.assertEqual(saver.frame_count + saver.dropped_frame_count, frame_count)
+        self.assertGreaterEqual(saver.frame_count, 1)
+
+    def test_VideoSaver_asynchronous_raise_after_save(self):
+        filename = os.path.join(self.temp_dir.name, "VideoSaver.avi")
+        saver = dito.VideoSaver(filename=filename, asynchronous=True)
+        saver.append(image=dito.random_image(size=(32, 24)))
+        saver.save()
+        self.assertEqual(saver.frame_count, 1)
+        self.assertRaises(RuntimeError, lambda: saver.append(image=dito.random_image(size=(32, 24))))
+
+    def test_VideoSaver_raise_on_invalid_overflow_policy(self):
+        filename = os.path.join(self.temp_dir.name, "VideoSaver.avi")
+        self.assertRaises(ValueError, lambda: dito.VideoSaver(filename=filename, asynchronous=True, overflow_policy="drop_newest"))
+
+
+class VideoLoader_Tests(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.filename = os.path.join(self.temp_dir.name, "VideoLoader.avi")
+        self.frame_count = 20
+        with dito.VideoSaver(filename=self.filename, fps=10.0) as saver:
+            for n_frame in range(self.frame_count):
+                saver.append(image=np.full(shape=(48, 64, 3), fill_value=10 * n_frame, dtype=np.uint8))
+
+    def assertFrameValues(self, images, n_frames):
+        # MJPG is lossy, so only compare the mean values with the expected ones
+        self.assertEqual(len(images), len(n_frames))
+        for (image, n_frame) in zip(images, n_frames):
+            self.assertAlmostEqual(np.mean(image), 10 * n_frame, delta=2.0)
+
+    def test_VideoLoader_properties(self):
+        with dito.VideoLoader(filename=self.filename) as loader:
+            self.assertEqual(len(loader), self.frame_count)
+            self.assertEqual(loader.fps, 10.0)
+            self.assertEqual(loader.image_size, (64, 48))
+
+    def test_VideoLoader_iter(self):
+        with dito.VideoLoader(filename=self.filename, prefetch_count=2) as loader:
+            images = list(loader)
+        self.assertFrameValues(images=images, n_frames=range(self.frame_count))
+        for image in images:
+            self.assertEqual(image.shape, (48, 64, 3))
+
+    def test_VideoLoader_iter_frames_step(self):
+        with dito.VideoLoader(filename=self.filename) as loader:
+            images = list(loader.iter_frames(start=3, stop=15, step=4))
+        self.assertFrameValues(images=images, n_frames=range(3, 15, 4))
+
+    def test_VideoLoader_iter_frames_early_stop(self):
+        with dito.VideoLoader(filename=self.filename, prefetch_count=1) as loader:
+            for (n_frame, image) in enumerate(loader):
+                if n_frame == 2:
+                    break
+        self.assertFrameValues(images=[image], n_frames=[2])
+
+    def test_VideoLoader_color_and_resize(self):
+        with dito.VideoLoader(filename=self.filename, color=False, scale_or_size=0.5) as loader:
+            image = next(iter(loader))
+            self.assertEqual(image.shape, (24, 32))
+            self.assertEqual(loader[0].shape, (24, 32))
+
+    def test_VideoLoader_random_access(self):
+        n_frames = [5, 6, 19, 0, 10, 2, 10]
+        with dito.VideoLoader(filename=self.filename, cache_count=4) as loader:
+            images = [loader[n_frame] for n_frame in n_frames]
+            self.assertFrameValues(images=[loader[-1]], n_frames=[self.frame_count - 1])
+            self.assertRaises(IndexError, lambda: loader[self.frame_count])
+        self.assertFrameValues(images=images, n_frames=n_frames)
+        self.assertFalse(images[0].flags.writeable)
+
+    def test_VideoLoader_to_VideoSaver(self):
+        filename_out = os.path.join(self.temp_dir.name, "VideoLoader_out.avi")
+        with dito.VideoLoader(filename=self.filename, color=False) as loader, dito.VideoSaver(filename=filename_out, fps=loader.fps, color=False) as saver:
+            for image in loader.iter_frames(step=2):
+                saver.append(image=image)
+        self.assertEqual(saver.frame_count, self.frame_count // 2)
+        with dito.VideoLoader(filename=filename_out) as loader:
+            self.assertEqual(len(loader), self.frame_count // 2)
+
+    def test_VideoLoader_raise_on_missing_file(self):
+        self.assertRaises(FileNotFoundError, lambda: dito.VideoLoader(filename=os.path.join(self.temp_dir.name, "nonexistent.avi")))
+
 
 ####
 #%%% test cases (old)
@@ -264,6 +264,16 @@ def colorize(image, colormap):
     return cv2.LUT(src=image, lut=colormap)
 
 
+def _gamma(image, exponent):
+    """
+    Internal helper function which implements `gamma` for images which are not of type 'uint8' (without lookup tables).
+    """
+    dtype = image.dtype
+    image_float = dito.convert(image=image, dtype=np.float32)
+    image_float = image_float**exponent
+    return dito.convert(image=image_float, dtype=dtype)
+
+
 def gamma(image, exponent):
     """
     Apply the gamma transform with the given `exponent` on the given `image`.
@@ -279,16 +289,17 @@ def gamma(image, exponent):
     -------
     numpy.ndarray
         The transformed image. Has the same shape and dtype as the input `image`.
+
+    Notes
+    -----
+    For bool, 8-bit and 16-bit integer images, a (cached) lookup table is used (see `dito.core.apply_pointwise`).
     """
     if image.dtype == np.uint8:
         lut = np.round(255.0 * np.linspace(start=0.0, stop=1.0, num=256)**exponent).astype(np.uint8)
         lut.shape = (256, 1, 1)
         result = cv2.LUT(src=image, lut=lut)
     else:
-        dtype = image.dtype
-        image_float = dito.convert(image=image, dtype=np.float32)
-        image_float = image_float**exponent
-        result = dito.convert(image=image_float, dtype=dtype)
+        result = dito.core.apply_pointwise(image, _gamma, float(exponent))
 
     # make sure that the output shape is identical to the input shape
     # (cv2.LUT removes the channel axis if it had size one)
@@ -1743,7 +1754,7 @@ def prepare_for_display(image, scale=None, normalize_mode=None, normalize_kwargs
         # try to find a good scale factor automatically
         (width, height) = get_screenres()
         scale = 0.85 * min(height / image.shape[0], width / image.shape[1])
-    image = dito.core.resize(image=image, scale_or_size=scale)
+    image = dito.core.resize(image=image, scale_or_size=scale, interpolation_down="auto")
 
     # apply colormap
     if colormap is not None: